@@ -53,6 +53,7 @@ setup(
         'python_weather',
         'geopy',
         'influxdb-client',
+        'numpy>=1.21.0,<2.0',
         'grpcio',
         'grpcio-tools',
         'certifi',
@@ -38,6 +38,40 @@ class TracardiConfig:
         self.logging_level = _get_logging_level(env['LOGGING_LEVEL']) if 'LOGGING_LEVEL' in env else logging.WARNING
         self.version = Version(version=VERSION, name=NAME)
         self.tokens_in_redis = (env["TOKENS_IN_REDIS"].lower() == "yes") if "TOKENS_IN_REDIS" in env else False
+        # Queued destination jobs and buffered writes are kept in memory until close_all in
+        # tracardi.service.shutdown is called on application shutdown.
+        self.async_destinations = (env['ASYNC_DESTINATIONS'].lower() == 'yes') \
+            if 'ASYNC_DESTINATIONS' in env else False
+        self.destination_workers = int(env['DESTINATION_WORKERS']) if 'DESTINATION_WORKERS' in env else 4
+        self.destination_queue_size = int(
+            env['DESTINATION_QUEUE_SIZE']) if 'DESTINATION_QUEUE_SIZE' in env else 1000
+        self.destination_queue_overflow = env[
+            'DESTINATION_QUEUE_OVERFLOW'] if 'DESTINATION_QUEUE_OVERFLOW' in env else 'drop'
+        self.destination_concurrency = int(
+            env['DESTINATION_CONCURRENCY']) if 'DESTINATION_CONCURRENCY' in env else 10
+        self.destination_timeout = int(env['DESTINATION_TIMEOUT']) if 'DESTINATION_TIMEOUT' in env else 30
+        self.track_metrics = (env['TRACK_METRICS'].lower() == 'yes') if 'TRACK_METRICS' in env else False
+        self.write_buffer = (env['WRITE_BUFFER'].lower() == 'yes') if 'WRITE_BUFFER' in env else False
+        self.write_buffer_max_batch = int(
+            env['WRITE_BUFFER_MAX_BATCH']) if 'WRITE_BUFFER_MAX_BATCH' in env else 500
+        self.write_buffer_max_latency = int(
+            env['WRITE_BUFFER_MAX_LATENCY']) if 'WRITE_BUFFER_MAX_LATENCY' in env else 50
+        self.write_buffer_max_pending = int(
+            env['WRITE_BUFFER_MAX_PENDING']) if 'WRITE_BUFFER_MAX_PENDING' in env else 10000
+        self.incremental_segmentation = (env['INCREMENTAL_SEGMENTATION'].lower() == 'yes') \
+            if 'INCREMENTAL_SEGMENTATION' in env else False
+        self.workflow_max_branches = int(
+            env['WORKFLOW_MAX_BRANCHES']) if 'WORKFLOW_MAX_BRANCHES' in env else 10
+        self.db_pool_max_size = int(env['DB_POOL_MAX_SIZE']) if 'DB_POOL_MAX_SIZE' in env else 10
+        self.db_pool_idle_ttl = int(env['DB_POOL_IDLE_TTL']) if 'DB_POOL_IDLE_TTL' in env else 300
+        self.db_pool_check_interval = int(
+            env['DB_POOL_CHECK_INTERVAL']) if 'DB_POOL_CHECK_INTERVAL' in env else 30
+        self.http_connection_limit = int(
+            env['HTTP_CONNECTION_LIMIT']) if 'HTTP_CONNECTION_LIMIT' in env else 100
+        self.http_dns_ttl = int(env['HTTP_DNS_TTL']) if 'HTTP_DNS_TTL' in env else 300
+        self.http_keepalive_timeout = int(
+            env['HTTP_KEEPALIVE_TIMEOUT']) if 'HTTP_KEEPALIVE_TIMEOUT' in env else 30
+        self.http_timeout = int(env['HTTP_TIMEOUT']) if 'HTTP_TIMEOUT' in env else 300
 
 
 class MemoryCacheConfig:
@@ -45,6 +79,21 @@ class MemoryCacheConfig:
         self.source_ttl = int(env['SOURCE_TTL']) if 'SOURCE_TTL' in env else 60
         self.tags_ttl = int(env['TAGS_TTL']) if 'TAGS_TTL' in env else 60
         self.event_validator_ttl = int(env['EVENT_VALIDATOR_TTL']) if 'EVENT_VALIDATOR_TTL' in env else 180
+        self.rules_check_interval = int(
+            env['RULES_CHECK_INTERVAL']) if 'RULES_CHECK_INTERVAL' in env else 5
+        self.rules_max_age = int(env['RULES_MAX_AGE']) if 'RULES_MAX_AGE' in env else 60
+        self.segments_check_interval = int(
+            env['SEGMENTS_CHECK_INTERVAL']) if 'SEGMENTS_CHECK_INTERVAL' in env else 5
+        self.segments_max_age = int(env['SEGMENTS_MAX_AGE']) if 'SEGMENTS_MAX_AGE' in env else 60
+        self.flow_cache_size = int(env['FLOW_CACHE_SIZE']) if 'FLOW_CACHE_SIZE' in env else 1000
+        self.flow_ttl = int(env['FLOW_TTL']) if 'FLOW_TTL' in env else 5
+        self.tql_cache_size = int(env['TQL_CACHE_SIZE']) if 'TQL_CACHE_SIZE' in env else 1000
+        self.resource_cache_size = int(env['RESOURCE_CACHE_SIZE']) if 'RESOURCE_CACHE_SIZE' in env else 1000
+        self.resource_ttl = int(env['RESOURCE_TTL']) if 'RESOURCE_TTL' in env else 10
+        self.plugin_pool_size = int(env['PLUGIN_POOL_SIZE']) if 'PLUGIN_POOL_SIZE' in env else 10
+        self.plugin_pool_ttl = int(env['PLUGIN_POOL_TTL']) if 'PLUGIN_POOL_TTL' in env else 300
+        self.plugin_pool_max_lifetime = int(
+            env['PLUGIN_POOL_MAX_LIFETIME']) if 'PLUGIN_POOL_MAX_LIFETIME' in env else 60
 
 
 class ElasticConfig:
@@ -0,0 +1,90 @@
+from copy import deepcopy
+from typing import Set, Any, Dict
+
+from pydantic import BaseModel, PrivateAttr
+
+
+class ChangeTrackingModel(BaseModel):
+
+    """
+    Model that remembers which fields were assigned. Nested ChangeTrackingModels track their own fields so
+    changes can be reported as dotted paths, e.g. `traits.public` or `metadata.time.visit.count`.
+    Containers and other models (e.g. dicts) are copied on reset_changes and compared with the copy, so their
+    in-place mutation is reported as well. Before the first reset_changes only assignments are tracked.
+    """
+
+    _changes: Set[str] = PrivateAttr(default_factory=set)
+    _snapshot: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def copy(self, **kwargs):
+        model = super().copy(**kwargs)
+        if not kwargs.get('deep', False):
+            # Shallow copy would share the private state with this model.
+            object.__setattr__(model, '_changes', set(self._changes))
+            object.__setattr__(model, '_snapshot', dict(self._snapshot))
+        return model
+
+    @staticmethod
+    def _is_mutable(value) -> bool:
+        return isinstance(value, (dict, list, set, BaseModel)) and not isinstance(value, ChangeTrackingModel)
+
+    def _get_mutated(self) -> Set[str]:
+        return {name for name, value in self._snapshot.items()
+                if name not in self._changes and self.__dict__.get(name) != value}
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._changes.add(name)
+
+    def mark_changed(self, field: str):
+        if field not in self.__fields__:
+            raise ValueError(f"Field `{field}` does not exist in {type(self).__name__}.")
+        self._changes.add(field)
+
+    def has_changes(self) -> bool:
+        if self._changes or self._get_mutated():
+            return True
+        for value in self.__dict__.values():
+            if isinstance(value, ChangeTrackingModel) and value.has_changes():
+                return True
+        return False
+
+    def get_changes(self, prefix: str = "") -> Set[str]:
+        changes = {f"{prefix}{name}" for name in self._changes | self._get_mutated()}
+        for name, value in self.__dict__.items():
+            if name not in self._changes and isinstance(value, ChangeTrackingModel):
+                changes |= value.get_changes(prefix=f"{prefix}{name}.")
+        return changes
+
+    def reset_changes(self):
+        self._changes.clear()
+        self._snapshot = {name: deepcopy(value) for name, value in self.__dict__.items() if self._is_mutable(value)}
+        for value in self.__dict__.values():
+            if isinstance(value, ChangeTrackingModel):
+                value.reset_changes()
+
+    def mark_changes_against(self, previous: 'ChangeTrackingModel'):
+        """
+        Marks fields of this model that differ from the previous version of the model.
+        """
+        for name, value in self.__dict__.items():
+            previous_value = previous.__dict__.get(name)
+            if isinstance(value, ChangeTrackingModel) and type(value) is type(previous_value):
+                value.mark_changes_against(previous_value)
+            elif value != previous_value:
+                self._changes.add(name)
+
+    def replace_field(self, name: str, value: Any):
+        """
+        Replaces field value and marks as changed only the paths that differ from the current value.
+        """
+        current = self.__dict__.get(name)
+        if isinstance(value, ChangeTrackingModel) and type(value) is type(current):
+            if value is not current:
+                value.mark_changes_against(current)
+                super().__setattr__(name, value)
+        elif value != current:
+            self.__setattr__(name, value)
+        else:
+            super().__setattr__(name, value)
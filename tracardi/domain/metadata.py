@@ -1,6 +1,7 @@
 from typing import Optional
 
 from pydantic import BaseModel
+from tracardi.domain.change_tracking import ChangeTrackingModel
 from tracardi.domain.time import Time, ProfileTime
 
 
@@ -8,6 +9,6 @@ class Metadata(BaseModel):
     time: Time
 
 
-class ProfileMetadata(BaseModel):
+class ProfileMetadata(ChangeTrackingModel):
     time: ProfileTime
     merged_with: Optional[str] = None
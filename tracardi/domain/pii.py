@@ -1,8 +1,8 @@
 from typing import Optional, Any
-from pydantic import BaseModel
+from tracardi.domain.change_tracking import ChangeTrackingModel
 
 
-class PII(BaseModel):
+class PII(ChangeTrackingModel):
 
     """
     Personally identifiable information, or PII, is any data that could
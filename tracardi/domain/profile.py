@@ -6,6 +6,7 @@ from typing import Optional, List, Union, Callable, Dict
 from pydantic import BaseModel
 from pydantic.utils import deep_update
 from tracardi.service.notation.dot_accessor import DotAccessor
+from .change_tracking import ChangeTrackingModel
 from .entity import Entity
 from .metadata import ProfileMetadata
 from .pii import PII
@@ -16,15 +17,13 @@ from .value_object.storage_info import StorageInfo
 from ..service.dot_notation_converter import DotNotationConverter
 from .profile_stats import ProfileStats
 from ..service.merger import merge
-from .segment import Segment
-from ..process_engine.tql.condition import Condition
 
 
 class ConsentRevoke(BaseModel):
     revoke: Optional[datetime] = None
 
 
-class Profile(Entity):
+class Profile(Entity, ChangeTrackingModel):
     metadata: Optional[ProfileMetadata] = ProfileMetadata(time=ProfileTime())
     operation: Optional[Operation] = Operation()
     stats: ProfileStats = ProfileStats()
@@ -37,16 +36,29 @@ class Profile(Entity):
 
     def replace(self, profile):
         if isinstance(profile, Profile):
-            self.id = profile.id
-            self.metadata = profile.metadata
-            self.operation = profile.operation
-            self.stats = profile.stats
-            self.traits = profile.traits
-            self.pii = profile.pii
-            self.segments = profile.segments
-            self.consents = profile.consents
-            self.active = profile.active
-            self.interests = profile.interests
+            # Only fields that differ are marked as changed
+            self.replace_field('id', profile.id)
+            self.replace_field('metadata', profile.metadata)
+            self.replace_field('operation', profile.operation)
+            self.replace_field('stats', profile.stats)
+            self.replace_field('traits', profile.traits)
+            self.replace_field('pii', profile.pii)
+            self.replace_field('segments', profile.segments)
+            self.replace_field('consents', profile.consents)
+            self.replace_field('active', profile.active)
+            self.replace_field('interests', profile.interests)
+
+    def get_delta(self) -> List[str]:
+        """
+        Returns sorted list of profile paths changed since the last reset_changes, including containers changed
+        in place. If profile update was requested but no change was found all profile fields are returned,
+        as the changed paths are not known.
+        """
+        changes = self.get_changes()
+        delta = sorted(path for path in changes if path != 'operation' and not path.startswith('operation.'))
+        if not delta and 'operation.update' in changes and self.operation.needs_update():
+            delta = sorted(name for name in self.__fields__ if name not in ('id', 'operation'))
+        return delta
 
     def get_merge_key_values(self) -> List[tuple]:
         converter = DotNotationConverter(self)
@@ -71,50 +83,38 @@ class Profile(Entity):
 
         return disabled_profiles
 
-    async def segment(self, event_types, load_segments):
+    async def segment(self, event_types, load_segments, changed_paths: Optional[List[str]] = None):
 
         """
-        This method mutates current profile. Loads segments and adds segments to current profile.
+        This method mutates current profile. Evaluates segments applicable to event types and adds
+        segments to current profile. Every segment is evaluated once, with its condition already compiled.
+        If changed_paths are given only segments that depend on any of the changed profile paths are evaluated.
         """
 
-        # todo cache segments for 30 sec
         flat_profile = DotAccessor(
             profile=self
             # it has access only to profile. Other data is irrelevant 'coz we check only profile.
         )
 
-        for event_type in event_types:  # type: str
-
-            # Segmentation is run for every event
-
-            # todo segments are loaded one by one - maybe it is possible to load it at once
-            # todo segments are loaded event if they are disabled. It is checked later. Maybe we can filter it here.
-            segments = await load_segments(event_type, limit=500)
-
-            for segment in segments:
-
-                segment = Segment(**segment)
-
-                if segment.enabled is False:
-                    continue
+        for event_type, segment in await load_segments(event_types):
 
-                segment_id = segment.get_id()
+            if changed_paths is not None and not segment.depends_on(changed_paths):
+                continue
 
-                try:
-                    condition = Condition()
-                    if await condition.evaluate(segment.condition, flat_profile):
-                        segments = set(self.segments)
-                        segments.add(segment_id)
-                        self.segments = list(segments)
+            try:
+                if segment.evaluate(flat_profile):
+                    segments = set(self.segments)
+                    segments.add(segment.id)
+                    self.segments = list(segments)
 
-                        # Yield only if segmentation triggered
-                        yield event_type, segment_id, None
+                    # Yield only if segmentation triggered
+                    yield event_type, segment.id, None
 
-                except Exception as e:
-                    msg = 'Condition id `{}` could not evaluate `{}`. The following error was raised: `{}`'.format(
-                        segment_id, segment.condition, str(e).replace("\n", " "))
+            except Exception as e:
+                msg = 'Condition id `{}` could not evaluate `{}`. The following error was raised: `{}`'.format(
+                    segment.id, segment.segment.condition, str(e).replace("\n", " "))
 
-                    yield event_type, segment_id, msg
+                yield event_type, segment.id, msg
 
     async def merge(self, load_profiles_to_merge_callable: Callable, limit: int = 2000,
                     override_old_data: bool = True) -> Union['Profiles', None]:
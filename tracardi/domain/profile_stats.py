@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from tracardi.domain.change_tracking import ChangeTrackingModel
 
 
-class ProfileStats(BaseModel):
+class ProfileStats(ChangeTrackingModel):
     visits: int = 0
     views: int = 0
     counters: dict = {}
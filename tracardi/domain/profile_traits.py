@@ -1,5 +1,6 @@
 from typing import Optional
 from pydantic import BaseModel
+from tracardi.domain.change_tracking import ChangeTrackingModel
 from tracardi.domain.pii import PII
 
 
@@ -7,7 +8,7 @@ class Private(BaseModel):
     pii: Optional[PII] = None
 
 
-class ProfileTraits(BaseModel):
+class ProfileTraits(ChangeTrackingModel):
     private: Optional[dict] = {}
     public: Optional[dict] = {}
 
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, Any
 from pydantic import BaseModel
+from tracardi.domain.change_tracking import ChangeTrackingModel
 
 
 class Time(BaseModel):
@@ -12,7 +13,7 @@ class Time(BaseModel):
         super().__init__(**data)
 
 
-class ProfileVisit(BaseModel):
+class ProfileVisit(ChangeTrackingModel):
     last: Optional[datetime] = None
     current: Optional[datetime] = None
     count: int = 0
@@ -28,7 +29,7 @@ class ProfileVisit(BaseModel):
             self.current = datetime.utcnow()
 
 
-class ProfileTime(Time):
+class ProfileTime(Time, ChangeTrackingModel):
     visit: ProfileVisit = ProfileVisit()
 
     def __init__(self, **data: Any):
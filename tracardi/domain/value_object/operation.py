@@ -1,8 +1,9 @@
 from typing import List
-from pydantic import BaseModel
 
+from tracardi.domain.change_tracking import ChangeTrackingModel
 
-class Operation(BaseModel):
+
+class Operation(ChangeTrackingModel):
     new: bool = False
     update: bool = False
     segment: bool = False
@@ -28,14 +28,14 @@ class CalculatorAction(ActionRunner):
 
     def __init__(self, **kwargs):
         self.config = validate(kwargs)
+        self.calc_lines = [line.strip() for line in self.config.calc_dsl.split("\n")]
 
     async def run(self, payload: dict, in_edge=None) -> Result:
-        calc_lines = [line.strip() for line in self.config.calc_dsl.split("\n")]
-
         dot = self._get_dot_accessor(payload)
 
+        # Equations are compiled once and cached, evaluation does only calculations.
         equation = MathEquation(dot)
-        results = equation.evaluate(calc_lines)
+        results = equation.evaluate(self.calc_lines)
 
         if self.event.metadata.profile_less is False:
             profile = Profile(**dot.profile)
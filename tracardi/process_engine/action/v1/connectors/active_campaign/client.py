@@ -1,4 +1,4 @@
-import aiohttp
+from tracardi.service.http_client import http_sessions
 
 
 class ActiveCampaignClientException(Exception):
@@ -15,7 +15,7 @@ class ActiveCampaignClient:
         data = {key: data[key] for key in data if data[key] is not None}
         data["fieldValues"] = [{"field": key, "value": data[key]} for key in data if key.isnumeric()]
 
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Accept": "application/json",
             "Content-Type": "application/json",
             "api-token": self.api_key
@@ -61,7 +61,7 @@ class ActiveCampaignClient:
                 raise ActiveCampaignClientException("One of: id, email parameters has to be provided.")
 
     async def get_custom_fields(self):
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Accept": "application/json",
             "Content-Type": "application/json",
             "api-token": self.api_key
@@ -74,7 +74,7 @@ class ActiveCampaignClient:
                 return [{"name": field["title"], "id": field["id"]} for field in (await response.json())["fields"]]
 
     async def get_contact_by_email(self, email: str):
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Accept": "application/json",
             "Content-Type": "application/json",
             "api-token": self.api_key
@@ -1,6 +1,6 @@
-import aiohttp
 from typing import Optional
 import json
+from tracardi.service.http_client import http_sessions
 
 
 class AirtableClientException(Exception):
@@ -13,7 +13,7 @@ class AirtableClient:
         self._token = token
 
     async def add_record(self, base_id: str, table_name: str, record: dict) -> dict:
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Authorization": f"Bearer {self._token}",
             "Content-Type": "application/json"
         }) as session:
@@ -31,7 +31,7 @@ class AirtableClient:
                 return await response.json()
 
     async def get_records(self, base_id: str, table_name: str, query: Optional[str]) -> dict:
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self._token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self._token}"}) as session:
             async with session.get(
                 url=f"https://api.airtable.com/v0/{base_id}/{table_name}?maxRecords=30"
                     f"{'&filterByFormula=' + query if query else ''}"
@@ -12,6 +12,7 @@ from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form
 from tracardi.service.plugin.domain.result import Result
 from tracardi.service.plugin.runner import ActionRunner
 from .model.configuration import Configuration
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Configuration:
@@ -50,7 +51,7 @@ class AmplitudeSendEvent(ActionRunner):
             dot = self._get_dot_accessor(payload)
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 platform = self._get_value(dot, self.config.platform)
                 properties = self._get_value(dot, self.config.event_properties)
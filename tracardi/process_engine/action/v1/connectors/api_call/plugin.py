@@ -11,6 +11,7 @@ from .model.configuration import RemoteCallConfiguration
 from tracardi.domain.resource import ResourceCredentials
 from tracardi.service.storage.driver import storage
 from tracardi.service.url_constructor import ApiCredentials, make_url
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> RemoteCallConfiguration:
@@ -19,6 +20,8 @@ def validate(config: dict) -> RemoteCallConfiguration:
 
 class RemoteCallAction(ActionRunner):
 
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'RemoteCallAction':
         config = RemoteCallConfiguration(**kwargs)
@@ -53,7 +56,7 @@ class RemoteCallAction(ActionRunner):
             headers['ContentType'] = self.config.body.type
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 params = self.config.get_params(dot)
                 url = make_url(dot=dot, credentials=self.credentials, endpoint=self.config.endpoint)
@@ -1,8 +1,11 @@
 import json
 import ssl
-import aiohttp
 import certifi
 from pydantic import BaseModel, AnyHttpUrl
+from tracardi.service.http_client import http_sessions
+
+
+_ssl_context = ssl.create_default_context(cafile=certifi.where())
 
 
 class CiviCRMClientException(Exception):
@@ -23,8 +26,7 @@ class CiviCRMClient:
         self.site_key = site_key
 
     async def add_contact(self, data):
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
+        async with http_sessions.session(ssl=_ssl_context) as session:
             async with session.post(
                 url=self.api_url,
                 params={
@@ -42,8 +44,7 @@ class CiviCRMClient:
                 return await response.json()
 
     async def get_custom_fields(self):
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
+        async with http_sessions.session(ssl=_ssl_context) as session:
             async with session.get(
                 url=self.api_url,
                 params={
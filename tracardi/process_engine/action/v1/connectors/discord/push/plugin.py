@@ -7,6 +7,7 @@ from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.notation.dot_template import DotTemplate
 
 from .model.configuration import DiscordWebHookConfiguration
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> DiscordWebHookConfiguration:
@@ -15,6 +16,8 @@ def validate(config: dict) -> DiscordWebHookConfiguration:
 
 class DiscordWebHookAction(ActionRunner):
 
+    concurrent = True
+
     def __init__(self, **kwargs):
         self.config = validate(kwargs)
 
@@ -25,7 +28,7 @@ class DiscordWebHookAction(ActionRunner):
         try:
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 params = {
                     "json": {
@@ -0,0 +1,35 @@
+from elasticsearch import AsyncElasticsearch
+
+from tracardi.service.connection_pool import ConnectionPoolFactory
+from .config import ElasticCredentials
+
+
+class ElasticPoolFactory(ConnectionPoolFactory):
+
+    name = "elasticsearch"
+
+    async def create(self, credentials: ElasticCredentials, max_size: int, **options) -> AsyncElasticsearch:
+        if credentials.has_credentials():
+            return AsyncElasticsearch(
+                [credentials.url],
+                http_auth=(credentials.username, credentials.password),
+                scheme=credentials.scheme,
+                port=credentials.port,
+                maxsize=max_size
+            )
+
+        return AsyncElasticsearch(
+            [credentials.url],
+            scheme=credentials.scheme,
+            port=credentials.port,
+            maxsize=max_size
+        )
+
+    async def check(self, pool: AsyncElasticsearch) -> bool:
+        return await pool.ping()
+
+    async def close(self, pool: AsyncElasticsearch):
+        await pool.close()
+
+
+elastic_pool = ElasticPoolFactory()
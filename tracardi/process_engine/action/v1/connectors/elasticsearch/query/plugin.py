@@ -4,8 +4,10 @@ from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Docu
     FormField, FormComponent
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
+from .model.client import elastic_pool
 from .model.config import Config, ElasticCredentials
-from elasticsearch import AsyncElasticsearch, ElasticsearchException
+from elasticsearch import ElasticsearchException
+from tracardi.service.connection_pool import connection_pools
 from tracardi.service.storage.driver import storage
 from tracardi.domain.resource import ResourceCredentials
 
@@ -24,6 +26,9 @@ def validate(config: dict):
 
 class ElasticSearchFetcher(ActionRunner):
 
+    reusable = True
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'ElasticSearchFetcher':
         config = Config(**kwargs)
@@ -32,24 +37,17 @@ class ElasticSearchFetcher(ActionRunner):
 
     def __init__(self, config: Config, credentials: ResourceCredentials):
         self.config = config
-        credentials = credentials.get_credentials(self, ElasticCredentials)
-
-        self._client = AsyncElasticsearch(
-            [credentials.url],
-            http_auth=(credentials.username, credentials.password),
-            scheme=credentials.scheme,
-            port=credentials.port
-        )
+        self.credentials = credentials.get_credentials(self, ElasticCredentials)
 
     async def run(self, payload: dict, in_edge=None) -> Result:
 
         try:
-            res = await self._client.search(
-                index=self.config.index,
-                body=json.loads(self.config.query),
-                size=20
-            )
-            await self._client.close()
+            async with connection_pools.acquire(self.config.source.id, elastic_pool, self.credentials) as client:
+                res = await client.search(
+                    index=self.config.index,
+                    body=json.loads(self.config.query),
+                    size=20
+                )
 
         except ElasticsearchException as e:
             self.console.error(str(e))
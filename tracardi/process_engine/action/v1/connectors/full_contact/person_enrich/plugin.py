@@ -13,6 +13,7 @@ from tracardi.service.plugin.domain.result import Result
 
 from .model.configuration import Configuration
 from .model.full_contact_source_configuration import FullContactSourceConfiguration
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Configuration:
@@ -39,7 +40,7 @@ class FullContactAction(ActionRunner):
         try:
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 mapper = DictTraverser(dot)
                 payload = mapper.reshape(reshape_template=self.config.pii.dict())
@@ -7,6 +7,7 @@ from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form
 from tracardi.service.plugin.domain.result import Result
 from tracardi.service.plugin.runner import ActionRunner
 from .model.configuration import Configuration
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Configuration:
@@ -15,6 +16,8 @@ def validate(config: dict) -> Configuration:
 
 class HtmlPageFetchAction(ActionRunner):
 
+    concurrent = True
+
     def __init__(self, **kwargs):
         self.config = validate(kwargs)
 
@@ -42,7 +45,7 @@ class HtmlPageFetchAction(ActionRunner):
             # headers['ContentType'] =
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 params = self.config.get_params(dot)
 
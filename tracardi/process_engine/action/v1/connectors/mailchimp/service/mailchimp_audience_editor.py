@@ -1,6 +1,7 @@
 import aiohttp
 import json
 from typing import Dict, Any
+from tracardi.service.http_client import http_sessions
 
 
 class MailChimpAudienceEditor:
@@ -9,7 +10,7 @@ class MailChimpAudienceEditor:
         self._key, self._server = api_key.split("-")
 
     async def add_contact(self, list_id: str, email_address: str, subscribed: bool, merge_fields: Dict[str, Any]):
-        async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
+        async with http_sessions.session(headers={"Content-Type": "application/json"}) as session:
             async with session.post(
                     url=f"https://{self._server}.api.mailchimp.com/3.0/lists/{list_id}/members",
                     data=json.dumps({
@@ -22,7 +23,7 @@ class MailChimpAudienceEditor:
                 return await response.json()
 
     async def update_contact(self, list_id: str, email_address: str, subscribed: bool, merge_fields: Dict[str, Any]):
-        async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
+        async with http_sessions.session(headers={"Content-Type": "application/json"}) as session:
             async with session.put(
                     url=f"https://{self._server}.api.mailchimp.com/3.0/lists/{list_id}/members/{email_address}",
                     data=json.dumps({
@@ -35,7 +36,7 @@ class MailChimpAudienceEditor:
                 return await response.json()
 
     async def archive_contact(self, list_id: str, email_address: str):
-        async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
+        async with http_sessions.session(headers={"Content-Type": "application/json"}) as session:
             async with session.delete(
                     url=f"https://{self._server}.api.mailchimp.com/3.0/lists/{list_id}/members/{email_address}",
                     auth=aiohttp.BasicAuth("user", self._key)
@@ -43,7 +44,7 @@ class MailChimpAudienceEditor:
                 return await response.json()
 
     async def delete_contact(self, list_id: str, email_address: str):
-        async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
+        async with http_sessions.session(headers={"Content-Type": "application/json"}) as session:
             async with session.post(
                     url=f"https://{self._server}.api.mailchimp.com/3.0/lists/{list_id}/members/{email_address}/"
                         f"actions/delete-permanent",
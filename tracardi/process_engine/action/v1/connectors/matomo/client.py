@@ -1,5 +1,5 @@
-import aiohttp
 from .send_event.model.config import MatomoPayload
+from tracardi.service.http_client import http_sessions
 
 
 class MatomoClientException(Exception):
@@ -13,7 +13,7 @@ class MatomoClient:
         self.api_url = api_url
 
     async def send_event(self, matomo_payload: MatomoPayload):
-        async with aiohttp.ClientSession(headers={"X-FORWARDED-FOR": matomo_payload.cip}) as session:
+        async with http_sessions.session(headers={"X-FORWARDED-FOR": matomo_payload.cip}) as session:
             async with session.post(
                 url=f"{self.api_url}/matomo.php",
                 params={"token_auth": self.token, **matomo_payload.to_dict()}
@@ -1,4 +1,4 @@
-import aiohttp
+from tracardi.service.http_client import http_sessions
 
 
 class MauticClientException(Exception):
@@ -18,7 +18,7 @@ class MauticClient:
         self.token = token
 
     async def update_token(self) -> None:
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                     url=f"{self.api_url}/oauth/v2/token",
                     data={
@@ -44,7 +44,7 @@ class MauticClient:
         if overwrite_with_blank is True:
             data["overwriteWithBlank"] = True
 
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.post(
                     url=f"{self.api_url}/api/contacts/new",
                     data=data
@@ -60,7 +60,7 @@ class MauticClient:
                 return await response.json()
 
     async def fetch_contact_by_id(self, id: str):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.get(url=f"{self.api_url}/api/contacts/{id}") as response:
 
                 if response.status == 401:
@@ -73,7 +73,7 @@ class MauticClient:
                 return await response.json()
 
     async def fetch_contact_by_email(self, email: str):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.get(url=f"{self.api_url}/api/contacts?search=email:{email}") as response:
 
                 if response.status == 401:
@@ -91,7 +91,7 @@ class MauticClient:
                     raise MauticClientException(f"Unable to find contact with given email address: {email}")
 
     async def add_points(self, id: int, amount: int):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.post(url=f"{self.api_url}/api/contacts/{id}/points/plus/{amount}") as response:
 
                 if response.status == 401:
@@ -103,7 +103,7 @@ class MauticClient:
                 return await response.json()
 
     async def subtract_points(self, id: int, amount: int):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.post(url=f"{self.api_url}/api/contacts/{id}/points/minus/{amount}") as response:
 
                 if response.status == 401:
@@ -115,7 +115,7 @@ class MauticClient:
                 return await response.json()
 
     async def add_to_segment(self, id: int, add_to: int):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.post(url=f"{self.api_url}/api/segments/{add_to}/contact/{id}/add") \
                     as response:
 
@@ -126,7 +126,7 @@ class MauticClient:
                     raise MauticClientException(await response.text())
 
     async def remove_from_segment(self, id: int, remove_from: int):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             async with session.post(url=f"{self.api_url}/api/segments/{remove_from}/contact/{id}/remove") \
                     as response:
 
@@ -14,6 +14,9 @@ def validate(config: dict) -> PluginConfiguration:
 
 class GeoIPAction(ActionRunner):
 
+    reusable = True
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'GeoIPAction':
         config = validate(kwargs)
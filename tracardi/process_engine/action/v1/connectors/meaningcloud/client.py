@@ -1,7 +1,7 @@
-import aiohttp
 from aiohttp import ClientTimeout
 
 from tracardi.exceptions.exception import TracardiException
+from tracardi.service.http_client import http_sessions
 
 
 class MeaningCloudClient:
@@ -11,7 +11,7 @@ class MeaningCloudClient:
         self._timeout = 20000
 
     async def deep_categorization(self, txt: str, model: str):
-        async with aiohttp.ClientSession(timeout=ClientTimeout(total=30)) as session:
+        async with http_sessions.session(timeout=ClientTimeout(total=30)) as session:
             async with session.post(
                 url="https://api.meaningcloud.com/deepcategorization-1.0",
                 data={
@@ -27,7 +27,7 @@ class MeaningCloudClient:
                 return await response.json()
 
     async def topics_extraction(self, txt: str, lang: str):
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                 url="https://api.meaningcloud.com/topics-2.0",
                 data={
@@ -57,7 +57,7 @@ class MeaningCloudClient:
         if company_type is not None:
             data["filter"] = company_type
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                 url="https://api.meaningcloud.com/reputation-2.0",
                 data=data
@@ -69,7 +69,7 @@ class MeaningCloudClient:
                 return await response.json()
 
     async def summarize(self, txt: str, lang: str, sentences: int):
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                 url="https://api.meaningcloud.com/summarization-1.0",
                 data={
@@ -1,4 +1,3 @@
-import aiohttp
 from tracardi.domain.resources.token import Token
 
 from tracardi.domain.resource import ResourceCredentials
@@ -9,6 +8,7 @@ from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form
 from tracardi.service.plugin.domain.result import Result
 from .model.configuration import Configuration
 from tracardi.service.notation.dot_template import DotTemplate
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Configuration:
@@ -39,7 +39,7 @@ class TextClassificationAction(ActionRunner):
 
         dot = self._get_dot_accessor(payload)
         template = DotTemplate()
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             params = {
                 "key": self.credentials.token,
                 "txt": template.render(self.config.text, dot),
@@ -1,7 +1,7 @@
-import aiohttp
 import json
 from fastapi import HTTPException
 from base64 import b64encode
+from tracardi.service.http_client import http_sessions
 
 
 class MixPanelAPIClient:
@@ -24,7 +24,7 @@ class MixPanelAPIClient:
             }
         }
 
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Accept": "text/plain", "Content-Type": "application/x-www-form-urlencoded"
         }) as session:
             async with session.post(
@@ -42,7 +42,7 @@ class MixPanelAPIClient:
                  f"to_date={to_date}&" \
                  f'where=properties["$distinct_id"]=="{user_id}"'
 
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Accept": "application/json",
             "Authorization": "Basic " + f"{b64encode(bytes(f'{self.username}:{self.password}', '''utf-8'''))}"[2:-1]
         }) as session:
@@ -1,11 +1,13 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+
+from tracardi.service.connection_pool import ConnectionPoolFactory
 from .configuration import MongoConfiguration
 
 
 class MongoClient:
-    def __init__(self, config: MongoConfiguration):
+    def __init__(self, config: MongoConfiguration, max_size: int = 100):
         self.config = config
-        self.client = AsyncIOMotorClient(config.uri, serverSelectionTimeoutMS=config.timeout)
+        self.client = AsyncIOMotorClient(config.uri, serverSelectionTimeoutMS=config.timeout, maxPoolSize=max_size)
 
     async def find(self, database, collection, query):
         database = self.client[database]
@@ -19,6 +21,27 @@ class MongoClient:
         database = self.client[database]
         return await database.list_collection_names()
 
+    async def ping(self):
+        return await self.client.admin.command('ping')
+
     async def close(self):
         if self.client:
-            await self.client.close()
+            self.client.close()
+
+
+class MongoPoolFactory(ConnectionPoolFactory):
+
+    name = "mongo"
+
+    async def create(self, credentials: MongoConfiguration, max_size: int, **options) -> MongoClient:
+        return MongoClient(credentials, max_size)
+
+    async def check(self, pool: MongoClient) -> bool:
+        await pool.ping()
+        return True
+
+    async def close(self, pool: MongoClient):
+        await pool.close()
+
+
+mongo_pool = MongoPoolFactory()
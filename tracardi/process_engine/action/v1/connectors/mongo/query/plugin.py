@@ -6,9 +6,10 @@ from tracardi.domain.resource_config import ResourceConfig
 from tracardi.service.plugin.plugin_endpoint import PluginEndpoint
 from tracardi.service.storage.driver import storage
 from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form, FormGroup, FormField, FormComponent
+from tracardi.service.connection_pool import connection_pools
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
-from .model.client import MongoClient
+from .model.client import mongo_pool
 from .model.configuration import PluginConfiguration, MongoConfiguration, DatabaseConfig
 
 
@@ -23,6 +24,9 @@ def validate(config: dict) -> PluginConfiguration:
 
 class MongoConnectorAction(ActionRunner):
 
+    reusable = True
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'MongoConnectorAction':
         config = PluginConfiguration(**kwargs)
@@ -30,8 +34,7 @@ class MongoConnectorAction(ActionRunner):
         return MongoConnectorAction(config, resource.credentials)
 
     def __init__(self, config: PluginConfiguration, credentials: ResourceCredentials):
-        mongo_config = credentials.get_credentials(self, output=MongoConfiguration)  # type: MongoConfiguration
-        self.client = MongoClient(mongo_config)
+        self.mongo_config = credentials.get_credentials(self, output=MongoConfiguration)  # type: MongoConfiguration
         self.config = config
 
     async def run(self, payload: dict, in_edge=None) -> Result:
@@ -40,12 +43,10 @@ class MongoConnectorAction(ActionRunner):
         except JSONDecodeError as e:
             raise ValueError("Can not parse this data as JSON. Error: `{}`".format(str(e)))
 
-        result = await self.client.find(self.config.database.id, self.config.collection.id, query)
+        async with connection_pools.acquire(self.config.source.id, mongo_pool, self.mongo_config) as client:
+            result = await client.find(self.config.database.id, self.config.collection.id, query)
         return Result(port="payload", value={"result": result})
 
-    # async def close(self):
-    #     await self.client.close()
-
 
 class Endpoint(PluginEndpoint):
 
@@ -54,8 +55,8 @@ class Endpoint(PluginEndpoint):
         config = ResourceConfig(**config)
         resource = await storage.driver.resource.load(config.source.id)
         mongo_config = MongoConfiguration(**resource.credentials.production)
-        client = MongoClient(mongo_config)
-        databases = await client.dbs()
+        async with connection_pools.acquire(config.source.id, mongo_pool, mongo_config) as client:
+            databases = await client.dbs()
         return {
             "total": len(databases),
             "result": [{"name": db, "id": db} for db in databases]
@@ -66,8 +67,8 @@ class Endpoint(PluginEndpoint):
         config = DatabaseConfig(**config)
         resource = await storage.driver.resource.load(config.source.id)
         mongo_config = MongoConfiguration(**resource.credentials.production)
-        client = MongoClient(mongo_config)
-        collections = await client.collections(config.database.id)
+        async with connection_pools.acquire(config.source.id, mongo_pool, mongo_config) as client:
+            collections = await client.collections(config.database.id)
         return {
             "total": len(collections),
             "result": [{"name": item, "id": item} for item in collections]
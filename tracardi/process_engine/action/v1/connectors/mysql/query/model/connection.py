@@ -2,6 +2,8 @@ import aiomysql
 import asyncio
 from pydantic import BaseModel
 
+from tracardi.service.connection_pool import ConnectionPoolFactory
+
 
 class Connection(BaseModel):
     database: str
@@ -10,9 +12,33 @@ class Connection(BaseModel):
     host: str
     port: int = 3306
 
-    async def connect(self, timeout=None):
+    async def connect(self, timeout=None, max_size: int = 10):
+        # Every statement is committed, so the connection is not in a transaction when it returns to the pool
+        # and can be reused.
         loop = asyncio.get_event_loop()
         return await aiomysql.create_pool(host=self.host, port=self.port,
                                           user=self.user, password=self.password,
                                           db=self.database, loop=loop,
-                                          connect_timeout=timeout)
+                                          connect_timeout=timeout,
+                                          maxsize=max_size,
+                                          autocommit=True)
+
+
+class MySQLPoolFactory(ConnectionPoolFactory):
+
+    name = "mysql"
+
+    async def create(self, credentials: Connection, max_size: int, timeout=None) -> aiomysql.Pool:
+        return await credentials.connect(timeout, max_size)
+
+    async def check(self, pool: aiomysql.Pool) -> bool:
+        async with pool.acquire() as conn:
+            await conn.ping()
+        return True
+
+    async def close(self, pool: aiomysql.Pool):
+        pool.close()
+        await pool.wait_closed()
+
+
+mysql_pool = MySQLPoolFactory()
@@ -7,10 +7,11 @@ from tracardi.service.notation.dict_traverser import DictTraverser
 from tracardi.service.storage.driver import storage
 from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form, FormGroup, FormField, FormComponent, \
     Documentation, PortDoc
+from tracardi.service.connection_pool import connection_pools
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
 from .model.configuration import Configuration
-from .model.connection import Connection
+from .model.connection import Connection, mysql_pool
 
 
 def validate(config: dict) -> Configuration:
@@ -19,6 +20,9 @@ def validate(config: dict) -> Configuration:
 
 class MysqlConnectorAction(ActionRunner):
 
+    reusable = True
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'MysqlConnectorAction':
 
@@ -27,54 +31,45 @@ class MysqlConnectorAction(ActionRunner):
         return MysqlConnectorAction(configuration, resource.credentials)
 
     def __init__(self, config: Configuration, credentials: ResourceCredentials):
-        self.pool = None
         self.config = config
         self.connection = credentials.get_credentials(self, output=Connection)
 
     async def run(self, payload: dict, in_edge=None) -> Result:
         try:
-            self.pool = await self.connection.connect(self.config.timeout)
-
             # Prepare statement data
             template = DictTraverser(self._get_dot_accessor(payload))
             data = template.reshape(self.config.data)
             self.console.log("Executing query: {} with data: {}".format(self.config.query, data))
 
-            async with self.pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cursor:
-                    if self.config.type == 'call':
-                        # todo implement
+            async with connection_pools.acquire(self.config.source.id, mysql_pool, self.connection,
+                                                timeout=self.config.timeout) as pool:
+                async with pool.acquire() as conn:
+                    async with conn.cursor(aiomysql.DictCursor) as cursor:
+                        if self.config.type == 'call':
+                            # todo implement
 
-                        return Result(port="result", value={"result": payload})
-                    else:
-                        if len(data) > 0:
-                            await cursor.execute(self.config.query, tuple(data))
+                            return Result(port="result", value={"result": payload})
                         else:
-                            await cursor.execute(self.config.query)
-
-                        if self.config.type in ['insert', 'delete', 'update']:
-                            await conn.commit()
-                            if self.config.type == 'insert':
-                                return Result(port="result", value={"last_insert_id": cursor.lastrowid})
-                        if self.config.type == 'select':
-                            result = await cursor.fetchall()
-                            result = [self.to_dict(record) for record in result]
-                            return Result(port="result", value={"result": result})
-
-                    return Result(port="result", value=payload)
+                            if len(data) > 0:
+                                await cursor.execute(self.config.query, tuple(data))
+                            else:
+                                await cursor.execute(self.config.query)
+
+                            if self.config.type in ['insert', 'delete', 'update']:
+                                await conn.commit()
+                                if self.config.type == 'insert':
+                                    return Result(port="result", value={"last_insert_id": cursor.lastrowid})
+                            if self.config.type == 'select':
+                                result = await cursor.fetchall()
+                                result = [self.to_dict(record) for record in result]
+                                return Result(port="result", value={"result": result})
+
+                        return Result(port="result", value=payload)
 
         except Exception as e:
             self.console.error(str(e))
             return Result(port="error", value={"payload": payload, "error": str(e)})
 
-    async def close(self):
-        if self.pool:
-            self.pool.close()
-            await self.pool.wait_closed()
-
-    async def on_error(self, **kwargs):
-        await self.close()
-
     @staticmethod
     def to_dict(record):
 
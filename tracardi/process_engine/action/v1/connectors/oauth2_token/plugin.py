@@ -6,7 +6,7 @@ from .model.config import Config
 from tracardi.service.storage.driver import storage
 from tracardi.domain.resource import ResourceCredentials
 from tracardi.domain.resources.remote_api_resource import RemoteApiResource
-import aiohttp
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Config:
@@ -28,7 +28,7 @@ class TokenGetter(ActionRunner):
     async def run(self, payload: dict, in_edge=None) -> Result:
         dot = self._get_dot_accessor(payload)
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                     url=self._credentials.url,
                     data={
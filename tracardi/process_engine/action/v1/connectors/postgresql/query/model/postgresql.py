@@ -1,6 +1,8 @@
 import asyncpg
 from pydantic import BaseModel
 
+from tracardi.service.connection_pool import ConnectionPoolFactory
+
 
 class Connection(BaseModel):
     database: str
@@ -15,3 +17,29 @@ class Connection(BaseModel):
                                      password=self.password,
                                      host=self.host,
                                      port=self.port)
+
+    async def create_pool(self, max_size: int = 10) -> asyncpg.pool.Pool:
+        return await asyncpg.create_pool(database=self.database,
+                                         user=self.user,
+                                         password=self.password,
+                                         host=self.host,
+                                         port=self.port,
+                                         min_size=1,
+                                         max_size=max_size)
+
+
+class PostgreSQLPoolFactory(ConnectionPoolFactory):
+
+    name = "postgresql"
+
+    async def create(self, credentials: Connection, max_size: int, **options) -> asyncpg.pool.Pool:
+        return await credentials.create_pool(max_size)
+
+    async def check(self, pool: asyncpg.pool.Pool) -> bool:
+        return await pool.fetchval("SELECT 1") == 1
+
+    async def close(self, pool: asyncpg.pool.Pool):
+        await pool.close()
+
+
+postgresql_pool = PostgreSQLPoolFactory()
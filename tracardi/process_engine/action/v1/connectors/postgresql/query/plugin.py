@@ -5,11 +5,12 @@ from tracardi.domain.resource import ResourceCredentials
 from tracardi.service.storage.driver import storage
 from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form, FormGroup, FormField, FormComponent, \
     Documentation, PortDoc
+from tracardi.service.connection_pool import connection_pools
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
 
 from .model.configuration import Configuration
-from .model.postgresql import Connection
+from .model.postgresql import Connection, postgresql_pool
 
 
 def validate(config: dict) -> Configuration:
@@ -18,6 +19,9 @@ def validate(config: dict) -> Configuration:
 
 class PostgreSQLConnectorAction(ActionRunner):
 
+    reusable = True
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'PostgreSQLConnectorAction':
         config = validate(kwargs)
@@ -25,16 +29,17 @@ class PostgreSQLConnectorAction(ActionRunner):
         return PostgreSQLConnectorAction(config, resource.credentials)
 
     def __init__(self, config: Configuration, credentials: ResourceCredentials):
+        self.source_id = config.source.id
         self.credentials = credentials
         self.query = config.query
         self.timeout = config.timeout
-        self.db = None
 
     async def run(self, payload: dict, in_edge=None) -> Result:
         try:
 
-            self.db = await self.credentials.get_credentials(self, Connection).connect()
-            result = await self.db.fetch(self.query, timeout=self.timeout)
+            connection = self.credentials.get_credentials(self, Connection)
+            async with connection_pools.acquire(self.source_id, postgresql_pool, connection) as pool:
+                result = await pool.fetch(self.query, timeout=self.timeout)
             result = [self.to_dict(record) for record in result]
             return Result(port="result", value={"result": result})
 
@@ -42,10 +47,6 @@ class PostgreSQLConnectorAction(ActionRunner):
             self.console.error(str(e))
             return Result(port="error", value={"payload": payload, "error": str(e)})
 
-    async def close(self):
-        if self.db:
-            await self.db.close()
-
     @staticmethod
     def to_dict(record):
 
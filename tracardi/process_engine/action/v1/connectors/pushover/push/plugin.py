@@ -1,5 +1,4 @@
 import urllib.parse
-import aiohttp
 
 from tracardi.domain.resource import ResourceCredentials
 from tracardi.service.storage.driver import storage
@@ -8,6 +7,7 @@ from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
 from tracardi.service.notation.dot_template import DotTemplate
 from .model.pushover_config import PushOverConfiguration, PushOverAuth
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> PushOverConfiguration:
@@ -16,6 +16,8 @@ def validate(config: dict) -> PushOverConfiguration:
 
 class PushoverAction(ActionRunner):
 
+    concurrent = True
+
     @staticmethod
     async def build(**kwargs) -> 'PushoverAction':
         config = validate(kwargs)
@@ -27,7 +29,7 @@ class PushoverAction(ActionRunner):
         self.credentials = credentials.get_credentials(self, output=PushOverAuth)  # type: PushOverAuth
 
     async def run(self, payload: dict, in_edge=None) -> Result:
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
 
             dot = self._get_dot_accessor(payload)
             template = DotTemplate()
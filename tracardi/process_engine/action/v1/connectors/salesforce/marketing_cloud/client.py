@@ -1,5 +1,5 @@
-import aiohttp
 from typing import Optional, Dict, Any
+from tracardi.service.http_client import http_sessions
 
 
 class MarketingCloudAuthException(Exception):
@@ -19,7 +19,7 @@ class MarketingCloudClient:
         self.token = token
 
     async def get_token(self):
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                     url=f"https://{self.subdomain}.auth.marketingcloudapis.com/v2/token",
                     data={
@@ -35,7 +35,7 @@ class MarketingCloudClient:
                 self.token = (await response.json())["access_token"]
 
     async def add_record(self, mapping: Dict[str, Any], extension_id: str, update: bool):
-        async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {self.token}"}) as session:
+        async with http_sessions.session(headers={"Authorization": f"Bearer {self.token}"}) as session:
             method = session.put if update else session.post
             async with method(
                     url=f"https://{self.subdomain}.rest.marketingcloudapis.com/data/v1/async/dataextensions/"
@@ -1,5 +1,5 @@
-import aiohttp
 import json
+from tracardi.service.http_client import http_sessions
 
 
 class SlackClient:
@@ -8,7 +8,7 @@ class SlackClient:
         self._token = token
 
     async def send_to_channel_as_bot(self, channel: str, message: str):
-        async with aiohttp.ClientSession(headers={
+        async with http_sessions.session(headers={
             "Authorization": f"Bearer {self._token}",
             "Content-type": "application/json; charset=utf-8"
         }) as session:
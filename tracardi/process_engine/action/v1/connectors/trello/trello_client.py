@@ -1,4 +1,4 @@
-import aiohttp
+from tracardi.service.http_client import http_sessions
 
 
 class TrelloClient:
@@ -9,7 +9,7 @@ class TrelloClient:
 
     async def get_list_id(self, board_url: str, list_name: str) -> str:
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(
                     url=f'https://api.trello.com/1/members/me/boards?key={self.api_key}&token={self.token}'
             ) as response:
@@ -40,7 +40,7 @@ class TrelloClient:
 
     async def add_card(self, list_id: str, **kwargs) -> dict:
 
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.post(
                     url=f"https://api.trello.com/1/cards?key={self.api_key}&token={self.token}",
                     params={
@@ -57,7 +57,7 @@ class TrelloClient:
                 return result
 
     async def delete_card(self, list_id: str, card_name: str) -> dict:
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(
                     url=f"https://api.trello.com/1/lists/{list_id}/cards?key={self.api_key}&token={self.token}"
             ) as response:
@@ -88,7 +88,7 @@ class TrelloClient:
                 return result
 
     async def move_card(self, current_list_id: str, list_id: str, card_name: str) -> dict:
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(
                     url=f"https://api.trello.com/1/lists/{current_list_id}/cards?key={self.api_key}&token={self.token}"
             ) as response:
@@ -121,7 +121,7 @@ class TrelloClient:
                 return result
 
     async def add_member(self, list_id: str, card_name: str, member_id: str) -> dict:
-        async with aiohttp.ClientSession() as session:
+        async with http_sessions.session() as session:
             async with session.get(
                     url=f"https://api.trello.com/1/lists/{list_id}/cards?key={self.api_key}&token={self.token}"
             ) as response:
@@ -9,6 +9,7 @@ from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.notation.dict_traverser import DictTraverser
 
 from .model.configuration import Configuration
+from tracardi.service.http_client import http_sessions
 
 
 def validate(config: dict) -> Configuration:
@@ -25,6 +26,8 @@ def validate(config: dict) -> Configuration:
 
 class ZapierWebHookAction(ActionRunner):
 
+    concurrent = True
+
     def __init__(self, **kwargs):
         self.config = Configuration(**kwargs)
 
@@ -33,7 +36,7 @@ class ZapierWebHookAction(ActionRunner):
         try:
 
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
 
                 converter = DictTraverser(self._get_dot_accessor(payload))
                 body_as_dict = json.loads(self.config.body)
@@ -40,6 +40,7 @@ class ConsentAdder(ActionRunner):
                         consent_type = ConsentType(**consent_type_data)
                         if consent_type.revokable is False:
                             self.profile.consents[consent_id] = ConsentRevoke(revoke=None)
+                            self.profile.mark_changed('consents')
                         else:
                             revoke_offset = parse(consent_type.auto_revoke)
 
@@ -52,6 +53,7 @@ class ConsentAdder(ActionRunner):
                                 self.event.metadata.time.insert.timestamp() +
                                 parse(consent_type.auto_revoke
                                       )))
+                            self.profile.mark_changed('consents')
                     else:
                         self.console.warning(
                             f"The consent id `{consent_id}` was not appended to profile as there is no consent "
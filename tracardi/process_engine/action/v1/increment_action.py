@@ -5,7 +5,6 @@ from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Form
     Documentation, PortDoc
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.result import Result
-from tracardi.domain.profile import Profile
 from tracardi.service.plugin.domain.config import PluginConfig
 
 
@@ -51,7 +50,7 @@ class IncrementAction(ActionRunner):
         dot[self.config.field] = value
 
         if self.event.metadata.profile_less is False:
-            self.profile.replace(Profile(**dot.profile))
+            self.profile.replace(dot.write_back('profile', self.profile))
 
         return Result(port="payload", value=payload)
 
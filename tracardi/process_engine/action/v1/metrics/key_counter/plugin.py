@@ -46,7 +46,7 @@ class KeyCounterAction(ActionRunner):
         dot[self.config.save_in] = counter.counts
 
         if isinstance(self.profile, Profile):
-            self.profile.replace(Profile(**dot.profile))
+            self.profile.replace(dot.write_back('profile', self.profile))
 
         return Result(port='payload', value=payload)
 
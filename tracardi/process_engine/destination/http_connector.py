@@ -16,6 +16,7 @@ from tracardi.exceptions.log_handler import log_handler
 from tracardi.process_engine.tql.utils.dictonary import flatten
 from tracardi.process_engine.action.v1.connectors.api_call.model.configuration import Method
 from tracardi.process_engine.destination.connector import Connector
+from tracardi.service.http_client import http_sessions
 
 logger = logging.getLogger(__name__)
 logger.setLevel(tracardi.logging_level)
@@ -80,7 +81,7 @@ class HttpConnector(Connector):
             self._validate_key_value(config.cookies, "Cookie")
 
             timeout = aiohttp.ClientTimeout(total=config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_sessions.session(timeout=timeout) as session:
                 async with session.request(
                         method=config.method,
                         url=str(credentials.url),
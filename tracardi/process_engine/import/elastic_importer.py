@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import Tuple
 from uuid import uuid4
 
-from elasticsearch import AsyncElasticsearch
-
 from tracardi.domain.import_config import ImportConfig
 from tracardi.domain.task import Task
+from tracardi.process_engine.action.v1.connectors.elasticsearch.query.model.client import elastic_pool
 from tracardi.process_engine.action.v1.connectors.elasticsearch.query.model.config import ElasticCredentials
+from tracardi.service.connection_pool import connection_pools
 from .importer import Importer
 from pydantic import BaseModel, validator
 from tracardi.service.plugin.domain.register import Form, FormGroup, FormField, FormComponent
@@ -48,21 +48,8 @@ class Endpoint(PluginEndpoint):
         resource = await storage.driver.resource.load(config.source.id)
         credentials = ElasticCredentials(**resource.credentials.production)
 
-        if credentials.has_credentials():
-            client = AsyncElasticsearch(
-                [credentials.url],
-                http_auth=(credentials.username, credentials.password),
-                scheme=credentials.scheme,
-                port=credentials.port
-            )
-        else:
-            client = AsyncElasticsearch(
-                [credentials.url],
-                scheme=credentials.scheme,
-                port=credentials.port
-            )
-
-        indices = await client.indices.get("*")
+        async with connection_pools.acquire(config.source.id, elastic_pool, credentials) as client:
+            indices = await client.indices.get("*")
         indices = indices.keys()
 
         return {
@@ -13,7 +13,8 @@ from pydantic import BaseModel, validator
 from tracardi.service.plugin.domain.register import Form, FormGroup, FormField, FormComponent
 from tracardi.domain.named_entity import NamedEntity
 from tracardi.service.storage.driver import storage
-from tracardi.process_engine.action.v1.connectors.mysql.query.model.connection import Connection
+from tracardi.process_engine.action.v1.connectors.mysql.query.model.connection import Connection, mysql_pool
+from tracardi.service.connection_pool import connection_pools
 from tracardi.service.plugin.plugin_endpoint import PluginEndpoint
 from worker.celery_worker import run_mysql_query_import_job
 
@@ -54,15 +55,12 @@ class Endpoint(PluginEndpoint):
         config = DatabaseFetcherConfig(**config)
         resource = await storage.driver.resource.load(config.source.id)
         credentials = resource.credentials.production
-        pool = await Connection(**credentials).connect()
-        async with pool.acquire() as conn:
+        async with connection_pools.acquire(config.source.id, mysql_pool, Connection(**credentials)) as pool, \
+                pool.acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cursor:
                 await cursor.execute(f"SHOW DATABASES")
                 result = await cursor.fetchall()
 
-                await cursor.close()
-                conn.close()
-
                 return {
                     "total": len(result),
                     "result": [{"name": list(record.values())[0], "id": list(record.values())[0]} for record in result]
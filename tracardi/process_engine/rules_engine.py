@@ -4,7 +4,7 @@ import traceback
 from asyncio import Task
 from collections import defaultdict
 from time import time
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from pydantic import ValidationError
 from tracardi.domain.event import Event, INVALID
 
@@ -24,6 +24,7 @@ from ..domain.session import Session
 from ..domain.rule import Rule
 from ..exceptions.exception_service import get_traceback
 from ..exceptions.log_handler import log_handler
+from ..service.track_metrics import track_metrics
 
 logger = logging.getLogger("Routing rule")
 logger.setLevel(tracardi.logging_level)
@@ -35,7 +36,7 @@ class RulesEngine:
     def __init__(self,
                  session: Session,
                  profile: Optional[Profile],
-                 events_rules: List[Tuple[List[Dict], Event]],
+                 events_rules: List[Tuple[List[Union[Rule, Dict]], Event]],
                  console_log=None
                  ):
 
@@ -66,24 +67,28 @@ class RulesEngine:
             for rule in rules:
 
                 # this is main roles loop
-                if 'name' in rule:
-                    invoked_rules[event.type].append(rule['name'])
+                if isinstance(rule, Rule):
+                    # Rules from rule index are already validated
+                    invoked_rules[event.type].append(rule.name)
+                else:
+                    if 'name' in rule:
+                        invoked_rules[event.type].append(rule['name'])
 
-                try:
-                    rule = Rule(**rule)
-                except ValidationError as e:
-                    console = Console(
-                        origin="rule",
-                        event_id=event.id,
-                        flow_id=None,
-                        module=__name__,
-                        class_name='RulesEngine',
-                        type="error",
-                        message="Rule validation error: ".format(str(e)),
-                        traceback=get_traceback(e)
-                    )
-                    self.console_log.append(console)
-                    continue
+                    try:
+                        rule = Rule(**rule)
+                    except ValidationError as e:
+                        console = Console(
+                            origin="rule",
+                            event_id=event.id,
+                            flow_id=None,
+                            module=__name__,
+                            class_name='RulesEngine',
+                            type="error",
+                            message="Rule validation error: ".format(str(e)),
+                            traceback=get_traceback(e)
+                        )
+                        self.console_log.append(console)
+                        continue
 
                 if not rule.enabled:
                     logger.info(f"Rule {rule.name} skipped. Rule is disabled.")
@@ -147,6 +152,8 @@ class RulesEngine:
 
         # Run flows and report async
 
+        track_metrics.count("flows", sum(len(tasks) for tasks in flow_task_store.values()))
+
         post_invoke_events = {}
         for event_type, tasks in flow_task_store.items():
             for flow_id, event_id, rule_name, task in tasks:
@@ -0,0 +1,319 @@
+from numbers import Number
+from typing import Callable, Tuple, List, Dict, Optional
+
+import numpy as np
+from lark import Tree, Token
+
+from tracardi.service.notation.dot_accessor import DotAccessor
+from tracardi.process_engine.tql.compiler import ExprCompiler, _ConstNode
+
+_profile_prefix = 'profile@'
+
+_missing = object()
+
+# Mask of matching rows and mask of rows that raised an error.
+Masks = Tuple[np.ndarray, np.ndarray]
+ColumnarExpr = Callable[['Columns'], Masks]
+
+
+def _get_path(data, keys: List[str]):
+    for key in keys:
+        if isinstance(data, dict):
+            if key not in data:
+                return _missing
+            data = data[key]
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return _missing
+    return data
+
+
+def _is_number(value) -> bool:
+    # Bool is compared as number, the same as in python.
+    return isinstance(value, Number) and not isinstance(value, complex)
+
+
+class Column:
+
+    """
+    Values of one profile field for all rows with masks and typed arrays used in comparisons.
+    Typed arrays are built on first use.
+    """
+
+    def __init__(self, values: list):
+        self.values = values
+        self.exists = np.fromiter((value is not _missing for value in values), dtype=bool, count=len(values))
+        self._is_none = None
+        self._numbers = None
+        self._is_number = None
+        self._strings = None
+        self._is_string = None
+
+    @property
+    def is_none(self) -> np.ndarray:
+        if self._is_none is None:
+            self._is_none = np.fromiter((value is None for value in self.values), dtype=bool, count=len(self.values))
+        return self._is_none
+
+    @property
+    def is_number(self) -> np.ndarray:
+        if self._is_number is None:
+            self._is_number = np.fromiter((_is_number(value) for value in self.values), dtype=bool,
+                                          count=len(self.values))
+        return self._is_number
+
+    @property
+    def numbers(self) -> np.ndarray:
+        if self._numbers is None:
+            self._numbers = np.fromiter((float(value) if _is_number(value) else np.nan for value in self.values),
+                                        dtype=np.float64, count=len(self.values))
+        return self._numbers
+
+    @property
+    def is_string(self) -> np.ndarray:
+        if self._is_string is None:
+            self._is_string = np.fromiter((isinstance(value, str) for value in self.values), dtype=bool,
+                                          count=len(self.values))
+        return self._is_string
+
+    @property
+    def strings(self) -> np.ndarray:
+        if self._strings is None:
+            self._strings = np.array([value if isinstance(value, str) else '' for value in self.values], dtype=str)
+        return self._strings
+
+    def is_empty(self) -> np.ndarray:
+        return np.fromiter((value is _missing or value is None or
+                            (isinstance(value, (str, list, dict)) and len(value) == 0) for value in self.values),
+                           dtype=bool, count=len(self.values))
+
+
+class Columns:
+
+    """
+    Profile records in columnar form. Columns are extracted on first use.
+    """
+
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self.size = len(rows)
+        self._columns = {}  # type: Dict[str, Column]
+        self._dots = None  # type: Optional[List[DotAccessor]]
+
+    def get(self, path: str) -> Column:
+        if path not in self._columns:
+            keys = path.split('.')
+            self._columns[path] = Column([_get_path(row, keys) for row in self.rows])
+        return self._columns[path]
+
+    @property
+    def dots(self) -> List[DotAccessor]:
+        if self._dots is None:
+            self._dots = [DotAccessor(profile=row) for row in self.rows]
+        return self._dots
+
+    def zeros(self) -> np.ndarray:
+        return np.zeros(self.size, dtype=bool)
+
+
+class ColumnarCompiler:
+
+    """
+    Compiles uql_expr tree of a profile condition into a function that evaluates the condition for all rows
+    of Columns at once. Comparisons of profile fields with constants, between, exists, null and empty checks
+    and boolean operators are evaluated as numpy masks. Other operations, e.g. functions, are evaluated
+    row by row with ExprCompiler. Rows that raise an error do not match.
+    """
+
+    def __init__(self):
+        self._compiler = ExprCompiler()
+
+    def compile(self, tree: Tree) -> ColumnarExpr:
+        return self._compile(tree)
+
+    def _compile(self, node) -> ColumnarExpr:
+        if isinstance(node, Tree):
+            method = getattr(self, f"_compile_{node.data}", None)
+            if method is not None:
+                compiled = method(node)
+                if compiled is not None:
+                    return compiled
+        return self._compile_rows(node)
+
+    def _compile_rows(self, node) -> ColumnarExpr:
+        expr = self._compiler.compile(node)
+
+        def evaluate(columns: Columns) -> Masks:
+            matched = columns.zeros()
+            errors = columns.zeros()
+            for i, dot in enumerate(columns.dots):
+                try:
+                    matched[i] = bool(expr(dot))
+                except Exception:
+                    errors[i] = True
+            return matched, errors
+
+        return evaluate
+
+    def _constant(self, node):
+        # Returns _ConstNode or None if node is not a constant.
+        if not self._compiler._is_constant(node):
+            return None
+        const = self._compiler._fold(node)
+        return const if isinstance(const, _ConstNode) else None
+
+    @staticmethod
+    def _profile_field(node) -> Optional[str]:
+        if isinstance(node, Tree) and node.data == 'op_field_sig':
+            node = node.children[0]
+        if isinstance(node, Token) and node.type == 'OP_FIELD' and node.value.startswith(_profile_prefix):
+            path = node.value[len(_profile_prefix):]
+            if path != '...':
+                return path
+        return None
+
+    def _compile_expr(self, node):
+        return self._compile(node.children[0])
+
+    def _compile_and_expr(self, node):
+        left = self._compile(node.children[0])
+        right = self._compile(node.children[2])
+
+        def evaluate(columns: Columns) -> Masks:
+            matched1, errors1 = left(columns)
+            matched2, errors2 = right(columns)
+            return matched1 & matched2, errors1 | errors2
+
+        return evaluate
+
+    def _compile_or_expr(self, node):
+        left = self._compile(node.children[0])
+        right = self._compile(node.children[2])
+
+        def evaluate(columns: Columns) -> Masks:
+            matched1, errors1 = left(columns)
+            matched2, errors2 = right(columns)
+            return matched1 | matched2, errors1 | errors2
+
+        return evaluate
+
+    @staticmethod
+    def _is_supported(operation: str, value) -> bool:
+        if operation in ('==', '!='):
+            return _is_number(value) or isinstance(value, str) or value is None
+        return _is_number(value) or isinstance(value, str)
+
+    @staticmethod
+    def _compare(column: Column, operation: str, value) -> Optional[Masks]:
+        """
+        Compares column with constant value the same way as `field OP value` is compared in python.
+        Missing values never match and do not raise errors.
+        """
+        if operation in ('==', '!='):
+            if _is_number(value):
+                matched = column.is_number & (column.numbers == float(value))
+            elif isinstance(value, str):
+                matched = column.is_string & (column.strings == value)
+            elif value is None:
+                matched = column.is_none
+            else:
+                return None
+            if operation == '!=':
+                matched = ~matched
+            return matched, np.zeros(len(matched), dtype=bool)
+
+        if _is_number(value):
+            is_type, typed, value = column.is_number, column.numbers, float(value)
+        elif isinstance(value, str):
+            is_type, typed = column.is_string, column.strings
+        else:
+            return None
+
+        if operation == '>':
+            compared = typed > value
+        elif operation in ('>=', '=>'):
+            compared = typed >= value
+        elif operation == '<':
+            compared = typed < value
+        elif operation in ('<=', '=<'):
+            compared = typed <= value
+        else:
+            return None
+
+        # Values of other type can not be compared and raise TypeError.
+        return is_type & compared, column.exists & ~is_type
+
+    def _compile_op_condition(self, node):
+        field, operation, value = node.children
+        path = self._profile_field(field)
+        const = self._constant(value)
+        if path is None or const is None:
+            return None
+
+        operation = operation.value
+        value = const.value
+        if not self._is_supported(operation, value):
+            # Evaluated row by row.
+            return None
+
+        def evaluate(columns: Columns) -> Masks:
+            return self._compare(columns.get(path), operation, value)
+
+        return evaluate
+
+    def _compile_op_between(self, node):
+        field, _, values = node.children
+        path = self._profile_field(field)
+        const = self._constant(values)
+        if path is None or const is None:
+            return None
+
+        low, high = const.value
+        if not ((_is_number(low) and _is_number(high)) or (isinstance(low, str) and isinstance(high, str))):
+            return None
+
+        def evaluate(columns: Columns) -> Masks:
+            column = columns.get(path)
+            matched1, errors1 = self._compare(column, '>=', low)
+            matched2, errors2 = self._compare(column, '<=', high)
+            # Upper bound is compared only if lower bound matched.
+            return matched1 & matched2, errors1 | (matched1 & errors2)
+
+        return evaluate
+
+    def _compile_op_exists(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (columns.get(path).exists, columns.zeros())
+
+    def _compile_op_not_exists(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (~columns.get(path).exists, columns.zeros())
+
+    def _compile_op_is_null(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (columns.get(path).is_none, columns.zeros())
+
+    def _compile_op_is_not_null(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (~columns.get(path).is_none, columns.zeros())
+
+    def _compile_op_empty(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (columns.get(path).is_empty(), columns.zeros())
+
+    def _compile_op_not_empty(self, node):
+        path = self._profile_field(node.children[0])
+        if path is None:
+            return None
+        return lambda columns: (~columns.get(path).is_empty(), columns.zeros())
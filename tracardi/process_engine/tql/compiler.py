@@ -0,0 +1,297 @@
+from typing import Callable, Any, List, Set
+
+from lark import Tree, Token
+from lark.exceptions import VisitError
+
+from tracardi.service.notation.dot_accessor import DotAccessor
+from tracardi.service.notation.dot_path import compile_path
+from tracardi.process_engine.tql.domain.field import Field
+from tracardi.process_engine.tql.domain.missing_value import MissingValue
+from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransformer
+
+# Functions that return different value on every call can not be folded.
+_volatile_functions = ('now',)
+
+CompiledExpr = Callable[[DotAccessor], Any]
+
+
+def make_field_getter(label: str) -> CompiledExpr:
+    """
+    Returns function that reads dot notation `label` from DotAccessor the same way as DotAccessor[label]
+    but with the dot notation compiled only once.
+    """
+    path = compile_path(label)
+    if path is None or path.whole:
+        return lambda dot: dot[label]
+    return lambda dot: dot.read(path)
+
+
+class CompiledField(Field):
+
+    """
+    Field that reads its value with precompiled getter.
+    """
+
+    def __init__(self, label, value_ref, getter: CompiledExpr):
+        super().__init__(label, value_ref)
+        self.getter = getter
+
+    @property
+    def value(self):
+        try:
+            return self.getter(self.dot)
+        except KeyError as e:
+            return MissingValue(str(e))
+
+
+class _FieldNode:
+
+    __slots__ = ("label", "getter")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.getter = make_field_getter(label)
+
+    def __call__(self, dot: DotAccessor) -> CompiledField:
+        return CompiledField(self.label, dot, self.getter)
+
+
+def _field_value(field: _FieldNode) -> CompiledExpr:
+    get = field.getter
+
+    def value(dot):
+        try:
+            return get(dot)
+        except KeyError as e:
+            return MissingValue(str(e))
+
+    return value
+
+
+class _ConstNode:
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, dot: DotAccessor):
+        return self.value
+
+
+class ExprCompiler:
+
+    """
+    Compiles uql_expr tree into a tree of closures that take DotAccessor and return the same value as
+    ExprTransformer. Constant sub-expressions are evaluated at compile time and fields are read with
+    precompiled getters. Errors are raised as they are, not wrapped in lark VisitError.
+    """
+
+    def __init__(self):
+        # Transformer is only used to evaluate constants and dot independent operations.
+        self._transformer = ExprTransformer(dot=DotAccessor())
+
+    def compile(self, tree: Tree) -> CompiledExpr:
+        return self._compile(tree)
+
+    @staticmethod
+    def get_fields(tree: Tree) -> Set[str]:
+        """
+        Returns labels of all fields read by expression, e.g. `profile@traits.public.age`.
+        """
+        return {str(token) for token in tree.scan_values(lambda v: isinstance(v, Token) and v.type == 'OP_FIELD')}
+
+    @staticmethod
+    def is_volatile(tree: Tree) -> bool:
+        """
+        Returns True if expression value may change without any change of data, e.g. it compares with now().
+        """
+        return any(str(node.children[0]).startswith(_volatile_functions)
+                   for node in tree.find_data('op_compound_value'))
+
+    @staticmethod
+    def _is_constant(node) -> bool:
+        if isinstance(node, Token):
+            return node.type != 'OP_FIELD'
+        if not isinstance(node, Tree):
+            return True
+        if node.data == 'op_compound_value' and str(node.children[0]).startswith(_volatile_functions):
+            return False
+        return all(ExprCompiler._is_constant(child) for child in node.children)
+
+    def _fold(self, node) -> CompiledExpr:
+        try:
+            if isinstance(node, Tree):
+                value = self._transformer.transform(node)
+            else:
+                value = self._compile_token(node).value
+            return _ConstNode(value)
+        except VisitError as e:
+            error = e.orig_exc
+        except Exception as e:
+            error = e
+
+        # Constant that fails is raised at evaluation, the same as in ExprTransformer.
+        def raise_error(dot):
+            raise error
+
+        return raise_error
+
+    def _compile_token(self, token: Token):
+        if token.type == 'OP_FIELD':
+            return _FieldNode(token.value)
+        try:
+            method = getattr(self._transformer, token.type)
+        except AttributeError:
+            return _ConstNode(token)
+        return _ConstNode(method(token))
+
+    def _compile(self, node) -> CompiledExpr:
+        if node is None:
+            return _ConstNode(None)
+
+        if isinstance(node, Token):
+            return self._compile_token(node)
+
+        if self._is_constant(node):
+            return self._fold(node)
+
+        children = [self._compile(child) for child in node.children]
+        method = getattr(self, f"_compile_{node.data}", None)
+        if method is not None:
+            return method(children)
+
+        return self._compile_operation(node.data, children)
+
+    def _compile_operation(self, name: str, children: List[CompiledExpr]) -> CompiledExpr:
+        # Operations that do not use dot accessor are run by transformer with evaluated arguments.
+        operation = getattr(self._transformer, name)
+
+        def evaluate(dot):
+            return operation([child(dot) for child in children])
+
+        return evaluate
+
+    @staticmethod
+    def _compile_expr(children):
+        return children[0]
+
+    @staticmethod
+    def _compile_op_field_sig(children):
+        return children[0]
+
+    @staticmethod
+    def _compile_op_value_sig(children):
+        return children[0]
+
+    @staticmethod
+    def _compile_and_expr(children):
+        left, _, right = children
+
+        def evaluate(dot):
+            # Both sides are evaluated, as in transformer.
+            value1 = left(dot)
+            value2 = right(dot)
+            return value1 and value2
+
+        return evaluate
+
+    @staticmethod
+    def _compile_or_expr(children):
+        left, _, right = children
+
+        def evaluate(dot):
+            value1 = left(dot)
+            value2 = right(dot)
+            return value1 or value2
+
+        return evaluate
+
+    @staticmethod
+    def _compile_op_value_or_field(children):
+        if len(children) != 1:
+            raise ValueError("Expected 1 arg.")
+
+        child = children[0]
+        if isinstance(child, _FieldNode):
+            return _field_value(child)
+        return child
+
+    def _compile_op_condition(self, children):
+        left, operation, right = children
+        operation = operation.value
+        compare = ExprTransformer._compare
+
+        if isinstance(left, _FieldNode) and not isinstance(right, _FieldNode):
+            # Field comparison resolved to value comparison. Field.__eq__ compares `other == value`.
+            value_of = _field_value(left)
+
+            if operation == '==':
+                return lambda dot: right(dot) == value_of(dot)
+            if operation == '!=':
+                return lambda dot: not (right(dot) == value_of(dot))
+            if operation == '>':
+                return lambda dot: value_of(dot) > right(dot)
+            if operation in ('>=', '=>'):
+                return lambda dot: value_of(dot) >= right(dot)
+            if operation == '<':
+                return lambda dot: value_of(dot) < right(dot)
+            if operation in ('<=', '=<'):
+                return lambda dot: value_of(dot) <= right(dot)
+
+        return lambda dot: compare(operation, left(dot), right(dot))
+
+    def _compile_op_field_eq_field(self, children):
+        left, operation, right = children
+        operation = operation.value
+        compare = ExprTransformer._compare
+        return lambda dot: compare(operation, left(dot), right(dot))
+
+    def _compile_op_compound_value(self, children):
+        # Only compound values that depend on fields or time get here.
+        return self._compile_operation('op_compound_value', children)
+
+    @staticmethod
+    def _field_exists(field: _FieldNode, dot: DotAccessor) -> bool:
+        try:
+            field.getter(dot)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+    def _compile_op_exists(self, children):
+        field = children[0]
+        return lambda dot: self._field_exists(field, dot)
+
+    def _compile_op_not_exists(self, children):
+        field = children[0]
+        return lambda dot: not self._field_exists(field, dot)
+
+    def _compile_op_empty(self, children):
+        field = children[0]
+
+        if not isinstance(field, _FieldNode):
+            def evaluate(dot):
+                # Transformer reads `label` of value that is not a field.
+                return field(dot).label
+            return evaluate
+
+        def evaluate(dot):
+            try:
+                value = field.getter(dot)
+            except (KeyError, TypeError):
+                return True
+            return value is None or (isinstance(value, (str, list, dict)) and len(value) == 0)
+
+        return evaluate
+
+    def _compile_op_not_empty(self, children):
+        empty = self._compile_op_empty(children)
+
+        def evaluate(dot):
+            try:
+                return not empty(dot)
+            except AttributeError:
+                return True
+
+        return evaluate
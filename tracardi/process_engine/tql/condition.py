@@ -3,21 +3,24 @@ import asyncio
 from tracardi.service.singleton import Singleton
 from tracardi.service.notation.dot_accessor import DotAccessor
 
-from tracardi.process_engine.tql.parser import Parser
-from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransformer
+from tracardi.process_engine.tql.compiler import ExprCompiler, CompiledExpr
+from tracardi.process_engine.tql.parser import Parser, tree_cache
 
 
 class Condition(metaclass=Singleton):
 
     def __init__(self):
         self.parser = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+        self.compiler = ExprCompiler()
 
     def parse(self, condition):
-        return self.parser.parse(condition)
+        return tree_cache.parse(self.parser, condition)
+
+    def compile(self, condition) -> CompiledExpr:
+        return tree_cache.get((self.compiler, condition), lambda: self.compiler.compile(self.parse(condition)))
 
     async def evaluate(self, condition, dot: DotAccessor):
-        # todo cache tree
-        tree = self.parse(condition)
+        expr = self.compile(condition)
         await asyncio.sleep(0)
-        return ExprTransformer(dot=dot).transform(tree)
+        return expr(dot)
 
@@ -1,20 +1,104 @@
-from typing import List
+from operator import add, sub, mul, truediv, neg
+from typing import List, Callable, Any
+
 from dotty_dict import dotty
-from tracardi.process_engine.tql.parser import Parser
+from lark import Token
+
+from tracardi.process_engine.tql.parser import Parser, tree_cache
 from tracardi.process_engine.tql.transformer.calc_transformer import CalcTransformer
 from tracardi.service.notation.dot_accessor import DotAccessor
 
 grammar = Parser.read('grammar/math_expr.lark')
 
+CompiledEquation = Callable[[DotAccessor, dict], Any]
+
+
+class CalcCompiler:
+
+    """
+    Compiles calc_dsl tree into closures that take DotAccessor and variables and do the same
+    calculations as CalcTransformer.
+    """
+
+    _operations = {
+        "add": add,
+        "sub": sub,
+        "mul": mul,
+        "div": truediv
+    }
+
+    def compile(self, tree) -> CompiledEquation:
+        if isinstance(tree, Token):
+            # Single token is a number.
+            value = float(tree)
+            return lambda dot, vars: value
+
+        if tree.data == 'number':
+            value = float(tree.children[0])
+            return lambda dot, vars: value
+
+        if tree.data == 'var':
+            name = tree.children[0].value
+
+            def var(dot, vars):
+                try:
+                    return vars[name]
+                except KeyError:
+                    raise Exception(f"Variable `{name}` not found")
+
+            return var
+
+        if tree.data == 'field':
+            field = tree.children[0].value
+            return lambda dot, vars: CalcTransformer.to_number(field, dot[field])
+
+        if tree.data == 'neg':
+            value = self.compile(tree.children[0])
+            return lambda dot, vars: neg(value(dot, vars))
+
+        if tree.data == 'assign_var':
+            token, value = tree.children
+            value = self.compile(value)
+            name = token.value
+
+            if token.type == "NAME":
+                def assign_var(dot, vars):
+                    result = value(dot, vars)
+                    vars[name] = result
+                    return result
+            else:
+                def assign_var(dot, vars):
+                    result = value(dot, vars)
+                    dot[name] = result
+                    return result
+
+            return assign_var
+
+        if tree.data in self._operations:
+            operation = self._operations[tree.data]
+            left, right = (self.compile(child) for child in tree.children)
+            return lambda dot, vars: operation(left(dot, vars), right(dot, vars))
+
+        raise ValueError(f"Unknown calculation `{tree.data}`.")
+
+
+# Parser tables are built once per process.
+_parser = Parser(grammar, parser="lalr", start='start')
+_compiler = CalcCompiler()
+
 
 class MathEquation:
 
     def __init__(self, dot: DotAccessor):
         self.dot = dot
-        self.parser = Parser(grammar,
-                             parser="lalr",
-                             transformer=CalcTransformer(dot=self.dot),
-                             start='start')
+        self.vars = {}
+
+    @staticmethod
+    def compile(line: str) -> CompiledEquation:
+        """
+        Returns compiled equation. Equations are compiled once and cached.
+        """
+        return tree_cache.get((_compiler, line), lambda: _compiler.compile(_parser.parse(line)))
 
     def evaluate(self, equation: List[str]):
         if isinstance(equation, str):
@@ -22,14 +106,14 @@ class MathEquation:
 
         results_per_line = []
         for line in equation:
-            results_per_line.append(self.parser.parse(line))
+            results_per_line.append(self.compile(line)(self.dot, self.vars))
 
         return results_per_line
 
     def get_variables(self):
-        if self.parser.transformer.vars:
+        if self.vars:
             dot = dotty()
-            for key, value in self.parser.transformer.vars.items():
+            for key, value in self.vars.items():
                 dot[key] = value
             return dot.to_dict()
         return {}
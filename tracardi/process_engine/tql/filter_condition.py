@@ -3,7 +3,7 @@ import asyncio
 from tracardi.process_engine.tql.transformer.filter_transformer import FilterTransformer
 from tracardi.service.singleton import Singleton
 from tracardi.service.notation.dot_accessor import DotAccessor
-from tracardi.process_engine.tql.parser import Parser
+from tracardi.process_engine.tql.parser import Parser, tree_cache
 
 
 class FilterCondition(metaclass=Singleton):
@@ -12,10 +12,9 @@ class FilterCondition(metaclass=Singleton):
         self.parser = Parser(Parser.read('grammar/filter_condition.lark'), start='expr')
 
     def parse(self, condition):
-        return self.parser.parse(condition)
+        return tree_cache.parse(self.parser, condition)
 
     async def evaluate(self, condition, dot: DotAccessor):
-        # todo cache tree
         tree = self.parse(condition)
         await asyncio.sleep(0)
         return FilterTransformer(dot=dot).transform(tree)
@@ -1,5 +1,10 @@
 import os
-from lark import Lark
+from collections import OrderedDict
+from typing import Callable, Any
+
+from lark import Lark, Tree
+
+from tracardi.config import memory_cache
 
 _local_dir = os.path.dirname(__file__)
 
@@ -25,3 +30,48 @@ class Parser:
     def parse(self, query):
         return self.base_parser.parse(query)
 
+
+class TreeCache:
+
+    """
+    Bounded LRU cache of parsed trees keyed by parser and query text. Trees are shared, so they must
+    not be changed by transformers. Any other value derived from query text (e.g. compiled expression)
+    can be cached with `get`.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._trees = OrderedDict()
+
+    def get(self, key, factory: Callable[[], Any]):
+        value = self._trees.get(key)
+        if value is not None:
+            self.hits += 1
+            self._trees.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = factory()
+        self._trees[key] = value
+        if len(self._trees) > self.max_size:
+            self._trees.popitem(last=False)
+        return value
+
+    def parse(self, parser: Parser, query: str) -> Tree:
+        return self.get((parser, query), lambda: parser.parse(query))
+
+    def clear(self):
+        self._trees.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._trees),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+tree_cache = TreeCache(max_size=memory_cache.tql_cache_size)
@@ -26,7 +26,10 @@ class CalcTransformer(TransformerNamespace):
         return value
 
     def field(self, field):
-        value = self._dot[field]
+        return self.to_number(field, self._dot[field])
+
+    @staticmethod
+    def to_number(field, value):
         if isinstance(value, str):
             try:
                 value = float(value)
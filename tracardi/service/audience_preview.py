@@ -0,0 +1,90 @@
+from time import monotonic
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from tracardi.process_engine.tql.columnar import ColumnarCompiler, Columns, ColumnarExpr
+from tracardi.process_engine.tql.compiler import ExprCompiler
+from tracardi.process_engine.tql.condition import Condition
+from tracardi.process_engine.tql.parser import tree_cache
+from tracardi.service.storage.driver import storage
+
+_compiler = ColumnarCompiler()
+
+# Elasticsearch max result window.
+_max_sample_size = 10000
+
+
+class AudiencePreview(BaseModel):
+    total: int
+    sampled: int
+    matched: int
+    errors: int
+    audience_size: int
+    took: float
+
+
+def compile_condition(condition: str) -> ColumnarExpr:
+    return tree_cache.get((_compiler, condition), lambda: _compiler.compile(Condition().parse(condition)))
+
+
+def _get_source(condition: str) -> Optional[List[str]]:
+    # Only top level profile fields read by the condition are loaded.
+    fields = {'id'}
+    for label in ExprCompiler.get_fields(Condition().parse(condition)):
+        if label.startswith('profile@'):
+            path = label[len('profile@'):]
+            if path == '...':
+                return None
+            fields.add(path.split('.')[0])
+    return sorted(fields)
+
+
+def evaluate(condition: str, records: List[dict]) -> AudiencePreview:
+    """
+    Evaluates profile condition against profile records. Audience size equals number of matched records.
+    """
+    start = monotonic()
+    matched, errors = compile_condition(condition)(Columns(records))
+    matched = int((matched & ~errors).sum())
+    return AudiencePreview(
+        total=len(records),
+        sampled=len(records),
+        matched=matched,
+        errors=int(errors.sum()),
+        audience_size=matched,
+        took=(monotonic() - start) * 1000
+    )
+
+
+async def preview(condition: str, sample_size: int = 10000, full: bool = False) -> AudiencePreview:
+    """
+    Returns number of profiles that match the segment condition. Condition is evaluated on a random sample
+    of profiles and the audience size is extrapolated to all profiles. With full=True all profiles are evaluated
+    page by page.
+    Took is time in milliseconds.
+    """
+    start = monotonic()
+    source = _get_source(condition)
+    total = (await storage.driver.profile.count())['count']
+
+    if full:
+        # Pages are evaluated one by one so only one page of profiles is kept in memory.
+        result = AudiencePreview(total=0, sampled=0, matched=0, errors=0, audience_size=0, took=0)
+        hits = await storage.driver.profile.load_profile_page(limit=_max_sample_size, source=source)
+        while hits:
+            page = evaluate(condition, [hit['_source'] for hit in hits])
+            result.sampled += page.sampled
+            result.matched += page.matched
+            result.errors += page.errors
+            hits = await storage.driver.profile.load_profile_page(start_after=hits[-1]['sort'][0],
+                                                                  limit=_max_sample_size, source=source)
+    else:
+        records = await storage.driver.profile.load_profile_sample(min(sample_size, _max_sample_size), source)
+        result = evaluate(condition, records)
+
+    result.total = total
+    if result.sampled:
+        result.audience_size = round(result.matched * total / result.sampled)
+    result.took = (monotonic() - start) * 1000
+    return result
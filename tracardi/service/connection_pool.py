@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import asynccontextmanager
+from time import time
+from typing import Any, Dict, List, AsyncIterator
+
+from pydantic import BaseModel
+
+from tracardi.config import tracardi
+from tracardi.exceptions.log_handler import log_handler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class ConnectionPoolFactory:
+
+    """
+    Creates, checks and closes connection pools of one database client. Name identifies pools of the factory
+    in the registry.
+    """
+
+    name = None  # type: str
+
+    async def create(self, credentials: BaseModel, max_size: int, **options) -> Any:
+        raise NotImplementedError()
+
+    async def check(self, pool) -> bool:
+        return True
+
+    async def close(self, pool):
+        pass
+
+
+class _PoolEntry:
+
+    __slots__ = ("key", "pool", "factory", "leases", "used_at", "checked_at", "retired")
+
+    def __init__(self, key: tuple, pool, factory: ConnectionPoolFactory):
+        self.key = key
+        self.pool = pool
+        self.factory = factory
+        self.leases = 0
+        self.used_at = time()
+        self.checked_at = self.used_at
+        self.retired = False
+
+
+class ConnectionPoolRegistry:
+
+    """
+    Process-level registry of long-lived database connection pools used by connector plugins and endpoints.
+    Pools are keyed by factory name, resource id and hash of credentials and options, so a new pool is created
+    when resource credentials change. Concurrent requests for a missing pool share one pool creation.
+
+    Pool is leased with `acquire`. Pool is checked when it was not checked for `check_interval` seconds and
+    replaced if the check fails. Pools not leased for `idle_ttl` seconds are closed.
+    """
+
+    def __init__(self, max_size: int = 10, idle_ttl: float = 300, check_interval: float = 30,
+                 eviction_interval: float = 5):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.check_interval = check_interval
+        self.eviction_interval = eviction_interval
+        self._pools = {}  # type: Dict[tuple, _PoolEntry]
+        self._creating = {}  # type: Dict[tuple, asyncio.Task]
+        self._evicted_at = time()
+
+    @staticmethod
+    def _get_key(factory: ConnectionPoolFactory, resource_id: str, credentials: BaseModel, options: dict) -> tuple:
+        data = json.dumps({"credentials": credentials.dict(), "options": options}, sort_keys=True, default=str)
+        return factory.name, resource_id, hashlib.sha1(data.encode()).hexdigest()
+
+    async def _create(self, key: tuple, factory: ConnectionPoolFactory, credentials: BaseModel,
+                      options: dict) -> _PoolEntry:
+        pool = await factory.create(credentials, self.max_size, **options)
+        entry = _PoolEntry(key, pool, factory)
+        self._pools[key] = entry
+        logger.debug(f"Connection pool {key[0]} for resource {key[1]} created.")
+        return entry
+
+    async def _check(self, entry: _PoolEntry) -> bool:
+        entry.checked_at = time()
+        try:
+            return await entry.factory.check(entry.pool) is True
+        except Exception as e:
+            logger.warning(f"Connection pool {entry.key[0]} for resource {entry.key[1]} failed health check. "
+                           f"Details: {repr(e)}")
+            return False
+
+    async def _get(self, key: tuple, factory: ConnectionPoolFactory, credentials: BaseModel,
+                   options: dict) -> _PoolEntry:
+        entry = self._pools.get(key)
+        if entry is not None and time() - entry.checked_at >= self.check_interval:
+            if not await self._check(entry):
+                await self._retire([entry])
+                entry = None
+
+        if entry is None or entry.retired:
+            if key not in self._creating:
+                task = asyncio.create_task(self._create(key, factory, credentials, options))
+                self._creating[key] = task
+                task.add_done_callback(lambda _task: self._creating.pop(key, None)
+                                       if self._creating.get(key) is _task else None)
+            entry = await asyncio.shield(self._creating[key])
+
+        return entry
+
+    @asynccontextmanager
+    async def acquire(self, resource_id: str, factory: ConnectionPoolFactory, credentials: BaseModel,
+                      **options) -> AsyncIterator[Any]:
+        """
+        Leases connection pool for the resource. Pool must not be used after the context exits.
+        """
+        key = self._get_key(factory, resource_id, credentials, options)
+        entry = await self._get(key, factory, credentials, options)
+        entry.leases += 1
+        try:
+            yield entry.pool
+        finally:
+            entry.leases -= 1
+            entry.used_at = time()
+            if entry.retired and entry.leases == 0:
+                await self._close([entry])
+            elif time() - self._evicted_at >= self.eviction_interval:
+                await self.evict()
+
+    async def _retire(self, entries: List[_PoolEntry]):
+        # Retired pool is removed from the registry and closed when it is not leased any more.
+        closed = []
+        for entry in entries:
+            if self._pools.get(entry.key) is entry:
+                del self._pools[entry.key]
+            entry.retired = True
+            if entry.leases == 0:
+                closed.append(entry)
+        await self._close(closed)
+
+    @staticmethod
+    async def _close(entries: List[_PoolEntry]):
+        results = await asyncio.gather(*[entry.factory.close(entry.pool) for entry in entries],
+                                       return_exceptions=True)
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                logger.error(f"Could not close connection pool {entry.key[0]} for resource {entry.key[1]}. "
+                             f"Details: {repr(result)}")
+            else:
+                logger.debug(f"Connection pool {entry.key[0]} for resource {entry.key[1]} closed.")
+
+    async def evict(self):
+        """
+        Closes pools that were not leased for idle_ttl seconds.
+        """
+        self._evicted_at = time()
+        expire_before = self._evicted_at - self.idle_ttl
+        await self._retire([entry for entry in self._pools.values()
+                            if entry.leases == 0 and entry.used_at < expire_before])
+
+    async def close(self):
+        """
+        Closes all pools. Leased pools are closed when they are released.
+        """
+        await self._retire(list(self._pools.values()))
+
+    def get_stats(self) -> dict:
+        return {
+            "pools": len(self._pools),
+            "leases": sum(entry.leases for entry in self._pools.values())
+        }
+
+
+connection_pools = ConnectionPoolRegistry(max_size=tracardi.db_pool_max_size,
+                                          idle_ttl=tracardi.db_pool_idle_ttl,
+                                          check_interval=tracardi.db_pool_check_interval)
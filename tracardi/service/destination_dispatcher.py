@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import List, Optional, Dict
+
+from tracardi.config import tracardi
+from tracardi.domain.console import Console
+from tracardi.domain.destination import Destination
+from tracardi.domain.event import Event
+from tracardi.exceptions.exception_service import get_traceback
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.console_log import ConsoleLog
+from tracardi.service.destination_manager import DestinationManager
+from tracardi.service.storage.factory import StorageForBulk
+from tracardi.service.track_metrics import track_metrics
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+OVERFLOW_DROP = 'drop'
+OVERFLOW_DROP_OLDEST = 'drop-oldest'
+OVERFLOW_BLOCK = 'block'
+
+
+class DestinationJob:
+
+    """
+    Data sent to destinations later. Profile and session are copied when the job is created, so changes made
+    after the job was queued are not sent.
+    """
+
+    def __init__(self, manager: DestinationManager, profile_id: str, events: List[Event], debug: bool = False):
+        self.manager = manager.snapshot()
+        self.profile_id = profile_id
+        self.events = list(events)
+        self.debug = debug
+        self.console_log = ConsoleLog()
+
+
+class DestinationDispatcher:
+
+    """
+    Sends profile changes to destinations in the background. Jobs are put on a bounded in-process queue and
+    drained by a pool of workers. Each destination has its own concurrency limit and every send has a timeout.
+    When the queue is full the job is dropped (`drop`), the oldest job is dropped (`drop-oldest`) or
+    the caller waits for a free slot (`block`).
+    """
+
+    def __init__(self, workers: int = 4, queue_size: int = 1000, destination_concurrency: int = 10,
+                 timeout: float = 30, overflow: str = OVERFLOW_DROP):
+        if overflow not in (OVERFLOW_DROP, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK):
+            raise ValueError(f"Unknown destination queue overflow policy `{overflow}`.")
+
+        self.workers = workers
+        self.queue_size = queue_size
+        self.destination_concurrency = destination_concurrency
+        self.timeout = timeout
+        self.overflow = overflow
+        self.stats = defaultdict(int)  # type: Dict[str, int]
+        self._queue = None  # type: Optional[asyncio.Queue]
+        self._workers = []  # type: List[asyncio.Task]
+        self._limits = {}  # type: Dict[str, asyncio.Semaphore]
+
+    def _start(self):
+        # Queue and workers are created lazily, so they are bound to the running loop.
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def put(self, job: DestinationJob):
+        self._start()
+
+        if self.overflow == OVERFLOW_BLOCK:
+            await self._queue.put(job)
+        else:
+            if self._queue.full():
+                self.stats['dropped'] += 1
+                if self.overflow == OVERFLOW_DROP:
+                    logger.warning(f"Destination queue is full. Job for profile {job.profile_id} dropped.")
+                    return
+                dropped = self._queue.get_nowait()  # type: DestinationJob
+                self._queue.task_done()
+                logger.warning(f"Destination queue is full. Oldest job for profile {dropped.profile_id} dropped.")
+            self._queue.put_nowait(job)
+
+        self.stats['queued'] += 1
+
+    def _get_limit(self, destination_id: str) -> asyncio.Semaphore:
+        if destination_id not in self._limits:
+            self._limits[destination_id] = asyncio.Semaphore(self.destination_concurrency)
+        return self._limits[destination_id]
+
+    async def _send(self, job: DestinationJob, destination: Destination):
+        async with self._get_limit(destination.id):
+            try:
+                await asyncio.wait_for(
+                    job.manager.send_to_destination(destination, job.profile_id, job.events, job.debug),
+                    timeout=self.timeout)
+                self.stats['sent'] += 1
+            except asyncio.TimeoutError as e:
+                self.stats['timeouts'] += 1
+                message = f"Destination {destination.name} timed out after {self.timeout}s."
+                logger.error(message)
+                self._log_error(job, message, e)
+            except Exception as e:
+                self.stats['errors'] += 1
+                message = f"Destination {destination.name} returned an error: {str(e)}"
+                logger.error(message)
+                self._log_error(job, message, e)
+
+    @staticmethod
+    def _log_error(job: DestinationJob, message: str, e: Exception):
+        job.console_log.append(Console(
+            profile_id=job.profile_id,
+            origin='destination',
+            class_name='DestinationDispatcher',
+            module=__name__,
+            type='error',
+            message=message,
+            traceback=get_traceback(e)
+        ))
+
+    async def _run(self, job: DestinationJob):
+        with track_metrics.stage("destinations"):
+            destinations = [destination async for destination in job.manager.load_destinations()]
+            await asyncio.gather(*[self._send(job, destination) for destination in destinations])
+
+        # Errors are reported the same way as errors of destinations sent during the request.
+        if job.console_log:
+            await StorageForBulk(list(job.console_log.get_encoded())).index('console-log').save()
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Could not dispatch data to destinations: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def join(self):
+        """
+        Waits until all queued jobs are processed.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self):
+        await self.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['pending'] = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+
+destination_dispatcher = DestinationDispatcher(
+    workers=tracardi.destination_workers,
+    queue_size=tracardi.destination_queue_size,
+    destination_concurrency=tracardi.destination_concurrency,
+    timeout=tracardi.destination_timeout,
+    overflow=tracardi.destination_queue_overflow
+)
@@ -28,8 +28,19 @@ class DestinationManager:
         self.profile = profile
         self.session = session
 
+    def snapshot(self) -> 'DestinationManager':
+        """
+        Returns manager with its own copies of profile and session data.
+        """
+        manager = DestinationManager(list(self.delta),
+                                     self.profile.copy(deep=True) if self.profile is not None else None,
+                                     self.session.copy(deep=True) if self.session is not None else None)
+        # Namespaces are converted now, not when the data is sent.
+        _ = manager.dot.profile, manager.dot.session
+        return manager
+
     @staticmethod
-    async def _load_destinations():
+    async def load_destinations():
         for destination in await storage.driver.destination.load_all():
             yield DestinationRecord(**destination).decode()
 
@@ -41,48 +52,49 @@ class DestinationManager:
         return ".".join(parts[:-1]), parts[-1]
 
     async def send_data(self, profile_id, events, debug):
-
-        template = DictTraverser(self.dot, default=None)
-
-        async for destination in self._load_destinations():  # type: Destination
-            module, class_name = self._get_class_and_module(destination.destination.package)
-            module = import_package(module)
-            destination_class = load_callable(module, class_name)
-
-            # Load resource
-            resource = await storage.driver.resource.load(destination.resource.id)
-
-            if resource.enabled is False:
-                raise ConnectionError(f"Can't connect to disabled resource: {resource.name}.")
-
-            # Pass resource to destination class
-
-            destination_instance = destination_class(debug, resource, destination)
-
-            if isinstance(destination_instance, Connector):
-                if destination.condition:
-                    condition = Condition()
-                    condition_result = await condition.evaluate(destination.condition, self.dot)
-                    if not condition_result:
-                        logger.info(f"Condition not met for destination {destination.name}. Data was not sent to "
-                                    f"this destination.")
-                        return
-
-                result = template.reshape(reshape_template=destination.mapping)
-
-                # Run postponed destination sync
-                if tracardi.postpone_destination_sync > 0:
-                    postponed_call = PostponedCall(
-                        profile_id,
-                        destination_instance.run,
-                        ApiInstance().id,
-                        result,  # *args
-                        self.delta,
-                        self.profile,
-                        self.session,
-                        events
-                    )
-                    postponed_call.wait = tracardi.postpone_destination_sync
-                    postponed_call.run(asyncio.get_running_loop())
-                else:
-                    await destination_instance.run(result, self.delta, self.profile, self.session, events)
+        async for destination in self.load_destinations():  # type: Destination
+            await self.send_to_destination(destination, profile_id, events, debug)
+
+    async def send_to_destination(self, destination: Destination, profile_id, events, debug):
+        module, class_name = self._get_class_and_module(destination.destination.package)
+        module = import_package(module)
+        destination_class = load_callable(module, class_name)
+
+        # Load resource
+        resource = await storage.driver.resource.load(destination.resource.id)
+
+        if resource.enabled is False:
+            raise ConnectionError(f"Can't connect to disabled resource: {resource.name}.")
+
+        # Pass resource to destination class
+
+        destination_instance = destination_class(debug, resource, destination)
+
+        if isinstance(destination_instance, Connector):
+            if destination.condition:
+                condition = Condition()
+                condition_result = await condition.evaluate(destination.condition, self.dot)
+                if not condition_result:
+                    logger.info(f"Condition not met for destination {destination.name}. Data was not sent to "
+                                f"this destination.")
+                    return
+
+            template = DictTraverser(self.dot, default=None)
+            result = template.reshape(reshape_template=destination.mapping)
+
+            # Run postponed destination sync
+            if tracardi.postpone_destination_sync > 0:
+                postponed_call = PostponedCall(
+                    profile_id,
+                    destination_instance.run,
+                    ApiInstance().id,
+                    result,  # *args
+                    self.delta,
+                    self.profile,
+                    self.session,
+                    events
+                )
+                postponed_call.wait = tracardi.postpone_destination_sync
+                postponed_call.run(asyncio.get_running_loop())
+            else:
+                await destination_instance.run(result, self.delta, self.profile, self.session, events)
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Dict, Tuple, Any, Optional, Set
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from tracardi.config import tracardi
+from tracardi.exceptions.log_handler import log_handler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class _SessionEntry:
+
+    __slots__ = ("session", "loop", "requests", "evicted")
+
+    def __init__(self, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+        self.session = session
+        self.loop = weakref.ref(loop)
+        self.requests = 0
+        self.evicted = False
+
+
+class _Request:
+
+    """
+    Request sent with a shared session. Used as `async with session.get(...) as response` or awaited.
+    Shared session is not closed while the request is in flight. Awaited request reads the response body before
+    the request is finished, so the body is available after the session is closed.
+    """
+
+    def __init__(self, manager: 'HttpSessionManager', method: str, url, kwargs: dict):
+        self._manager = manager
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+        self._entry = None  # type: Optional[_SessionEntry]
+        self._response = None  # type: Optional[aiohttp.ClientResponse]
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._entry = self._manager.acquire(str(self._url), self._kwargs.get('ssl'))
+        try:
+            self._response = await self._entry.session.request(self._method, self._url, **self._kwargs)
+        except BaseException:
+            self._manager.release(self._entry)
+            raise
+        return self._response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self._response.release()
+        finally:
+            self._manager.release(self._entry)
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def _send(self) -> aiohttp.ClientResponse:
+        entry = self._manager.acquire(str(self._url), self._kwargs.get('ssl'))
+        try:
+            response = await entry.session.request(self._method, self._url, **self._kwargs)
+            await response.read()
+            return response
+        finally:
+            self._manager.release(entry)
+
+
+class HttpSession:
+
+    """
+    Used instead of aiohttp.ClientSession in `async with` blocks. Requests are sent with shared keep-alive
+    sessions of HttpSessionManager. Headers, timeout and ssl setting of this object are default request
+    parameters. Exiting the block does not close any connection.
+    """
+
+    def __init__(self, manager: 'HttpSessionManager', headers: dict = None,
+                 timeout: aiohttp.ClientTimeout = None, ssl=None):
+        self._manager = manager
+        self._headers = headers
+        self._timeout = timeout
+        self._ssl = ssl
+
+    async def __aenter__(self) -> 'HttpSession':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def request(self, method: str, url, **kwargs) -> _Request:
+        if self._headers:
+            kwargs['headers'] = {**self._headers, **kwargs['headers']} if kwargs.get('headers') else self._headers
+        if self._timeout is not None and kwargs.get('timeout') is None:
+            kwargs['timeout'] = self._timeout
+        if self._ssl is not None and kwargs.get('ssl') is None:
+            kwargs['ssl'] = self._ssl
+
+        return _Request(self._manager, method, url, kwargs)
+
+    def get(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_GET, url, **kwargs)
+
+    def post(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_POST, url, **kwargs)
+
+    def put(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_PUT, url, **kwargs)
+
+    def patch(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_PATCH, url, **kwargs)
+
+    def delete(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_DELETE, url, **kwargs)
+
+    def head(self, url, **kwargs) -> _Request:
+        return self.request(aiohttp.hdrs.METH_HEAD, url, **kwargs)
+
+
+class HttpSessionManager:
+
+    """
+    Process-level keep-alive aiohttp sessions shared by outbound HTTP connectors, one per event loop, scheme,
+    host, port and ssl setting. Sessions keep at most `limit` connections, cache DNS for `dns_ttl` seconds and
+    use `timeout` seconds as default total timeout. Sessions do not store cookies, so cookies of one call never
+    leak to other calls.
+
+    At most `max_sessions` sessions are kept. The least recently used one is evicted and closed when its
+    requests in flight finished. Sessions of closed event loops are dropped.
+    """
+
+    def __init__(self, limit: int = 100, dns_ttl: int = 300, keepalive_timeout: float = 30, timeout: float = 300,
+                 max_sessions: int = 256):
+        self.limit = limit
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()  # type: OrderedDict[Tuple, _SessionEntry]
+        self._closing = set()  # type: Set[asyncio.Task]
+
+    @staticmethod
+    def _get_ssl_key(ssl) -> Any:
+        if ssl is None or isinstance(ssl, bool):
+            return ssl
+        # SSL contexts are compared by identity, they should be created once.
+        return id(ssl)
+
+    def _create(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=self.limit,
+                                         ttl_dns_cache=self.dns_ttl,
+                                         keepalive_timeout=self.keepalive_timeout)
+        return aiohttp.ClientSession(connector=connector,
+                                     cookie_jar=aiohttp.DummyCookieJar(),
+                                     timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    def _close_entry(self, entry: _SessionEntry):
+        # Must be called in the loop of the session.
+        task = asyncio.create_task(entry.session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _evict(self, entry: _SessionEntry):
+        entry.evicted = True
+        if entry.requests > 0:
+            # Closed by release when the last request finished.
+            return
+
+        loop = entry.loop()
+        if loop is None or loop.is_closed():
+            return
+        if loop is asyncio.get_running_loop():
+            self._close_entry(entry)
+        else:
+            loop.call_soon_threadsafe(self._close_entry, entry)
+
+    def _drop_closed_loops(self):
+        for key in [key for key, entry in self._sessions.items()
+                    if entry.loop() is None or entry.loop().is_closed()]:
+            del self._sessions[key]
+
+    def acquire(self, url: str, ssl=None) -> _SessionEntry:
+        """
+        Returns shared session for the url and marks it as used by one more request. Must be released with
+        release when the request finished. Session must not be closed by the caller.
+        """
+        loop = asyncio.get_running_loop()
+        parts = urlsplit(url)
+        key = (id(loop), parts.scheme, parts.hostname, parts.port, self._get_ssl_key(ssl))
+
+        entry = self._sessions.get(key)
+        if entry is None or entry.loop() is not loop or entry.session.closed:
+            if entry is not None:
+                self._evict(entry)
+            self._drop_closed_loops()
+            entry = _SessionEntry(self._create(), loop)
+            self._sessions[key] = entry
+            while len(self._sessions) > self.max_sessions:
+                _, outdated = self._sessions.popitem(last=False)
+                self._evict(outdated)
+        self._sessions.move_to_end(key)
+
+        entry.requests += 1
+        return entry
+
+    def release(self, entry: _SessionEntry):
+        entry.requests -= 1
+        if entry.evicted and entry.requests == 0:
+            self._close_entry(entry)
+
+    def session(self, headers: dict = None, timeout: aiohttp.ClientTimeout = None, ssl=None) -> HttpSession:
+        return HttpSession(self, headers=headers, timeout=timeout, ssl=ssl)
+
+    async def close(self):
+        """
+        Closes sessions of the running event loop and waits for sessions that are being closed.
+        """
+        loop = asyncio.get_running_loop()
+        keys = [key for key, entry in self._sessions.items() if entry.loop() is loop]
+        for key in keys:
+            await self._sessions.pop(key).session.close()
+        closing = [task for task in self._closing if task.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "requests": sum(entry.requests for entry in self._sessions.values()),
+            "closing": len(self._closing)
+        }
+
+
+http_sessions = HttpSessionManager(limit=tracardi.http_connection_limit,
+                                   dns_ttl=tracardi.http_dns_ttl,
+                                   keepalive_timeout=tracardi.http_keepalive_timeout,
+                                   timeout=tracardi.http_timeout)
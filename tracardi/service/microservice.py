@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from tracardi.domain.credentials import Credentials
 from tracardi.domain.token import Token
 from tracardi.exceptions.exception import ConnectionException
+from tracardi.service.http_client import http_sessions
 
 
 class MicroserviceApi:
@@ -17,7 +18,7 @@ class MicroserviceApi:
         self.timeout = aiohttp.ClientTimeout(total=timeout)
 
     async def authorize(self) -> Token:
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+        async with http_sessions.session(timeout=self.timeout) as session:
             if len(self.url) > 0 and self.url[-1] == '/':
                 token_endpoint = 'token'
             else:
@@ -34,8 +35,8 @@ class MicroserviceApi:
                 raise ConnectionException("Authentication failed", response=response)
 
     async def _call(self, endpoint, method, data):
-        async with aiohttp.ClientSession(timeout=self.timeout,
-                                         headers=self.token.authorization_header()) as session:
+        async with http_sessions.session(timeout=self.timeout,
+                                           headers=self.token.authorization_header()) as session:
             if endpoint[0] == '/':
                 url = f"{self.url}{endpoint}"
             else:
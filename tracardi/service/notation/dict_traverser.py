@@ -1,7 +1,99 @@
-from typing import List, Dict, Union
+import json
+from collections import OrderedDict
+from typing import List, Dict, Union, Tuple, Any
 
-from dotty_dict import dotty
+from dotty_dict.dotty_dict import DottyEncoder
 from .dot_accessor import DotAccessor
+from .dot_path import DotPath, compile_path
+
+# Kinds of template values.
+_PATH = 0  # compiled dot notation
+_VALUE = 1  # constant value
+_DOT = 2  # value read by DotAccessor, e.g. casted `payload@field`
+
+
+class ReshapeTemplate:
+
+    """
+    Reshape template compiled into a flat list of instructions: output path, kind and source of the value,
+    and optional flag. Template is traversed only once.
+    """
+
+    __slots__ = ("instructions",)
+
+    def __init__(self, reshape_template: Union[Dict, List]):
+        self.instructions = []  # type: List[Tuple[DotPath, int, Any, bool]]
+        for key, value, path in self.traverse(reshape_template):
+
+            if key is not None:
+                path = path[:-len(key)-1]
+
+            optional = False
+            if len(key) > 0 and key[-1] == '?':
+                key = key[:-1]
+                optional = True
+
+            if len(path) > 0 and path[-1] == '?':
+                path = path[:-1]
+                optional = True
+
+            self.instructions.append((DotPath('', '', f"{path}.{key}", list_brackets=False),
+                                      *self._compile_value(value),
+                                      optional))
+
+    @staticmethod
+    def _compile_value(value) -> Tuple[int, Any]:
+        if not isinstance(value, str):
+            return _VALUE, value
+        if value.startswith("`") and value.endswith("`"):
+            return _DOT, value
+        path = compile_path(value)
+        if path is None:
+            return _VALUE, value
+        if path.whole:
+            return _DOT, value
+        return _PATH, path
+
+    @classmethod
+    def traverse(cls, value, key=None, path="root"):
+        if isinstance(value, dict):
+            for k, v in value.items():
+                yield from cls.traverse(v, k, path + "." + k)
+        elif isinstance(value, list):
+            for n, v in enumerate(value):
+                k = str(n)
+                yield from cls.traverse(v, k, path + '.' + k)
+        else:
+            yield key, value, path
+
+
+class _TemplateCache:
+
+    """
+    Compiled templates cached by template content, so templates rebuilt on every call (e.g. destination
+    mappings) are compiled once and templates changed in place are compiled again.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._cache = OrderedDict()  # type: OrderedDict[str, ReshapeTemplate]
+
+    def get(self, reshape_template) -> ReshapeTemplate:
+        # Keys are not sorted, order of keys is the order of the reshaped output.
+        key = json.dumps(reshape_template, default=str)
+        compiled = self._cache.get(key)
+        if compiled is not None:
+            self._cache.move_to_end(key)
+            return compiled
+
+        compiled = ReshapeTemplate(reshape_template)
+        self._cache[key] = compiled
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return compiled
+
+
+template_cache = _TemplateCache()
 
 
 class DictTraverser:
@@ -15,58 +107,46 @@ class DictTraverser:
         else:
             self.throw_error = True
 
-    def _get_value(self, path, optional):
+    def _read(self, kind: int, source):
+        if kind == _PATH:
+            return self.dot.read(source)
+        if kind == _VALUE:
+            return source
+        return self.dot[source]
+
+    def _get_value(self, kind: int, source, optional):
         if self.throw_error is True:
             try:
-                return self.dot[path]
+                return self._read(kind, source)
             except KeyError as e:
                 if optional is True:
                     return None
                 raise e
         try:
-            value = self.dot[path]
+            value = self._read(kind, source)
         except KeyError:
             value = self.default
 
         return value
 
     def traverse(self, value, key=None, path="root"):
-        if isinstance(value, dict):
-            for k, v in value.items():
-                yield from self.traverse(v, k, path + "." + k)
-        elif isinstance(value, list):
-            for n, v in enumerate(value):
-                k = str(n)
-                yield from self.traverse(v, k, path + '.' + k)
-        else:
-            yield key, value, path
+        yield from ReshapeTemplate.traverse(value, key, path)
 
     def reshape(self, reshape_template: Union[Dict, List]):
-        out_dot = dotty()
-        for key, value, path in self.traverse(reshape_template):
-
-            if key is not None:
-                path = path[:-len(key)-1]
-
-            optional = False
-            if len(key) > 0 and key[-1] == '?':
-                key = key[:-1]
-                optional = True
-
-            if len(path) > 0 and path[-1] == '?':
-                path = path[:-1]
-                optional = True
+        output = {}
+        for path, kind, source, optional in template_cache.get(reshape_template).instructions:
 
-            value = self._get_value(value, optional)
+            value = self._get_value(kind, source, optional)
 
             if value is None and self.include_none is False:
                 continue
 
             if not value:
                 if not optional:
-                    out_dot[f"{path}.{key}"] = value
+                    path.set(output, value)
             else:
-                out_dot[f"{path}.{key}"] = value
+                path.set(output, value)
 
-        result = out_dot.to_dict()
+        # Output is serialized as json the same way as dotty dict.
+        result = json.loads(json.dumps(output, cls=DottyEncoder))
         return result['root'] if 'root' in result else {}
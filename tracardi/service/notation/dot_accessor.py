@@ -1,8 +1,11 @@
 import re
+from collections.abc import Mapping
 
-from dotty_dict import dotty
+from dotty_dict import dotty, Dotty
 from pydantic import BaseModel
 
+from .dot_path import DotPath, compile_path
+
 dot_notation_regex = re.compile(
     r"(?:payload|profile|event|session|flow|memory)@([\[\]0-9a-zA-a_\-\.]+(?<![\.\[])|\.\.\.)")
 
@@ -11,23 +14,77 @@ class NotDotNotation:
     pass
 
 
+class _Namespace:
+
+    """
+    Data source of DotAccessor, e.g. profile, converted to dotty dict when it is first accessed.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, dot, owner):
+        if dot is None:
+            return self
+        return dot._get_namespace(self.name)
+
+    def __set__(self, dot, value):
+        dot._set_namespace(self.name, value)
+
+
+class _Storage(Mapping):
+
+    """
+    Maps prefixes, e.g. `profile@`, to namespaces of DotAccessor. Namespaces are converted only when read.
+    """
+
+    _prefixes = ('profile@', 'event@', 'payload@', 'session@', 'flow@', 'memory@')
+
+    def __init__(self, dot: 'DotAccessor'):
+        self._dot = dot
+
+    def __getitem__(self, prefix):
+        if prefix not in self._prefixes:
+            raise KeyError(prefix)
+        return self._dot._get_namespace(prefix[:-1])
+
+    def __iter__(self):
+        return iter(self._prefixes)
+
+    def __len__(self):
+        return len(self._prefixes)
+
+
 class DotAccessor:
 
     @staticmethod
     def validate(dot_notation: str):
         return dot_notation_regex.match(dot_notation) is not None
 
+    @staticmethod
+    def _validate_data(data, label):
+        if data is not None and not isinstance(data, (dict, BaseModel)):
+            raise ValueError("Could not convert {} to dict. Expected: None, dict or BaseModel got {}.".format(
+                label, type(data)
+            ))
+
     def _convert(self, data, label):
+        self._validate_data(data, label)
         if data is None:
             return {}
         elif isinstance(data, dict):
             return dotty(data)
-        elif isinstance(data, BaseModel):
-            return dotty(data.dict())
-        else:
-            raise ValueError("Could not convert {} to dict. Expected: None, dict or BaseModel got {}.".format(
-                label, type(data)
-            ))
+        return dotty(data.dict())
+
+    def _get_namespace(self, namespace: str):
+        if namespace not in self._converted:
+            self._converted[namespace] = self._convert(self._data[namespace], namespace)
+        return self._converted[namespace]
+
+    def _set_namespace(self, namespace: str, data):
+        self._data[namespace] = data
+        self._converted[namespace] = self._convert(data, namespace)
+        self.changed.add(namespace)
 
     def get_all(self, dot_notation):
         if dot_notation.startswith('flow@...'):
@@ -45,37 +102,61 @@ class DotAccessor:
 
         return None
 
-    def _get_value(self, dot_notation, prefix):
-        if dot_notation.startswith(prefix):
-            value = dot_notation[len(prefix):]
-            try:
-                if isinstance(value, str):
-                    return self.storage[prefix][value]
-                return value
-            except KeyError:
-                raise KeyError("Invalid dot notation. Could not find value for `{}` in {}...".format(value, prefix))
-            except TypeError as e:
-                raise KeyError("Invalid dot notation. You are trying to access {} "
-                               "when it its value is not a dictionary `{}`.".format(value, str(e)))
-
-        return NotDotNotation()
+    def _get_raw(self, namespace: str):
+        data = self._get_namespace(namespace)
+        return data._data if isinstance(data, Dotty) else data
+
+    def read(self, path: DotPath):
+        """
+        Reads value of compiled dot notation.
+        """
+        try:
+            return path.get(self._get_raw(path.namespace))
+        except KeyError:
+            raise KeyError("Invalid dot notation. Could not find value for `{}` in {}...".format(path.path,
+                                                                                               path.prefix))
+        except TypeError as e:
+            raise KeyError("Invalid dot notation. You are trying to access {} "
+                           "when it its value is not a dictionary `{}`.".format(path.path, str(e)))
+
+    profile = _Namespace('profile')
+    session = _Namespace('session')
+    payload = _Namespace('payload')
+    event = _Namespace('event')
+    flow = _Namespace('flow')
+    memory = _Namespace('memory')
 
     def __init__(self, profile=None, session=None, payload=None, event=None, flow=None, memory=None):
-        self.flow = self._convert(flow, 'flow')
-        self.event = self._convert(event, 'event')
-        self.payload = self._convert(payload, 'payload')
-        self.session = self._convert(session, 'session')
-        self.profile = self._convert(profile, 'profile')
-        self.memory = self._convert(memory, 'memory')
-
-        self.storage = {
-            'profile@': self.profile,
-            'event@': self.event,
-            'payload@': self.payload,
-            'session@': self.session,
-            'flow@': self.flow,
-            'memory@': self.memory,
+        self._data = {
+            'profile': profile,
+            'session': session,
+            'payload': payload,
+            'event': event,
+            'flow': flow,
+            'memory': memory
         }
+        for label, data in self._data.items():
+            self._validate_data(data, label)
+
+        # Namespaces are converted to dotty on first access.
+        self._converted = {}
+        self.changed = set()
+        self.storage = _Storage(self)
+
+    def is_changed(self, namespace: str) -> bool:
+        """
+        Returns True if namespace was written through this accessor.
+        """
+        return namespace in self.changed
+
+    def write_back(self, namespace: str, model: BaseModel) -> BaseModel:
+        """
+        Returns model of the same type as `model` with changes made through this accessor to the namespace.
+        If the namespace was not changed the model is returned as it is.
+        """
+        if not self.is_changed(namespace):
+            return model
+        return type(model)(**getattr(self, namespace))
 
     @staticmethod
     def source(key):
@@ -94,51 +175,25 @@ class DotAccessor:
 
         return None
 
-    def __delitem__(self, key):
-        if key.startswith('profile@'):
-            key = key[len('profile@'):]
-            del self.profile[key]
-        elif key.startswith('session@'):
-            key = key[len('session@'):]
-            del self.session[key]
-        elif key.startswith('flow@'):
-            raise KeyError("Could not set flow, flow is read only")
-        elif key.startswith('payload@'):
-            key = key[len('payload@'):]
-            del self.payload[key]
-        elif key.startswith('event@'):
-            key = key[len('event@'):]
-            del self.event[key]
-        elif key.startswith('memory@'):
-            key = key[len('memory@'):]
-            del self.memory[key]
-        else:
+    def _compile_writable_path(self, key) -> DotPath:
+        path = compile_path(key)
+        if path is None:
             raise ValueError(
                 "Invalid dot notation. Accessor not available. " +
                 "Please start dotted path with one of the accessors: [profile@, session@, payload@, event@] ")
+        if path.namespace == 'flow':
+            raise KeyError("Could not set flow, flow is read only")
+        return path
+
+    def __delitem__(self, key):
+        path = self._compile_writable_path(key)
+        path.delete(self._get_raw(path.namespace))
+        self.changed.add(path.namespace)
 
     def __setitem__(self, key, value):
-        if key.startswith('profile@'):
-            key = key[len('profile@'):]
-            self.profile[key] = self.__getitem__(value) if not isinstance(value, dict) else value
-        elif key.startswith('session@'):
-            key = key[len('session@'):]
-            self.session[key] = self.__getitem__(value) if not isinstance(value, dict) else value
-        elif key.startswith('flow@'):
-            raise KeyError("Could not set flow, flow is read only")
-        elif key.startswith('payload@'):
-            key = key[len('payload@'):]
-            self.payload[key] = self.__getitem__(value) if not isinstance(value, dict) else value
-        elif key.startswith('event@'):
-            key = key[len('event@'):]
-            self.event[key] = self.__getitem__(value) if not isinstance(value, dict) else value
-        elif key.startswith('memory@'):
-            key = key[len('memory@'):]
-            self.memory[key] = self.__getitem__(value) if not isinstance(value, dict) else value
-        else:
-            raise ValueError(
-                "Invalid dot notation. Accessor not available. " +
-                "Please start dotted path with one of the accessors: [profile@, session@, payload@, event@] ")
+        path = self._compile_writable_path(key)
+        path.set(self._get_raw(path.namespace), self.__getitem__(value) if not isinstance(value, dict) else value)
+        self.changed.add(path.namespace)
 
     def __getitem__(self, dot_notation):
         cast = False
@@ -149,17 +204,16 @@ class DotAccessor:
                 dot_notation = dot_notation.strip("`")
                 cast = True
 
-            all_data = self.get_all(dot_notation)
+            path = compile_path(dot_notation)
 
-            if all_data is not None:
-                return all_data
+            if path is not None:
+                if path.whole:
+                    return getattr(self, path.namespace)
 
-            for prefix in self.storage.keys():
-                value = self._get_value(dot_notation, prefix)
-                if not isinstance(value, NotDotNotation):
-                    if value is None:
-                        return None
-                    return self.cast(value) if cast else value
+                value = self.read(path)
+                if value is None:
+                    return None
+                return self.cast(value) if cast else value
 
         return self.cast(dot_notation) if cast else dot_notation
 
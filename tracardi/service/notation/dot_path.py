@@ -0,0 +1,120 @@
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from dotty_dict import dotty
+
+_prefixes = (
+    ('profile@', 'profile'),
+    ('event@', 'event'),
+    ('payload@', 'payload'),
+    ('session@', 'session'),
+    ('flow@', 'flow'),
+    ('memory@', 'memory'),
+)
+
+_list_index = re.compile(r"\[(\d+)\]")
+
+
+class DotPath:
+
+    """
+    Compiled dot notation, e.g. `profile@traits.public.email` or `payload@items[0].id`. Holds the namespace
+    and the path split into keys, so reading and writing is a walk over plain dicts and lists. Keys that are
+    digits index lists, the same as in dotty. Paths with list slices or escaped dots are handled by dotty.
+    """
+
+    __slots__ = ("prefix", "namespace", "path", "whole", "keys")
+
+    def __init__(self, prefix: str, namespace: str, path: str, list_brackets: bool = True):
+        self.prefix = prefix
+        self.namespace = namespace
+        self.path = path
+        self.whole = path.startswith('...')
+        self.keys = None  # type: Optional[Tuple[Tuple[str, Optional[int]], ...]]
+
+        if not self.whole and ':' not in path and '\\' not in path:
+            if list_brackets and '[' in path:
+                path = _list_index.sub(r".\1", path)
+            self.keys = tuple((key, int(key) if key.isdigit() else None) for key in path.split('.'))
+
+    def get(self, data):
+        if self.keys is None:
+            return dotty(data)[self.path]
+
+        for key, index in self.keys:
+            if isinstance(data, dict):
+                if key in data:
+                    data = data[key]
+                elif index is not None and index in data:
+                    data = data[index]
+                else:
+                    raise KeyError(key)
+            elif isinstance(data, list):
+                if index is None:
+                    raise KeyError("List index must be an integer, got {}".format(key))
+                data = data[index]
+            else:
+                # Raises TypeError if data is not a container, the same as dotty.
+                key in data
+                try:
+                    data = data[key]
+                except TypeError:
+                    raise KeyError("List index must be an integer, got {}".format(key))
+        return data
+
+    def set(self, data, value):
+        if self.keys is None:
+            dotty(data)[self.path] = value
+            return
+
+        last = len(self.keys) - 1
+        for position, (key, index) in enumerate(self.keys):
+            if position == last:
+                if index is not None:
+                    self._set_list_index(data, index, value)
+                else:
+                    data[key] = value
+                return
+
+            # Missing or empty containers are created the same way as in dotty.
+            next_item = [] if self.keys[position + 1][1] is not None else {}
+            if index is not None:
+                try:
+                    if not data[index]:
+                        data[index] = next_item
+                except IndexError:
+                    self._set_list_index(data, index, next_item)
+                data = data[index]
+            else:
+                if not data.get(key):
+                    data[key] = next_item
+                data = data[key]
+
+    def delete(self, data):
+        if self.keys is None:
+            del dotty(data)[self.path]
+            return
+
+        for key, index in self.keys[:-1]:
+            data = data[index if index is not None else key]
+        key, index = self.keys[-1]
+        del data[index if index is not None else key]
+
+    @staticmethod
+    def _set_list_index(data, index: int, value):
+        for _ in range(len(data), index + 1):
+            data.append(None)
+        data[index] = value
+
+
+@lru_cache(maxsize=4096)
+def compile_path(dot_notation: str) -> Optional[DotPath]:
+    """
+    Returns compiled dot notation or None if the string is not a dot notation. Compiled paths are shared
+    by the whole process.
+    """
+    for prefix, namespace in _prefixes:
+        if dot_notation.startswith(prefix):
+            return DotPath(prefix, namespace, dot_notation[len(prefix):])
+    return None
@@ -1,6 +1,9 @@
 import re
+from functools import lru_cache
+from typing import Tuple
 
 from .dot_accessor import DotAccessor
+from .dot_path import compile_path, DotPath
 from ..singleton import Singleton
 
 
@@ -10,6 +13,16 @@ class DotTemplate(metaclass=Singleton):
         self._regex = re.compile(r"\{{2}\s*((?:payload|profile|event|session|flow|memory)"
                                 r"@[\[\]0-9a-zA-a_\-\.]+(?<![\.\[]))\s*\}{2}")
 
-    def render(self, template, dot: DotAccessor):
-        return re.sub(self._regex, lambda x: str(dot[x.group(1)]), template)
+    @lru_cache(maxsize=1024)
+    def _compile(self, template: str) -> Tuple[Tuple[str, ...], Tuple[DotPath, ...]]:
+        # Split returns text parts with the captured dot notations between them.
+        parts = self._regex.split(template)
+        return tuple(parts[0::2]), tuple(compile_path(label) for label in parts[1::2])
 
+    def render(self, template, dot: DotAccessor):
+        texts, paths = self._compile(template)
+        output = [texts[0]]
+        for path, text in zip(paths, texts[1:]):
+            output.append(str(dot.read(path)))
+            output.append(text)
+        return "".join(output)
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from time import time
+from typing import Dict, List, Tuple, Hashable, Callable, Awaitable
+from weakref import WeakKeyDictionary
+
+from tracardi.config import tracardi, memory_cache
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.plugin.runner import ActionRunner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class PluginPool:
+
+    """
+    Process-level pool of built action plugins that declared themselves reusable. Instances are kept per flow
+    version and node id, so an instance is always reused with the configuration it was built with. Instance is
+    used by one invocation at a time, concurrent invocations of the same node build more instances. At most
+    `max_idle` instances are kept per node, instances idle longer than `idle_ttl` seconds are closed.
+
+    Plugins may keep data resolved when they were built, e.g. resource credentials. Instances are never reused
+    longer than `max_lifetime` seconds after they were built and instances built before `invalidate` was called
+    are not reused at all.
+    """
+
+    def __init__(self, max_idle: int = 10, idle_ttl: float = 300, max_lifetime: float = 60,
+                 eviction_interval: float = 5):
+        self.max_idle = max_idle
+        self.idle_ttl = idle_ttl
+        self.max_lifetime = max_lifetime
+        self.eviction_interval = eviction_interval
+        self.hits = 0
+        self.misses = 0
+        self._idle = {}  # type: Dict[Hashable, List[Tuple[ActionRunner, float]]]
+        self._built = WeakKeyDictionary()  # type: WeakKeyDictionary[ActionRunner, Tuple[int, float]]
+        self._generation = 0
+        self._evicted_at = time()
+
+    def _is_valid(self, instance: ActionRunner) -> bool:
+        generation, built_at = self._built.get(instance, (None, 0))
+        return generation == self._generation and time() - built_at < self.max_lifetime
+
+    async def acquire(self, key: Hashable, build: Callable[[], Awaitable[ActionRunner]]) -> ActionRunner:
+        """
+        Returns idle instance of the node or builds a new one.
+        """
+        instances = self._idle.get(key)
+        outdated = []
+        while instances:
+            instance, _ = instances.pop()
+            if self._is_valid(instance):
+                break
+            outdated.append(instance)
+        else:
+            instance = None
+
+        if instances is not None and not instances:
+            del self._idle[key]
+
+        await self._close(outdated)
+
+        if instance is not None:
+            self.hits += 1
+            return instance
+
+        self.misses += 1
+        generation = self._generation
+        instance = await build()
+        self._built[instance] = (generation, time())
+        return instance
+
+    async def release(self, key: Hashable, instance: ActionRunner):
+        """
+        Returns instance to the pool when the invocation finished. Instance is closed if the pool is full or
+        the instance is outdated.
+        """
+        instance.clear_context()
+
+        if len(self._idle.get(key, [])) < self.max_idle and self._is_valid(instance):
+            self._idle.setdefault(key, []).append((instance, time()))
+            closed = []
+        else:
+            closed = [instance]
+
+        if time() - self._evicted_at >= self.eviction_interval:
+            closed += self._pop_expired()
+
+        await self._close(closed)
+
+    def _pop_expired(self) -> List[ActionRunner]:
+        self._evicted_at = time()
+        expire_before = self._evicted_at - self.idle_ttl
+        expired = []
+        for key in list(self._idle):
+            instances = self._idle[key]
+            expired += [instance for instance, released in instances if released < expire_before]
+            instances = [item for item in instances if item[1] >= expire_before]
+            if instances:
+                self._idle[key] = instances
+            else:
+                del self._idle[key]
+        return expired
+
+    @staticmethod
+    async def _close(instances: List[ActionRunner]):
+        results = await asyncio.gather(*[instance.close() for instance in instances], return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Could not close pooled plugin. Details: {repr(result)}")
+
+    async def evict(self):
+        """
+        Closes instances idle longer than idle_ttl.
+        """
+        await self._close(self._pop_expired())
+
+    async def clear(self):
+        """
+        Closes all idle instances.
+        """
+        instances = [instance for items in self._idle.values() for instance, _ in items]
+        self._idle.clear()
+        await self._close(instances)
+
+    async def invalidate(self):
+        """
+        Closes all idle instances. Instances that are in use are closed when they are released. Called when
+        data that plugins may keep, e.g. a resource, changed.
+        """
+        self._generation += 1
+        await self.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "nodes": len(self._idle),
+            "idle": sum(len(instances) for instances in self._idle.values()),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+plugin_pool = PluginPool(max_idle=memory_cache.plugin_pool_size,
+                         idle_ttl=memory_cache.plugin_pool_ttl,
+                         max_lifetime=memory_cache.plugin_pool_max_lifetime)
@@ -42,6 +42,10 @@ class ActionRunner:
     tracker_payload = None  # type: TrackerPayload
     ux = None
     join = None
+    reusable = False  # Instance can be reused by next invocations of the same flow node, see PluginPool.
+    # Node can run at the same time as other concurrent nodes. Only plugins that do not change profile or session
+    # and do not replace their references can be concurrent, see GraphInvoker._execute.
+    concurrent = False
 
     async def run(self, payload: dict, in_edge=None):
         pass
@@ -52,6 +56,22 @@ class ActionRunner:
     async def on_error(self, e):
         pass
 
+    def clear_context(self):
+        """
+        Removes references to objects of the finished invocation. Called before the instance is returned to the pool.
+        """
+        self.event = None
+        self.session = None
+        self.profile = None
+        self.flow = None
+        self.flow_history = None
+        self.console = None
+        self.metrics = None
+        self.memory = None
+        self.execution_graph = None
+        self.tracker_payload = None
+        self.ux = None
+
     def _get_dot_accessor(self, payload) -> DotAccessor:
         return DotAccessor(self.profile, self.session, payload, self.event, self.flow, self.memory)
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Callable
+from typing import Callable, Optional, List
 
 from tracardi.config import tracardi
 from tracardi.domain.profile import Profile
@@ -10,7 +10,22 @@ logger.setLevel(tracardi.logging_level)
 logger.addHandler(log_handler)
 
 
-async def segment(profile: Profile, event_types: list, load_segments: Callable) -> dict:
+def _get_changed_paths(profile: Profile, changed_paths: Optional[List[str]]) -> Optional[List[str]]:
+    # None means that all segments must be evaluated. Incremental segmentation is opt-in, it relies on
+    # the profile delta being complete.
+    if not tracardi.incremental_segmentation or changed_paths is None:
+        return None
+    if profile.operation.new or profile.operation.needs_segmentation():
+        # New profile was never segmented and forced segmentation evaluates all segments.
+        return None
+    if not changed_paths:
+        # Profile was updated in a way that was not tracked, e.g. in-place.
+        return None
+    return changed_paths
+
+
+async def segment(profile: Profile, event_types: list, load_segments: Callable,
+                  changed_paths: Optional[List[str]] = None) -> dict:
     segmentation_result = {"errors": [], "ids": []}
     try:
         # Segmentation
@@ -18,7 +33,8 @@ async def segment(profile: Profile, event_types: list, load_segments: Callable)
             # Segmentation runs only if profile was updated or flow forced it
             async for event_type, segment_id, error in profile.segment(
                     event_types,
-                    load_segments):
+                    load_segments,
+                    _get_changed_paths(profile, changed_paths)):
                 # Segmentation triggered
                 if error:
                     segmentation_result['errors'].append(error)
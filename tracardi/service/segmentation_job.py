@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from time import monotonic
+from typing import List, Optional, Callable, Tuple, Set
+
+from pydantic import BaseModel
+
+from tracardi.config import tracardi
+from tracardi.domain.profile import Profile
+from tracardi.domain.segment import Segment
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.notation.dot_accessor import DotAccessor
+from tracardi.service.storage.driver import storage
+from tracardi.service.storage.helpers.segment_index import CompiledSegment
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+# Segments compiled in the worker process.
+_worker_segments = []  # type: List[CompiledSegment]
+
+
+def _init_worker(segment_records: List[dict]):
+    global _worker_segments
+    _worker_segments = [CompiledSegment(Segment(**record)) for record in segment_records]
+
+
+def _segment_profiles(hits: List[dict], remove_unmatched: bool) -> Tuple[List[Tuple[dict, list]], int]:
+    """
+    Evaluates segments against profile hits in the worker process. Returns hits that need segments
+    update with their new segments and number of errors.
+    """
+    updates = []
+    errors = 0
+    for hit in hits:
+        try:
+            profile = Profile(**hit['_source'])
+        except Exception:
+            errors += 1
+            continue
+
+        dot = DotAccessor(profile=profile)
+        matched = set()  # type: Set[str]
+        unmatched = set()  # type: Set[str]
+        for segment in _worker_segments:
+            try:
+                if segment.evaluate(dot):
+                    matched.add(segment.id)
+                else:
+                    unmatched.add(segment.id)
+            except Exception:
+                errors += 1
+
+        current = profile.segments if profile.segments else []
+        segments = [segment for segment in current if not (remove_unmatched and segment in unmatched)]
+        segments += sorted(matched.difference(segments))
+        if set(segments) != set(current):
+            updates.append((hit, segments))
+
+    return updates, errors
+
+
+def _split(hits: list, parts: int) -> List[list]:
+    size = max(1, -(-len(hits) // parts))
+    return [hits[i:i + size] for i in range(0, len(hits), size)]
+
+
+class SegmentationJobProgress(BaseModel):
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    conflicts: int = 0
+    errors: int = 0
+    checkpoint: Optional[str] = None
+    skipped_segments: List[str] = []
+    started: datetime
+    running_time: float = 0
+
+    def get_progress(self) -> float:
+        if not self.total:
+            return 1.0
+        return min(1.0, self.processed / self.total)
+
+    def get_rate(self) -> float:
+        if not self.running_time:
+            return 0
+        return self.processed / self.running_time
+
+
+class SegmentationJob:
+
+    """
+    Re-segments all profiles that match the query. Profiles are read page by page sorted by profile id,
+    segments are evaluated in a process pool and only profiles whose segments changed are partially updated
+    with bulk requests. Checkpoint is the id of the last profile written, the job can be resumed after it.
+
+    Live segmentation only adds segments. With remove_unmatched segments that no longer match are also removed.
+    Segments not evaluated by the job are never removed. Profiles changed while the job was running are not
+    updated and are counted as conflicts.
+
+    Live segmentation evaluates segments with event types only when an event of that type is tracked. The job
+    skips them unless include_event_type_segments is set, then their conditions are evaluated regardless
+    of event type. Segments whose conditions read other data than profile, e.g. `event@type`, or can not be
+    compiled are always skipped. Skipped segments are listed in progress.
+    """
+
+    def __init__(self,
+                 segment_ids: List[str] = None,
+                 query: dict = None,
+                 batch: int = 1000,
+                 workers: int = None,
+                 max_rate: float = None,
+                 remove_unmatched: bool = False,
+                 include_event_type_segments: bool = False,
+                 on_progress: Callable[[SegmentationJobProgress], None] = None):
+        self.segment_ids = segment_ids
+        self.query = query
+        self.batch = batch
+        self.workers = workers if workers else os.cpu_count()
+        self.max_rate = max_rate
+        self.remove_unmatched = remove_unmatched
+        self.include_event_type_segments = include_event_type_segments
+        self.on_progress = on_progress
+        self.progress = None  # type: Optional[SegmentationJobProgress]
+
+    async def _load_segments(self) -> Tuple[List[dict], List[CompiledSegment], List[str]]:
+        """
+        Returns records and compiled segments evaluated by the job and ids of skipped segments.
+        """
+        records = await storage.driver.segment.load_enabled_segments()
+        if self.segment_ids is not None:
+            records = [record for record in records if record.get('id', None) in self.segment_ids]
+
+        segment_records = []
+        segments = []
+        skipped = []
+        for record in records:
+            segment = CompiledSegment(Segment(**record))
+            if segment.segment.eventType and not self.include_event_type_segments:
+                logger.info(f"Segment {segment.id} skipped by segmentation job. It is assigned on events of type "
+                            f"{', '.join(segment.segment.eventType)}.")
+            elif segment.error is not None:
+                logger.warning(f"Segment {segment.id} skipped by segmentation job. Condition error: {segment.error}")
+            elif not segment.reads_only_profile:
+                logger.warning(f"Segment {segment.id} skipped by segmentation job. Its condition reads data other "
+                               f"than profile.")
+            else:
+                segment_records.append(record)
+                segments.append(segment)
+                continue
+            skipped.append(segment.id)
+
+        return segment_records, segments, skipped
+
+    @staticmethod
+    def _get_source(segments: List[CompiledSegment]) -> Optional[List[str]]:
+        # Only top level profile fields read by conditions are loaded.
+        fields = {'id', 'segments'}
+        for segment in segments:
+            if segment.reads_whole_profile:
+                return None
+            fields |= {field.split('.')[0] for field in segment.fields}
+        return sorted(fields)
+
+    async def _write(self, hits: List[dict], updates: List[Tuple[dict, list]], errors: int, start: float):
+        if updates:
+            success, update_errors = await storage.driver.profile.update_segments(updates)
+            for error in update_errors:
+                details = next(iter(error.values()), {})
+                if details.get('status', None) == 409:
+                    self.progress.conflicts += 1
+                else:
+                    self.progress.errors += 1
+            self.progress.updated += success
+
+        self.progress.processed += len(hits)
+        self.progress.errors += errors
+        self.progress.checkpoint = hits[-1]['sort'][0]
+        self.progress.running_time = monotonic() - start
+
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
+        else:
+            logger.info(f"Segmentation job processed {self.progress.processed} of {self.progress.total} profiles, "
+                        f"updated {self.progress.updated}, rate {self.progress.get_rate():.0f}/s, "
+                        f"checkpoint {self.progress.checkpoint}.")
+
+    async def _throttle(self, start: float):
+        if self.max_rate:
+            delay = self.progress.processed / self.max_rate - (monotonic() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def run(self, start_after: str = None) -> SegmentationJobProgress:
+        segment_records, segments, skipped = await self._load_segments()
+        source = self._get_source(segments)
+
+        self.progress = SegmentationJobProgress(
+            total=(await storage.driver.profile.count({"query": self.query} if self.query else None))['count'],
+            checkpoint=start_after,
+            skipped_segments=skipped,
+            started=datetime.utcnow()
+        )
+
+        if not segments:
+            return self.progress
+
+        start = monotonic()
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(segment_records,)) as pool:
+
+            write_task = None
+            next_page = asyncio.create_task(
+                storage.driver.profile.load_profile_page(self.query, start_after, self.batch, source))
+            try:
+                while True:
+                    hits = await next_page
+                    if not hits:
+                        break
+
+                    # Next page is loaded while this one is evaluated.
+                    next_page = asyncio.create_task(
+                        storage.driver.profile.load_profile_page(self.query, hits[-1]['sort'][0], self.batch, source))
+
+                    results = await asyncio.gather(*[
+                        loop.run_in_executor(pool, _segment_profiles, part, self.remove_unmatched)
+                        for part in _split(hits, self.workers)])
+                    updates = [update for part_updates, _ in results for update in part_updates]
+                    errors = sum(part_errors for _, part_errors in results)
+
+                    # Pages are written in order, so the checkpoint never passes an unwritten profile.
+                    if write_task is not None:
+                        await write_task
+                    write_task = asyncio.create_task(self._write(hits, updates, errors, start))
+
+                    await self._throttle(start)
+
+                if write_task is not None:
+                    await write_task
+            finally:
+                if not next_page.done():
+                    next_page.cancel()
+                if write_task is not None and not write_task.done():
+                    # Page being written is finished, so the checkpoint matches what was written.
+                    await asyncio.gather(write_task, return_exceptions=True)
+
+        return self.progress
@@ -0,0 +1,35 @@
+import logging
+
+from tracardi.config import tracardi
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.connection_pool import connection_pools
+from tracardi.service.destination_dispatcher import destination_dispatcher
+from tracardi.service.http_client import http_sessions
+from tracardi.service.plugin.plugin_pool import plugin_pool
+from tracardi.service.storage.write_buffer import write_buffer
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+async def close_all():
+    """
+    Sends queued destination jobs, flushes buffered writes and closes pooled plugins, database pools and
+    HTTP sessions. Must be called by the application on shutdown, e.g. in the FastAPI shutdown event.
+    """
+
+    # Order matters: destinations and plugins may still use connection pools and HTTP sessions.
+    steps = [
+        ("destination dispatcher", destination_dispatcher.close),
+        ("write buffer", write_buffer.flush),
+        ("plugin pool", plugin_pool.clear),
+        ("connection pools", connection_pools.close),
+        ("http sessions", http_sessions.close)
+    ]
+
+    for name, close in steps:
+        try:
+            await close()
+        except Exception as e:
+            logger.error(f"Could not close {name} on shutdown. Details: {repr(e)}")
@@ -137,7 +137,8 @@ async def heatmap_by_profile(profile_id=None, bucket_name="items_over_time") ->
     return await storage_manager(index="event").aggregate(query, aggregate_key='key_as_string')
 
 
-async def save_events(events: List[Event], persist_events: bool = True) -> Union[SaveResult, BulkInsertResult]:
+async def save_events(events: List[Event], persist_events: bool = True,
+                      buffered: bool = False) -> Union[SaveResult, BulkInsertResult]:
     if persist_events:
         events_to_save = []
         for event in events:
@@ -152,7 +153,8 @@ async def save_events(events: List[Event], persist_events: bool = True) -> Union
                 finally:
                     events_to_save.append(event)
 
-        event_result = await StorageForBulk(events_to_save).index('event').save(exclude={"update": ...})
+        event_result = await StorageForBulk(events_to_save).index('event').save(exclude={"update": ...},
+                                                                               buffered=tracardi.write_buffer or buffered)
         event_result = SaveResult(**event_result.dict())
 
         # Add event types
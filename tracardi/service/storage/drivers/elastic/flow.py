@@ -4,6 +4,9 @@ from tracardi.exceptions.exception import TracardiException
 from tracardi.domain.flow import FlowRecord
 from tracardi.domain.entity import Entity
 from tracardi.service.storage.factory import StorageFor, storage_manager
+from tracardi.service.storage.helpers.flow_cache import FlowCache
+from tracardi.service.wf.domain.compiled_flow import CompiledFlow
+from tracardi.config import memory_cache
 
 
 async def load_record(flow_id) -> FlowRecord:
@@ -12,7 +15,12 @@ async def load_record(flow_id) -> FlowRecord:
 
 
 async def save_record(flow_record: FlowRecord) -> BulkInsertResult:
-    return await StorageFor(flow_record).index().save()
+    result = await StorageFor(flow_record).index().save()
+    flow_cache.invalidate(flow_record.id)
+    return result
+
+
+flow_cache = FlowCache(load_record, max_size=memory_cache.flow_cache_size, ttl=memory_cache.flow_ttl)
 
 
 async def load_production_flow(flow_id):
@@ -23,6 +31,10 @@ async def load_production_flow(flow_id):
     return flow_record.get_production_workflow()
 
 
+async def load_compiled_production_flow(flow_id) -> CompiledFlow:
+    return await flow_cache.get(flow_id)
+
+
 async def load_draft_flow(flow_id):
     flow_record = await load_record(flow_id)
     if not flow_record:
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Dict, Tuple
 from tracardi.domain.entity import Entity
 from tracardi.config import elastic, tracardi
 from tracardi.domain.profile import Profile
+from tracardi.service.storage.elastic_client import ElasticClient
 from tracardi.service.storage.factory import StorageFor, storage_manager, StorageForBulk
 from tracardi.service.storage.profile_cacher import ProfileCache
 
@@ -30,18 +31,45 @@ async def load_merged_profile(id: str) -> Profile:
     return profile
 
 
+async def load_merged_profiles(ids: List[str]) -> Dict[str, Profile]:
+    """
+    Loads many profiles at once. Returns dict of profile id and current profile. If profile was merged
+    then the merged profile is returned under the requested id.
+    """
+
+    profiles = {}
+    ids = list(set(ids))
+
+    if tracardi.cache_profiles is True:
+        profile_cache = ProfileCache()
+        for id in ids:
+            if profile_cache.exists(id):
+                profiles[id] = profile_cache.get_profile(id)
+        ids = [id for id in ids if id not in profiles]
+
+    loaded = {record['id']: Profile(**record) for record in await storage_manager('profile').load_by_ids(ids)}
+
+    merged_ids = [profile.metadata.merged_with for profile in loaded.values() if profile.metadata.merged_with is not None]
+    merged = await load_merged_profiles(merged_ids) if merged_ids else {}
+
+    for id, profile in loaded.items():
+        profiles[id] = merged.get(profile.metadata.merged_with) if profile.metadata.merged_with is not None else profile
+
+    return profiles
+
+
 async def load_profiles_to_merge(merge_key_values: List[tuple], limit=1000) -> List[Profile]:
     profiles = await storage_manager('profile').load_by_values(merge_key_values, limit=limit)
     return [Profile(**profile) for profile in profiles]
 
 
-async def save_profile(profile: Profile, refresh_after_save=False):
+async def save_profile(profile: Profile, refresh_after_save=False, buffered: bool = False):
 
     if tracardi.cache_profiles is not False:
         cache = ProfileCache()
         cache.save_profile(profile)
 
-    result = await StorageFor(profile).index().save()
+    result = await StorageFor(profile).index().save(buffered=tracardi.write_buffer or buffered)
     if refresh_after_save or elastic.refresh_profiles_after_save:
         await storage_manager('profile').flush()
     return result
@@ -65,3 +93,64 @@ async def delete(id: str):
 
 async def count(query: dict = None):
     return await storage_manager('profile').count(query)
+
+
+async def load_profile_page(query: dict = None, start_after: str = None, limit: int = 1000,
+                            source: List[str] = None) -> List[dict]:
+    """
+    Returns raw profile hits sorted by profile id, starting after profile id `start_after`.
+    Hits have the sequence number and primary term so they can be updated with optimistic concurrency.
+    """
+    page_query = {
+        "size": limit,
+        "query": query if query else {"match_all": {}},
+        "sort": [{"id": "asc"}],
+        "seq_no_primary_term": True
+    }
+    if start_after is not None:
+        page_query["search_after"] = [start_after]
+    if source is not None:
+        page_query["_source"] = source
+    result = await storage_manager('profile').query(page_query)
+    return result['hits']['hits']
+
+
+async def update_segments(updates: List[Tuple[dict, list]]) -> Tuple[int, list]:
+    """
+    Partially updates segments of profile hits. Profiles changed since they were loaded are not updated
+    and are reported as version conflicts. Updated profiles are removed from the profile cache, otherwise
+    the next save of the cached profile would overwrite the segments.
+    """
+    actions = [{
+        "_op_type": "update",
+        "_index": hit['_index'],
+        "_id": hit['_id'],
+        "if_seq_no": hit['_seq_no'],
+        "if_primary_term": hit['_primary_term'],
+        "doc": {"segments": segments}
+    } for hit, segments in updates]
+    result = await ElasticClient.instance().bulk(actions)
+
+    if tracardi.cache_profiles is not False:
+        ProfileCache().delete_profiles([hit['_id'] for hit, _ in updates])
+
+    return result
+
+
+async def load_profile_sample(size: int, source: List[str] = None) -> List[dict]:
+    """
+    Returns random sample of profile records.
+    """
+    query = {
+        "size": size,
+        "query": {
+            "function_score": {
+                "query": {"match_all": {}},
+                "random_score": {}
+            }
+        }
+    }
+    if source is not None:
+        query["_source"] = source
+    result = await storage_manager('profile').query(query)
+    return [hit['_source'] for hit in result['hits']['hits']]
@@ -5,6 +5,9 @@ from tracardi.service.storage.factory import StorageFor
 from typing import List, Tuple
 from tracardi.domain.resource import Resource, ResourceRecord
 from tracardi.service.storage.factory import storage_manager, StorageForBulk
+from tracardi.service.storage.helpers.resource_cache import ResourceCache
+from tracardi.config import memory_cache
+from tracardi.service.plugin.plugin_pool import plugin_pool
 
 
 async def refresh():
@@ -34,7 +37,14 @@ async def load_record(id: str) -> ResourceRecord:
 
 async def save_record(resource: Resource) -> BulkInsertResult:
     resource_record = ResourceRecord.encode(resource)
-    return await StorageFor(resource_record).index().save()
+    result = await StorageFor(resource_record).index().save()
+    resource_cache.invalidate(resource.id)
+    # Plugins may keep resource credentials.
+    await plugin_pool.invalidate()
+    return result
+
+
+resource_cache = ResourceCache(load_record, max_size=memory_cache.resource_cache_size, ttl=memory_cache.resource_ttl)
 
 
 async def load_by_tag(tag):
@@ -42,12 +52,11 @@ async def load_by_tag(tag):
 
 
 async def load(id: str) -> Resource:
-    resource_config_record = await load_record(id)  # type: ResourceRecord
-    if resource_config_record is None:
-        raise ValueError('Resource id {} does not exist.'.format(id))
-
-    return resource_config_record.decode()
+    return await resource_cache.get(id)
 
 
 async def delete(id: str):
-    return await StorageFor(Entity(id=id)).index("resource").delete()
+    result = await StorageFor(Entity(id=id)).index("resource").delete()
+    resource_cache.invalidate(id)
+    await plugin_pool.invalidate()
+    return result
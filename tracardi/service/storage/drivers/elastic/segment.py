@@ -1,10 +1,36 @@
-from tracardi.domain.storage_result import StorageResult
+from typing import List, Tuple
+
+from tracardi.config import memory_cache
 from tracardi.service.storage.factory import storage_manager
+from tracardi.service.storage.helpers.segment_index import SegmentIndex, CompiledSegment
+
+
+async def load_enabled_segments(limit: int = 10000) -> List[dict]:
+    # Make recently saved segments visible before loading.
+    await storage_manager('segment').refresh()
+    query = {
+        "size": limit,
+        "query": {
+            "match": {
+                "enabled": True
+            }
+        }
+    }
+    return list(await storage_manager(index="segment").filter(query))
+
+
+async def load_revision():
+    return await storage_manager('segment').revision()
+
+
+segment_index = SegmentIndex(load_records=load_enabled_segments,
+                             load_revision=load_revision,
+                             check_interval=memory_cache.segments_check_interval,
+                             max_age=memory_cache.segments_max_age)
 
 
-async def load_segments(event_type, limit=500) -> StorageResult:
-    return await storage_manager(index="segment").\
-        load_by_query_string("(NOT _exists_:eventType) OR eventType: \"{}\"".format(event_type, limit))
+async def load_compiled_segments(event_types: List[str]) -> List[Tuple[str, CompiledSegment]]:
+    return await segment_index.get_segments(event_types)
 
 
 async def refresh():
@@ -16,4 +42,6 @@ async def flush():
 
 
 async def save(data: dict):
-    return await storage_manager('segment').upsert(data)
+    result = await storage_manager('segment').upsert(data)
+    segment_index.invalidate()
+    return result
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 
+from tracardi.config import tracardi
 from tracardi.domain.profile import Profile
 from tracardi.domain.session import Session
 from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
@@ -12,7 +13,7 @@ async def save_sessions(profiles: List[Session]):
     return await StorageForBulk(profiles).index('session').save()
 
 
-async def update_session_duration(session: Session):
+async def update_session_duration(session: Session, buffered: bool = False):
     await storage_manager("session").update_document(id=session.id, record={
         "metadata": {
             "time": {
@@ -20,10 +21,11 @@ async def update_session_duration(session: Session):
                 "duration": session.metadata.time.duration
             }
         }
-    }, retry_on_conflict=3)
+    }, retry_on_conflict=3, buffered=tracardi.write_buffer or buffered)
 
 
-async def save_session(session: Session, profile: Optional[Profile], persist_session: bool = True):
+async def save_session(session: Session, profile: Optional[Profile], persist_session: bool = True,
+                       buffered: bool = False):
     if persist_session:
 
         if isinstance(session, Session):
@@ -35,10 +37,10 @@ async def save_session(session: Session, profile: Optional[Profile], persist_ses
                                                and session.profile.id != profile.id):
                     # save only profile Entity
                     session.profile = Entity(id=profile.id)
-                return await StorageFor(session).index().save()
+                return await StorageFor(session).index().save(buffered=tracardi.write_buffer or buffered)
             else:
                 # Update session duration
-                await update_session_duration(session)
+                await update_session_duration(session, buffered=buffered)
 
     return BulkInsertResult()
 
@@ -71,6 +73,10 @@ async def load(id: str) -> Session:
     return await StorageFor(Entity(id=id)).index("session").load(Session)
 
 
+async def load_by_ids(ids: List[str]) -> Dict[str, Session]:
+    return {record['id']: Session(**record) for record in await storage_manager("session").load_by_ids(ids)}
+
+
 async def delete(id: str):
     return await storage_manager('session').delete(id)
 
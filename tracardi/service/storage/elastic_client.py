@@ -114,6 +114,9 @@ class ElasticClient:
             ids=ids
         )
 
+    async def bulk(self, actions: list):
+        return await helpers.async_bulk(self._client, actions, raise_on_error=False)
+
     async def update(self, index, id, record, retry_on_conflict=3):
         return await self._client.update(index, body=record, id=id, retry_on_conflict=retry_on_conflict)
 
@@ -164,6 +167,9 @@ class ElasticClient:
     async def update_by_query(self, index, query):
         return await self._client.update_by_query(index=index, body=query)
 
+    async def indexing_stats(self, index):
+        return await self._client.indices.stats(index=index, metric="indexing")
+
     async def count(self, index, query: dict = None):
         return await self._client.count(index=index, body=query)
 
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 
 import elasticsearch
 
@@ -7,6 +8,10 @@ from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
 from tracardi.service.storage import index
 from tracardi.service.storage.elastic_client import ElasticClient
 from tracardi.service.storage.index import Index
+from tracardi.service.storage.write_buffer import write_buffer
+
+# Ids loaded by one search. Must stay below index.max_result_window (10000 by default).
+_ids_chunk_size = 1000
 
 
 class ElasticFiledSort:
@@ -75,7 +80,30 @@ class ElasticStorage:
         except elasticsearch.exceptions.NotFoundError:
             return None
 
-    async def create(self, payload) -> BulkInsertResult:
+    async def load_by_ids(self, ids: List[str]):
+        chunks = [ids[i:i + _ids_chunk_size] for i in range(0, len(ids), _ids_chunk_size)]
+        results = await asyncio.gather(*[self.search({
+            "size": len(chunk),
+            "query": {
+                "ids": {
+                    "values": chunk
+                }
+            }
+        }) for chunk in chunks])
+
+        if len(results) == 1:
+            return results[0]
+
+        return {
+            "hits": {
+                "total": {"value": sum(result['hits']['total']['value'] for result in results)},
+                "hits": [hit for result in results for hit in result['hits']['hits']]
+            }
+        }
+
+    async def create(self, payload, buffered: bool = False) -> BulkInsertResult:
+        if buffered:
+            return await write_buffer.insert(self.index.get_write_index(), payload)
         return await self.storage.insert(self.index.get_write_index(), payload)
 
     async def delete(self, id):
@@ -195,7 +223,12 @@ class ElasticStorage:
     async def update_by_query(self, query):
         return await self.storage.update_by_query(index=self.index.get_index_alias(), query=query)
 
-    async def update(self, id, record, retry_on_conflict=3):
+    async def update(self, id, record, retry_on_conflict=3, buffered: bool = False):
+        if buffered:
+            return await write_buffer.update(self.index.get_write_index(),
+                                             id=id,
+                                             record=record['doc'],
+                                             retry_on_conflict=retry_on_conflict)
         return await self.storage.update(index=self.index.get_write_index(),
                                          record=record,
                                          id=id,
@@ -204,5 +237,10 @@ class ElasticStorage:
     async def delete_by_query(self, query):
         return await self.storage.delete_by_query(index=self.index.get_index_alias(), body=query)
 
+    async def revision(self) -> Tuple[int, int]:
+        stats = await self.storage.indexing_stats(self.index.get_index_alias())
+        indexing = stats['_all']['primaries']['indexing']
+        return indexing['index_total'], indexing['delete_total']
+
     async def get_mapping(self, index):
         return await self.storage.get_mapping(index)
@@ -87,9 +87,10 @@ class StorageCrud(BaseStorageCrud):
 
         return None
 
-    async def save(self) -> BulkInsertResult:
+    async def save(self, buffered: bool = False) -> BulkInsertResult:
         service = self._get_storage_service()
-        return await service.upsert(self.entity.dict(exclude_unset=self.exclude_unset, exclude=self.exclude))
+        return await service.upsert(self.entity.dict(exclude_unset=self.exclude_unset, exclude=self.exclude),
+                                    buffered=buffered)
 
 
 class CollectionCrud:
@@ -99,7 +100,7 @@ class CollectionCrud:
         self.index = index
         self.storage = storage_manager(self.index)
 
-    async def save(self, replace_id: bool = True, exclude=None) -> BulkInsertResult:
+    async def save(self, replace_id: bool = True, exclude=None, buffered: bool = False) -> BulkInsertResult:
         if not isinstance(self.payload, list):
             raise TracardiException("CollectionCrud data payload must be list.")
 
@@ -110,7 +111,7 @@ class CollectionCrud:
             elif isinstance(p, dict):
                 data.append(p)
 
-        return await self.storage.upsert(data, replace_id)
+        return await self.storage.upsert(data, replace_id, buffered=buffered)
 
     async def load(self, start: int = 0, limit: int = 100) -> StorageResult:
         try:
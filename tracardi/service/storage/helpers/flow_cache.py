@@ -0,0 +1,49 @@
+import hashlib
+import logging
+from typing import Callable, Awaitable, Optional
+
+from tracardi.config import tracardi
+from tracardi.domain.flow import FlowRecord
+from tracardi.exceptions.exception import TracardiException
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.storage.helpers.loading_cache import LoadingCache
+from tracardi.service.wf.domain.compiled_flow import CompiledFlow
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class FlowCache(LoadingCache):
+
+    """
+    Process-level LRU cache of compiled production flows keyed by flow id and the hash of flow content.
+
+    Cached flow is returned without touching storage for `ttl` seconds. After that the flow record is loaded
+    again and the flow is decoded and compiled only if its content hash changed. Saving the flow record
+    in this process invalidates its entry at once. Concurrent misses for the same flow share one load.
+    """
+
+    def __init__(self, load_record: Callable[[str], Awaitable[Optional[FlowRecord]]], max_size: int = 1000,
+                 ttl: float = 5):
+        super().__init__(max_size, ttl)
+        self._load_record = load_record
+
+    @staticmethod
+    def content_hash(flow_record: FlowRecord) -> str:
+        return hashlib.sha1(flow_record.production.encode()).hexdigest()
+
+    async def _load_value(self, flow_id: str) -> CompiledFlow:
+        flow_record = await self._load_record(flow_id)
+        if not flow_record:
+            raise TracardiException("Could not find flow `{}`".format(flow_id))
+
+        content_hash = self.content_hash(flow_record)
+
+        cached = self.peek(flow_id)  # type: Optional[CompiledFlow]
+        if cached is not None and cached.content_hash == content_hash:
+            return cached
+
+        compiled_flow = CompiledFlow(flow_record.get_production_workflow(), content_hash)
+        logger.debug(f"Flow {flow_id} compiled.")
+        return compiled_flow
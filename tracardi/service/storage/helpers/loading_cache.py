@@ -0,0 +1,95 @@
+import asyncio
+from collections import OrderedDict
+from time import time
+from typing import Dict, Any, Hashable, Optional
+
+
+class _CachedValue:
+
+    __slots__ = ("value", "cached_at")
+
+    def __init__(self, value):
+        self.value = value
+        self.cached_at = time()
+
+
+class LoadingCache:
+
+    """
+    Process-level LRU cache of values loaded from storage. Subclasses implement _load_value.
+
+    Cached value is returned without loading for `ttl` seconds. Concurrent misses for the same key share one
+    load. Value invalidated while it was loading is returned to the waiting callers but is not cached,
+    it may be already outdated. Values that could not be loaded (load raised an error) are not cached.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 5):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()  # type: OrderedDict[Hashable, _CachedValue]
+        self._loading = {}  # type: Dict[Hashable, asyncio.Task]
+
+    async def _load_value(self, key: Hashable) -> Any:
+        raise NotImplementedError()
+
+    def _return_value(self, value) -> Any:
+        """
+        Returns value given to the caller. Override to return copies.
+        """
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns cached value even if it is expired, or None.
+        """
+        cached = self._cache.get(key)
+        return cached.value if cached is not None else None
+
+    async def _load(self, key: Hashable):
+        value = await self._load_value(key)
+        if self._loading.get(key) is asyncio.current_task():
+            self._put(key, value)
+        return value
+
+    def _put(self, key: Hashable, value):
+        self._cache[key] = _CachedValue(value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def get(self, key: Hashable):
+        cached = self._cache.get(key)
+        if cached is not None and time() - cached.cached_at < self.ttl:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._return_value(cached.value)
+
+        self.misses += 1
+        if key not in self._loading:
+            task = asyncio.create_task(self._load(key))
+            self._loading[key] = task
+            task.add_done_callback(lambda _task: self._loading.pop(key, None)
+                                   if self._loading.get(key) is _task else None)
+
+        return self._return_value(await asyncio.shield(self._loading[key]))
+
+    def invalidate(self, key: Hashable = None):
+        """
+        Removes value from cache. Without key the whole cache is cleared.
+        """
+        if key is None:
+            self._cache.clear()
+            self._loading.clear()
+        else:
+            self._cache.pop(key, None)
+            self._loading.pop(key, None)
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -0,0 +1,40 @@
+import logging
+from typing import Callable, Awaitable, Optional
+
+from tracardi.config import tracardi
+from tracardi.domain.resource import Resource, ResourceRecord
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.storage.helpers.loading_cache import LoadingCache
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class ResourceCache(LoadingCache):
+
+    """
+    Process-level LRU cache of decoded resources keyed by resource id.
+
+    Cached resource is returned without touching storage for `ttl` seconds. Saving or deleting the resource
+    in this process invalidates its entry at once. Concurrent misses for the same resource share one load.
+    Every caller gets its own copy of the resource, so it can be changed, e.g. when credentials are refreshed.
+    Missing resources are not cached.
+    """
+
+    def __init__(self, load_record: Callable[[str], Awaitable[Optional[ResourceRecord]]], max_size: int = 1000,
+                 ttl: float = 10):
+        super().__init__(max_size, ttl)
+        self._load_record = load_record
+
+    async def _load_value(self, resource_id: str) -> Resource:
+        resource_record = await self._load_record(resource_id)  # type: ResourceRecord
+        if resource_record is None:
+            raise ValueError('Resource id {} does not exist.'.format(resource_id))
+
+        resource = resource_record.decode()
+        logger.debug(f"Resource {resource_id} loaded.")
+        return resource
+
+    def _return_value(self, resource: Resource) -> Resource:
+        return resource.copy(deep=True)
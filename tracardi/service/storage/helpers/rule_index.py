@@ -0,0 +1,44 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from pydantic import ValidationError
+
+from tracardi.config import tracardi
+from tracardi.domain.rule import Rule
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.storage.helpers.storage_index import StorageIndex
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class RuleIndex(StorageIndex):
+
+    """
+    In-memory index of all enabled routing rules keyed by (source id, event type).
+    """
+
+    def _build(self, records: List[dict]) -> Dict[Tuple[str, str], List[Rule]]:
+        index = defaultdict(list)
+        for record in records:
+            try:
+                rule = Rule(**record)
+            except ValidationError as e:
+                logger.error(f"Rule {record.get('id', None)} skipped. Rule validation error: {str(e)}")
+                continue
+
+            if not rule.enabled:
+                continue
+
+            index[(rule.source.id, rule.event.type.strip())].append(rule)
+        return dict(index)
+
+    @staticmethod
+    def _count(index) -> int:
+        return sum(len(rules) for rules in index.values())
+
+    async def get_rules(self, source_id: str, event_type: str) -> List[Rule]:
+        index = await self._get_index()
+        return index.get((source_id, event_type.strip()), [])
@@ -0,0 +1,139 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List, Tuple, Optional, Set, Iterable
+
+from pydantic import ValidationError
+
+from tracardi.config import tracardi
+from tracardi.domain.segment import Segment
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.process_engine.tql.compiler import CompiledExpr
+from tracardi.process_engine.tql.condition import Condition
+from tracardi.service.notation.dot_accessor import DotAccessor
+from tracardi.service.storage.helpers.storage_index import StorageIndex
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+_profile_prefix = 'profile@'
+
+
+def _path_prefixes(path: str) -> Set[str]:
+    # traits.public.age -> {traits, traits.public, traits.public.age}
+    parts = path.split('.')
+    return {'.'.join(parts[:i]) for i in range(1, len(parts) + 1)}
+
+
+class CompiledSegment:
+
+    """
+    Segment with its condition compiled. Condition that could not be compiled raises its error on evaluation.
+
+    Segment also knows which profile paths its condition reads, so it can tell if it has to be evaluated again
+    after the profile changed. Conditions that depend on time or read the whole profile depend on every change.
+    Conditions may also read other data, e.g. `event@type`, then reads_only_profile is False.
+    """
+
+    def __init__(self, segment: Segment):
+        self.segment = segment
+        self.id = segment.get_id()
+        self.condition = None  # type: Optional[CompiledExpr]
+        self.error = None  # type: Optional[Exception]
+        self.fields = set()  # type: Set[str]
+        self.volatile = True
+        self.reads_whole_profile = False
+        self.reads_only_profile = True
+        self._field_prefixes = set()  # type: Set[str]
+        try:
+            condition = Condition()
+            self.condition = condition.compile(segment.condition)
+            tree = condition.parse(segment.condition)
+            self.volatile = condition.compiler.is_volatile(tree)
+            for label in condition.compiler.get_fields(tree):
+                if not label.startswith(_profile_prefix):
+                    # Only profile changes are tracked.
+                    self.reads_only_profile = False
+                    continue
+                path = label[len(_profile_prefix):]
+                if path == '...':
+                    self.reads_whole_profile = True
+                    self.volatile = True
+                    continue
+                self.fields.add(path)
+                self._field_prefixes |= _path_prefixes(path)
+        except Exception as e:
+            self.error = e
+
+    def depends_on(self, changed_paths: Iterable[str]) -> bool:
+        """
+        Returns True if any of the changed profile paths, e.g. `traits.public`, is read by the segment condition,
+        contains a field read by the condition or is contained by such field.
+        """
+        if self.volatile or self.error is not None:
+            return True
+        for path in changed_paths:
+            if path in self._field_prefixes:
+                # Changed path is the field or its parent.
+                return True
+            if not self.fields.isdisjoint(_path_prefixes(path)):
+                # Changed path is inside the field.
+                return True
+        return False
+
+    def evaluate(self, dot: DotAccessor) -> bool:
+        if self.error is not None:
+            raise self.error
+        return self.condition(dot)
+
+
+class SegmentIndex(StorageIndex):
+
+    """
+    In-memory catalogue of all enabled segments with compiled conditions, indexed by event type.
+    Segments without event type are applicable to every event type.
+    """
+
+    def _build(self, records: List[dict]) -> Tuple[Dict[str, List[CompiledSegment]], List[CompiledSegment]]:
+        by_event_type = defaultdict(list)
+        any_event_type = []
+        for record in records:
+            try:
+                segment = Segment(**record)
+            except ValidationError as e:
+                logger.error(f"Segment {record.get('id', None)} skipped. Segment validation error: {str(e)}")
+                continue
+
+            if not segment.enabled:
+                continue
+
+            compiled_segment = CompiledSegment(segment)
+            if segment.eventType:
+                for event_type in set(segment.eventType):
+                    by_event_type[event_type].append(compiled_segment)
+            else:
+                any_event_type.append(compiled_segment)
+
+        return dict(by_event_type), any_event_type
+
+    @staticmethod
+    def _count(index) -> int:
+        by_event_type, any_event_type = index
+        return len({id(segment) for segments in by_event_type.values() for segment in segments}) + len(any_event_type)
+
+    async def get_segments(self, event_types: List[str]) -> List[Tuple[str, CompiledSegment]]:
+        """
+        Returns every segment applicable to any of the event types once, with the first event type
+        it applies to.
+        """
+        by_event_type, any_event_type = await self._get_index()
+        applicable = {}
+        for event_type in event_types:
+            for segment in by_event_type.get(event_type, []):
+                if segment.id not in applicable:
+                    applicable[segment.id] = (event_type, segment)
+            for segment in any_event_type:
+                if segment.id not in applicable:
+                    applicable[segment.id] = (event_type, segment)
+        return list(applicable.values())
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from time import time
+from typing import List, Callable, Awaitable, Any, Optional
+
+from tracardi.config import tracardi
+from tracardi.exceptions.log_handler import log_handler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class StorageIndex:
+
+    """
+    In-memory index of records loaded from storage. Subclasses define how the index is built from records.
+
+    Records are loaded once and refreshed in background. Refresh checks storage revision every `check_interval`
+    seconds and reloads records only if the revision changed or the index is older than `max_age`. The index is
+    replaced atomically so readers never see partial state and never wait for a refresh. Only the very first
+    read waits for the records to load.
+    """
+
+    def __init__(self,
+                 load_records: Callable[[], Awaitable[List[dict]]],
+                 load_revision: Callable[[], Awaitable[Any]],
+                 check_interval: float = 5,
+                 max_age: float = 60):
+        self._load_records = load_records
+        self._load_revision = load_revision
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._index = None
+        self._revision = None
+        self._loaded_at = 0
+        self._checked_at = 0
+        self._refresh_task = None  # type: Optional[asyncio.Task]
+        self._initial_load = None  # type: Optional[asyncio.Task]
+
+    def _build(self, records: List[dict]):
+        raise NotImplementedError()
+
+    @staticmethod
+    def _count(index) -> int:
+        return len(index)
+
+    async def reload(self):
+        # Revision is read before the records, so changes made during loading trigger another reload.
+        revision = await self._load_revision()
+        index = self._build(await self._load_records())
+        self._index, self._revision = index, revision
+        self._loaded_at = self._checked_at = time()
+        logger.info(f"{type(self).__name__} reloaded with {self._count(index)} records.")
+
+    async def _refresh(self):
+        try:
+            self._checked_at = time()
+            if time() - self._loaded_at > self.max_age or await self._load_revision() != self._revision:
+                await self.reload()
+        except Exception as e:
+            logger.error(f"Could not refresh {type(self).__name__}. Old records are used. Reason: {str(e)}")
+
+    def _schedule_refresh(self):
+        if time() - self._checked_at < self.check_interval:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _get_index(self):
+        if self._index is None:
+            # Concurrent first readers wait for the same load.
+            if self._initial_load is None or self._initial_load.done():
+                self._initial_load = asyncio.create_task(self.reload())
+            await self._initial_load
+        else:
+            self._schedule_refresh()
+        return self._index
+
+    def invalidate(self):
+        """
+        Forces revision check on next read.
+        """
+        self._checked_at = 0
+        self._loaded_at = 0
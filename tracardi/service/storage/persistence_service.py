@@ -378,6 +378,18 @@ class PersistenceService:
                 raise StorageException(str(e), message=message, details=details)
             raise StorageException(str(e))
 
+    async def revision(self) -> Tuple[int, int]:
+        """
+        Returns number of indexed and deleted documents. It changes on every write to the index.
+        """
+        try:
+            return await self.storage.revision()
+        except elasticsearch.exceptions.ElasticsearchException as e:
+            if len(e.args) == 2:
+                message, details = e.args
+                raise StorageException(str(e), message=message, details=details)
+            raise StorageException(str(e))
+
     async def get_mapping(self) -> IndexMapping:
         try:
             return IndexMapping(await self.storage.get_mapping(self.storage.index.get_index_alias()))
@@ -387,6 +399,17 @@ class PersistenceService:
                 raise StorageException(str(e), message=message, details=details)
             raise StorageException(str(e))
 
+    async def load_by_ids(self, ids: List[str]) -> StorageResult:
+        if not ids:
+            return StorageResult()
+        try:
+            return StorageResult(await self.storage.load_by_ids(ids))
+        except elasticsearch.exceptions.ElasticsearchException as e:
+            if len(e.args) == 2:
+                message, details = e.args
+                raise StorageException(str(e), message=message, details=details)
+            raise StorageException(str(e))
+
     async def load_by(self, field: str, value: Union[str, int, float, bool], limit: int = 100) -> StorageResult:
         try:
             return StorageResult(await self.storage.load_by(field, value, limit))
@@ -453,7 +476,7 @@ class PersistenceService:
                 raise StorageException(str(e), message=message, details=details)
             raise StorageException(str(e))
 
-    async def upsert(self, data, replace_id: bool = True) -> BulkInsertResult:
+    async def upsert(self, data, replace_id: bool = True, buffered: bool = False) -> BulkInsertResult:
         try:
 
             if not isinstance(data, list):
@@ -467,7 +490,7 @@ class PersistenceService:
                         d["_id"] = d['id']
                 payload = data
 
-            return await self.storage.create(payload)
+            return await self.storage.create(payload, buffered=buffered)
 
         except elasticsearch.exceptions.ElasticsearchException as e:
             if len(e.args) == 2:
@@ -557,13 +580,14 @@ class PersistenceService:
                 raise StorageException(str(e), message=message, details=details)
             raise StorageException(str(e))
 
-    async def update_document(self, record: dict, id: str, retry_on_conflict=3):
+    async def update_document(self, record: dict, id: str, retry_on_conflict=3, buffered: bool = False):
         try:
             record = {
                 "doc": record,
                 'doc_as_upsert': True
             }
-            return await self.storage.update(id, record=record, retry_on_conflict=retry_on_conflict)
+            return await self.storage.update(id, record=record, retry_on_conflict=retry_on_conflict,
+                                             buffered=buffered)
         except elasticsearch.exceptions.ConflictError as e:
             _logger.warning(f"Minor Session Conflict Error: Last session duration could not be updated. "
                             f"This may happen  when there is a rapid stream of events. Reason: {str(e)}")
@@ -1,4 +1,6 @@
 import json
+from typing import List
+
 from tracardi.domain.profile import Profile
 from tracardi.service.singleton import Singleton
 from tracardi.service.storage.redis_client import RedisClient
@@ -19,3 +21,7 @@ class ProfileCache(metaclass=Singleton):
 
     def save_profile(self, profile: Profile):
         return self.redis.client.hset(self.hash, profile.id, profile.json())
+
+    def delete_profiles(self, ids: List[str]):
+        if ids:
+            return self.redis.client.hdel(self.hash, *ids)
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from tracardi.config import tracardi
+from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
+from tracardi.exceptions.exception import StorageException
+from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.storage.elastic_client import ElasticClient
+
+logger = logging.getLogger(__name__)
+logger.setLevel(tracardi.logging_level)
+logger.addHandler(log_handler)
+
+
+class _PendingWrite:
+
+    def __init__(self, actions: List[dict], future: asyncio.Future):
+        self.actions = actions
+        self.future = future
+        self.ids = [action['_id'] for action in actions]
+
+
+class WriteBufferMetrics:
+
+    def __init__(self):
+        self.flushes = 0
+        self.size_flushes = 0
+        self.time_flushes = 0
+        self.flushed_actions = 0
+        self.failed_actions = 0
+        self.flush_errors = 0
+        self.last_flush_time = 0.0
+        self.max_flush_time = 0.0
+        self.total_flush_time = 0.0
+        self.backpressure_waits = 0
+
+    def dict(self, pending: int) -> dict:
+        return {
+            "flushes": self.flushes,
+            "size_flushes": self.size_flushes,
+            "time_flushes": self.time_flushes,
+            "flushed_actions": self.flushed_actions,
+            "failed_actions": self.failed_actions,
+            "flush_errors": self.flush_errors,
+            "avg_batch_size": self.flushed_actions / self.flushes if self.flushes else 0,
+            "avg_flush_time": self.total_flush_time / self.flushes if self.flushes else 0,
+            "last_flush_time": self.last_flush_time,
+            "max_flush_time": self.max_flush_time,
+            "backpressure_waits": self.backpressure_waits,
+            "pending_writes": pending
+        }
+
+
+class WriteBehindBuffer:
+
+    """
+    Process-wide write-behind buffer. Merges bulk actions from concurrent requests into one bulk call per index.
+    Buffer is flushed when it reaches `max_batch` actions or when the oldest write waits `max_latency` seconds.
+    Each caller awaits the flush of its own writes and gets its own BulkInsertResult.
+    """
+
+    def __init__(self, max_batch: int = 500, max_latency: float = 0.05, max_pending: int = 10000):
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.max_pending = max_pending
+        self.metrics = WriteBufferMetrics()
+        self._buffers = {}  # type: Dict[str, List[_PendingWrite]]
+        self._buffer_sizes = {}  # type: Dict[str, int]
+        self._timers = {}  # type: Dict[str, asyncio.TimerHandle]
+        self._flush_tasks = set()
+        self._pending_writes = 0
+        self._slots = None  # type: Optional[asyncio.Semaphore]
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Created lazily, so it is bound to the running loop.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    @staticmethod
+    def index_action(index: str, record: dict) -> dict:
+        if '_id' in record:
+            _id = record['_id']
+            del (record['_id'])
+        else:
+            _id = str(uuid4())
+
+        return {
+            "_index": index,
+            "_id": _id,
+            "_source": record
+        }
+
+    @staticmethod
+    def update_action(index: str, id: str, record: dict, retry_on_conflict=3) -> dict:
+        return {
+            "_op_type": "update",
+            "_index": index,
+            "_id": id,
+            "doc": record,
+            "doc_as_upsert": True,
+            "retry_on_conflict": retry_on_conflict
+        }
+
+    async def insert(self, index: str, records: List[dict]) -> BulkInsertResult:
+        if not isinstance(records, list):
+            raise ValueError("Insert expects payload to be list.")
+        return await self.write(index, [self.index_action(index, record) for record in records])
+
+    async def update(self, index: str, id: str, record: dict, retry_on_conflict=3) -> BulkInsertResult:
+        return await self.write(index, [self.update_action(index, id, record, retry_on_conflict)])
+
+    async def write(self, index: str, actions: List[dict]) -> BulkInsertResult:
+        if not actions:
+            return BulkInsertResult()
+
+        slots = self._get_slots()
+        if slots.locked():
+            self.metrics.backpressure_waits += 1
+            logger.info(f"Write buffer is full ({self._pending_writes} pending writes). Waiting for flush.")
+
+        async with slots:
+            self._pending_writes += 1
+            try:
+                pending = _PendingWrite(actions, asyncio.get_running_loop().create_future())
+                self._append(index, pending)
+                return await pending.future
+            finally:
+                self._pending_writes -= 1
+
+    def _append(self, index: str, pending: _PendingWrite):
+        if index not in self._buffers:
+            self._buffers[index] = []
+            self._buffer_sizes[index] = 0
+            self._timers[index] = asyncio.get_running_loop().call_later(
+                self.max_latency, self._flush_on_time, index)
+
+        self._buffers[index].append(pending)
+        self._buffer_sizes[index] += len(pending.actions)
+
+        if self._buffer_sizes[index] >= self.max_batch:
+            self.metrics.size_flushes += 1
+            self._schedule_flush(index)
+
+    def _flush_on_time(self, index: str):
+        if index in self._buffers:
+            self.metrics.time_flushes += 1
+            self._schedule_flush(index)
+
+    def _schedule_flush(self, index: str):
+        batch = self._take(index)
+        if batch:
+            task = asyncio.create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    def _take(self, index: str) -> List[_PendingWrite]:
+        timer = self._timers.pop(index, None)
+        if timer is not None:
+            timer.cancel()
+        self._buffer_sizes.pop(index, None)
+        return self._buffers.pop(index, [])
+
+    async def _flush(self, batch: List[_PendingWrite]):
+        actions = [action for pending in batch for action in pending.actions]
+        start = monotonic()
+        try:
+            success, errors = await ElasticClient.instance().bulk(actions)
+        except Exception as e:
+            self.metrics.flush_errors += 1
+            logger.error(f"Write buffer flush of {len(actions)} actions failed. Reason: {str(e)}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(StorageException(str(e)))
+            return
+        finally:
+            flush_time = monotonic() - start
+            self.metrics.flushes += 1
+            self.metrics.flushed_actions += len(actions)
+            self.metrics.last_flush_time = flush_time
+            self.metrics.total_flush_time += flush_time
+            self.metrics.max_flush_time = max(self.metrics.max_flush_time, flush_time)
+
+        self.metrics.failed_actions += len(errors)
+        errors_by_id = self._group_errors(errors)
+
+        for pending in batch:
+            if not pending.future.done():
+                self._resolve(pending, errors_by_id)
+
+    @staticmethod
+    def _group_errors(errors: list) -> Dict[str, List[Tuple[str, dict]]]:
+        errors_by_id = {}
+        for error in errors:
+            for op_type, details in error.items():
+                errors_by_id.setdefault(details.get('_id'), []).append((op_type, error))
+        return errors_by_id
+
+    @staticmethod
+    def _resolve(pending: _PendingWrite, errors_by_id: dict):
+        index_errors = []
+        for id in pending.ids:
+            for op_type, error in errors_by_id.get(id, []):
+                if op_type == 'update' and error[op_type].get('status') == 409:
+                    logger.warning(f"Minor Conflict Error: Document {id} could not be updated. "
+                                   f"This may happen  when there is a rapid stream of events.")
+                else:
+                    index_errors.append(error)
+
+        if index_errors:
+            message = f"{len(index_errors)} document(s) failed to index."
+            pending.future.set_exception(StorageException(message, message=message, details=index_errors))
+            return
+
+        pending.future.set_result(BulkInsertResult(
+            saved=len(pending.ids),
+            errors=[],
+            ids=[action['_id'] for action in pending.actions if action.get('_op_type', 'index') == 'index']
+        ))
+
+    async def flush(self):
+        """
+        Flushes all buffered writes and waits for running flushes. Called on shutdown by close_all in
+        tracardi.service.shutdown.
+        """
+        for index in list(self._buffers.keys()):
+            self._schedule_flush(index)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def get_metrics(self) -> dict:
+        metrics = self.metrics.dict(self._pending_writes)
+        metrics['buffered_actions'] = sum(self._buffer_sizes.values())
+        return metrics
+
+
+write_buffer = WriteBehindBuffer(
+    max_batch=tracardi.write_buffer_max_batch,
+    max_latency=tracardi.write_buffer_max_latency / 1000,
+    max_pending=tracardi.write_buffer_max_pending
+)
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from collections import defaultdict
+from time import perf_counter
+from typing import Dict, Tuple
+
+from tracardi.config import tracardi
+
+_default_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = _default_buckets):
+        self.buckets = buckets
+        # Last bucket is +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bucket, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            yield bucket, total
+
+    def dict(self) -> dict:
+        return {
+            "buckets": {str(bucket): count for bucket, count in self.cumulative()},
+            "sum": self.sum,
+            "count": self.count
+        }
+
+
+class _StageTimer:
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.histogram.observe(perf_counter() - self.start)
+
+
+class _NullTimer:
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+class TrackMetrics:
+
+    """
+    In-process latency histograms per tracker stage and counters of processed events, rules and flows.
+    When disabled every call returns immediately.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms = defaultdict(LatencyHistogram)  # type: Dict[str, LatencyHistogram]
+        self.counters = defaultdict(int)  # type: Dict[str, int]
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return _null_timer
+        return _StageTimer(self.histograms[name])
+
+    def timed(self, name: str, coroutine):
+        """
+        Wraps coroutine so its execution time is recorded. Returns coroutine untouched when metrics are disabled.
+        """
+        if not self.enabled:
+            return coroutine
+        return self._timed(name, coroutine)
+
+    async def _timed(self, name: str, coroutine):
+        with _StageTimer(self.histograms[name]):
+            return await coroutine
+
+    def count(self, name: str, value: int = 1):
+        if self.enabled:
+            self.counters[name] += value
+
+    def reset(self):
+        self.histograms.clear()
+        self.counters.clear()
+
+    def dict(self) -> dict:
+        return {
+            "stages": {name: histogram.dict() for name, histogram in self.histograms.items()},
+            "counters": dict(self.counters)
+        }
+
+    def prometheus(self, prefix: str = "tracardi_track") -> str:
+        """
+        Returns metrics in Prometheus text exposition format.
+        """
+        lines = [
+            f"# HELP {prefix}_stage_seconds Latency of track process stages.",
+            f"# TYPE {prefix}_stage_seconds histogram"
+        ]
+        for name, histogram in self.histograms.items():
+            for bucket, count in histogram.cumulative():
+                le = "+Inf" if bucket == float("inf") else str(bucket)
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {histogram.sum}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+track_metrics = TrackMetrics(enabled=tracardi.track_metrics)
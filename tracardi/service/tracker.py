@@ -1,11 +1,11 @@
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict
 from uuid import uuid4
 
 import redis
-from deepdiff import DeepDiff
 
 from tracardi.config import tracardi, memory_cache
 from tracardi.domain.entity import Entity
@@ -14,6 +14,7 @@ from tracardi.process_engine.debugger import Debugger
 from tracardi.service.console_log import ConsoleLog
 from tracardi.event_server.utils.memory_cache import MemoryCache, CacheItem
 from tracardi.exceptions.log_handler import log_handler
+from tracardi.service.destination_dispatcher import destination_dispatcher, DestinationJob
 from tracardi.service.destination_manager import DestinationManager
 from tracardi.service.merging import merge
 from tracardi.service.notation.dot_accessor import DotAccessor
@@ -38,6 +39,7 @@ from tracardi.service.storage.driver import storage
 from tracardi.service.storage.factory import StorageForBulk
 from tracardi.service.storage.helpers.source_cacher import source_cache
 from tracardi.service.synchronizer import ProfileTracksSynchronizer
+from tracardi.service.track_metrics import track_metrics
 
 logger = logging.getLogger('app.api.track.service.tracker')
 logger.setLevel(tracardi.logging_level)
@@ -45,10 +47,10 @@ logger.addHandler(log_handler)
 cache = MemoryCache()
 
 
-async def _save_profile(profile):
+async def _save_profile(profile, buffered: bool = False):
     try:
         if isinstance(profile, Profile) and (profile.operation.new or profile.operation.needs_update()):
-            return await storage.driver.profile.save_profile(profile)
+            return await storage.driver.profile.save_profile(profile, buffered=buffered)
         else:
             return BulkInsertResult()
 
@@ -56,15 +58,15 @@ async def _save_profile(profile):
         raise FieldTypeConflictException("Could not save profile. Error: {}".format(str(e)), rows=e.details)
 
 
-async def _save_session(tracker_payload, session, profile):
+async def _save_session(tracker_payload, session, profile, buffered: bool = False):
     try:
         persist_session = tracker_payload.is_on('saveSession', default=True)
-        return await storage.driver.session.save_session(session, profile, persist_session)
+        return await storage.driver.session.save_session(session, profile, persist_session, buffered=buffered)
     except StorageException as e:
         raise FieldTypeConflictException("Could not save session. Error: {}".format(str(e)), rows=e.details)
 
 
-async def _save_events(tracker_payload, console_log, events):
+async def _save_events(tracker_payload, console_log, events, buffered: bool = False):
     try:
         persist_events = tracker_payload.is_on('saveEvents', default=True)
 
@@ -94,18 +96,19 @@ async def _save_events(tracker_payload, console_log, events):
                 else:
                     event.metadata.status = PROCESSED
 
-        return await storage.driver.event.save_events(events, persist_events)
+        return await storage.driver.event.save_events(events, persist_events, buffered=buffered)
 
     except StorageException as e:
         raise FieldTypeConflictException("Could not save event. Error: {}".format(str(e)), rows=e.details)
 
 
 async def _persist(console_log: ConsoleLog, session: Session, events: List[Event],
-                   tracker_payload: TrackerPayload, profile: Optional[Profile] = None) -> CollectResult:
+                   tracker_payload: TrackerPayload, profile: Optional[Profile] = None,
+                   buffered: bool = False) -> CollectResult:
     results = await asyncio.gather(
-        _save_profile(profile),
-        _save_session(tracker_payload, session, profile),
-        _save_events(tracker_payload, console_log, events)
+        _save_profile(profile, buffered),
+        _save_session(tracker_payload, session, profile, buffered),
+        _save_events(tracker_payload, console_log, events, buffered)
     )
 
     return CollectResult(
@@ -115,6 +118,14 @@ async def _persist(console_log: ConsoleLog, session: Session, events: List[Event
     )
 
 
+def _get_profile_delta(profile: Profile, tracked_profile: Profile) -> List[str]:
+    if profile is not tracked_profile:
+        # Workflow replaced profile object
+        profile.mark_changes_against(tracked_profile)
+        return sorted(set(profile.get_delta()) | set(tracked_profile.get_delta()))
+    return profile.get_delta()
+
+
 def get_profile_id(profile: Profile):
     return profile.id if isinstance(profile, Entity) else None
 
@@ -161,9 +172,10 @@ async def validate_events_json_schemas(events, profile: Optional[Profile], sessi
 
 
 async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_less: bool, profile=None, session=None,
-                               ip='0.0.0.0'):
+                               ip='0.0.0.0', buffered: bool = False):
     console_log = ConsoleLog()
-    profile_copy = None
+    tracked_profile = None
+    visit_delta = []
 
     has_profile = not profile_less and isinstance(profile, Profile)
 
@@ -180,21 +192,30 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
         logger.warning("Something is wrong - profile less events should not have profile attached.")
 
     if has_profile:
-        profile_copy = profile.dict(exclude={"operation": ...})
+        # Changes made before events are processed (e.g. visit times) are used only by segmentation.
+        visit_delta = profile.get_delta()
+        # Track profile changes made from now on. Changes are passed to destinations.
+        profile.reset_changes()
+        tracked_profile = profile
 
     # Get events
     events = tracker_payload.get_events(session, profile, has_profile, ip)
+    track_metrics.count("events", len(events))
 
     # Validates json schemas of events, throws exception if data is not valid
-    console_log = await validate_events_json_schemas(events, profile, session, console_log)
+    with track_metrics.stage("event_validation"):
+        console_log = await validate_events_json_schemas(events, profile, session, console_log)
 
     debugger = None
     segmentation_result = None
 
+    with track_metrics.stage("rules_loading"):
+        events_rules = await storage.driver.rule.load_rules(tracker_payload.source, events)
+
     rules_engine = RulesEngine(
         session,
         profile,
-        events_rules=await storage.driver.rule.load_rules(tracker_payload.source, events),
+        events_rules=events_rules,
         console_log=console_log
     )
 
@@ -203,11 +224,13 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
     try:
 
         # Invoke rules engine
-        debugger, ran_event_types, console_log, post_invoke_events, invoked_rules = await rules_engine.invoke(
-            storage.driver.flow.load_production_flow,
-            ux,
-            tracker_payload
-        )
+        with track_metrics.stage("rules_engine"):
+            debugger, ran_event_types, console_log, post_invoke_events, invoked_rules = await rules_engine.invoke(
+                storage.driver.flow.load_compiled_production_flow,
+                ux,
+                tracker_payload
+            )
+        track_metrics.count("rules", sum(len(rules) for rules in invoked_rules.values()))
 
         # Profile and session can change inside workflow
         # Check if it should not be replaced.
@@ -228,9 +251,15 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
 
         if isinstance(profile, Profile):
             # Segment
-            segmentation_result = await segment(profile,
-                                                ran_event_types,
-                                                storage.driver.segment.load_segments)
+            with track_metrics.stage("segmentation"):
+                changed_paths = None
+                if tracked_profile is not None:
+                    # Only segments that depend on changed profile paths are evaluated.
+                    changed_paths = sorted(set(visit_delta) | set(_get_profile_delta(profile, tracked_profile)))
+                segmentation_result = await segment(profile,
+                                                    ran_event_types,
+                                                    storage.driver.segment.load_compiled_segments,
+                                                    changed_paths)
 
     except Exception as e:
         message = 'Rules engine or segmentation returned an error `{}`'.format(str(e))
@@ -250,7 +279,8 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
     save_tasks = []
     try:
         # Merge
-        profiles_to_disable = await merge(profile, override_old_data=True, limit=2000)
+        with track_metrics.stage("merging"):
+            profiles_to_disable = await merge(profile, override_old_data=True, limit=2000)
         if profiles_to_disable is not None:
             task = asyncio.create_task(
                 StorageForBulk(profiles_to_disable).index('profile').save())
@@ -333,44 +363,52 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
 
             events = synced_events
 
-        collect_result = await _persist(console_log, session, events, tracker_payload, profile)
+        with track_metrics.stage("persistence"):
+            collect_result = await _persist(console_log, session, events, tracker_payload, profile, buffered)
 
         # Save console log
         if console_log:
             encoded_console_log = list(console_log.get_encoded())
-            save_tasks.append(asyncio.create_task(StorageForBulk(encoded_console_log).index('console-log').save()))
+            save_tasks.append(asyncio.create_task(track_metrics.timed(
+                "console_log_saving",
+                StorageForBulk(encoded_console_log).index('console-log').save(
+                    buffered=tracardi.write_buffer or buffered)
+            )))
 
     # Send to destination
 
-    if has_profile and profile_copy is not None:
-        new_profile = profile.dict(exclude={"operation": ...})
-
-        if profile_copy != new_profile:
-            profile_delta = DeepDiff(profile_copy, new_profile, ignore_order=True)
-            if profile_delta:
-                logger.info("Profile changed. Destination scheduled to run.")
-                try:
-                    destination_manager = DestinationManager(profile_delta,
-                                                             profile,
-                                                             session,
-                                                             payload=None,
-                                                             event=None,
-                                                             flow=None,
-                                                             memory=None)
-                    # todo performance - could be not awaited add to save_task
-                    await destination_manager.send_data(profile.id, events, debug=False)
-                except Exception as e:
-                    # todo - this appends error to the same profile - it rather should be en event error
-                    console_log.append(Console(
-                        profile_id=get_profile_id(profile),
-                        origin='destination',
-                        class_name='DestinationManager',
-                        module='tracker',
-                        type='error',
-                        message=str(e),
-                        traceback=get_traceback(e)
-                    ))
-                    logger.error(str(e))
+    if has_profile and tracked_profile is not None:
+
+        profile_delta = _get_profile_delta(profile, tracked_profile)
+
+        if profile_delta:
+            logger.info("Profile changed. Destination scheduled to run.")
+            try:
+                destination_manager = DestinationManager(profile_delta,
+                                                         profile,
+                                                         session,
+                                                         payload=None,
+                                                         event=None,
+                                                         flow=None,
+                                                         memory=None)
+                if tracardi.async_destinations:
+                    # Data is sent in background. Response does not wait for destinations.
+                    await destination_dispatcher.put(DestinationJob(destination_manager, profile.id, events))
+                else:
+                    with track_metrics.stage("destinations"):
+                        await destination_manager.send_data(profile.id, events, debug=False)
+            except Exception as e:
+                # todo - this appends error to the same profile - it rather should be en event error
+                console_log.append(Console(
+                    profile_id=get_profile_id(profile),
+                    origin='destination',
+                    class_name='DestinationManager',
+                    module='tracker',
+                    type='error',
+                    message=str(e),
+                    traceback=get_traceback(e)
+                ))
+                logger.error(str(e))
 
     if save_tasks:
         # Run tasks
@@ -415,13 +453,37 @@ async def invoke_track_process(tracker_payload: TrackerPayload, source, profile_
     return result
 
 
-async def track_event(tracker_payload: TrackerPayload, ip: str, profile_less: bool, allowed_bridges: List[str]):
-    try:
-        source = await source_cache.validate_source(source_id=tracker_payload.source.id,
-                                                    allowed_bridges=allowed_bridges)
-    except ValueError as e:
-        raise UnauthorizedException(e)
+class SpeculativeProfileLoader:
+
+    """
+    Starts loading profile before the session is loaded. The profile id is taken from the tracker payload. If the
+    profile that should be loaded according to the session is the same as speculated, the already running load is
+    reused, otherwise the profile is loaded as usual.
+    """
+
+    def __init__(self, load_merged_profile, profile_id: Optional[str]):
+        self.load_merged_profile = load_merged_profile
+        self.profile_id = profile_id
+        self._task = asyncio.create_task(load_merged_profile(id=profile_id)) if profile_id is not None else None
+
+    async def load(self, id: str) -> Optional[Profile]:
+        if self._task is not None and id == self.profile_id:
+            task, self._task = self._task, None
+            return await task
+        return await self.load_merged_profile(id=id)
+
+    def discard(self):
+        if self._task is not None:
+            if self._task.done():
+                # Retrieve result so the exception (if any) is not reported as never retrieved.
+                if not self._task.cancelled():
+                    self._task.exception()
+            else:
+                self._task.cancel()
+            self._task = None
 
+
+def _apply_source_options(tracker_payload: TrackerPayload, source):
     if source.transitional is True:
         tracker_payload.options.update({
             "saveSession": False,
@@ -433,23 +495,231 @@ async def track_event(tracker_payload: TrackerPayload, ip: str, profile_less: bo
             "profile": False
         })
 
-    # Get session
+
+def _ensure_session(tracker_payload: TrackerPayload):
     if tracker_payload.session is None or tracker_payload.session.id is None:
         # Generate random
         tracker_payload.session = Session(id=str(uuid4()), metadata=SessionMetadata())
 
-    # Load session from storage
-    session = await storage.driver.session.load(tracker_payload.session.id)  # type: Session
 
-    # Get profile
-    profile, session = await tracker_payload.get_profile_and_session(session,
-                                                                     storage.driver.profile.load_merged_profile,
-                                                                     profile_less
-                                                                     )
+async def track_event(tracker_payload: TrackerPayload, ip: str, profile_less: bool, allowed_bridges: List[str]):
+
+    # Get session
+    _ensure_session(tracker_payload)
+
+    # Source validation, session and profile are loaded at the same time.
+
+    source_task = asyncio.create_task(track_metrics.timed(
+        "source_validation",
+        source_cache.validate_source(source_id=tracker_payload.source.id, allowed_bridges=allowed_bridges)
+    ))
+    session_task = asyncio.create_task(track_metrics.timed(
+        "session_loading",
+        storage.driver.session.load(tracker_payload.session.id)
+    ))
+    profile_loader = SpeculativeProfileLoader(
+        lambda id: track_metrics.timed("profile_loading", storage.driver.profile.load_merged_profile(id=id)),
+        profile_id=tracker_payload.profile.id
+        if not profile_less and isinstance(tracker_payload.profile, Entity) else None
+    )
+
+    try:
+        try:
+            source = await source_task
+        except ValueError as e:
+            raise UnauthorizedException(e)
+
+        _apply_source_options(tracker_payload, source)
+
+        # Load session from storage
+        session = await session_task  # type: Session
+
+        # Get profile
+        profile, session = await tracker_payload.get_profile_and_session(session,
+                                                                         profile_loader.load,
+                                                                         profile_less
+                                                                         )
+    finally:
+        if not session_task.done():
+            session_task.cancel()
+        profile_loader.discard()
 
     return await invoke_track_process(tracker_payload, source, profile_less, profile, session, ip)
 
 
+def _resolve_profile_id(profile_id: str, profiles: Dict[str, Profile]) -> str:
+    # Profiles merged into one profile are loaded as one shared object under each requested id.
+    profile = profiles.get(profile_id)
+    return profile.id if isinstance(profile, Profile) and profile.id is not None else profile_id
+
+
+def _group_payloads(tracker_payloads: List[TrackerPayload], sessions: Dict[str, Session],
+                    profiles: Dict[str, Profile]) -> List[List[int]]:
+    """
+    Groups payload positions so that payloads sharing a session or a profile end up in one group. Profiles are
+    compared by the id of the loaded (merged) profile, not by the requested id.
+    """
+    groups = {}  # type: Dict[int, List[int]]
+    group_of = {}  # type: Dict[str, int]
+
+    for position, tracker_payload in enumerate(tracker_payloads):
+        keys = [f"session:{tracker_payload.session.id}"]
+        session = sessions.get(tracker_payload.session.id)
+        if session is not None and session.profile is not None:
+            keys.append(f"profile:{_resolve_profile_id(session.profile.id, profiles)}")
+        elif tracker_payload.profile is not None and tracker_payload.profile.id is not None:
+            keys.append(f"profile:{_resolve_profile_id(tracker_payload.profile.id, profiles)}")
+
+        existing = sorted({group_of[key] for key in keys if key in group_of})
+        if not existing:
+            group = position
+            groups[group] = []
+        else:
+            # Join groups connected by this payload
+            group = existing[0]
+            for other in existing[1:]:
+                groups[group] += groups.pop(other)
+                for key, value in group_of.items():
+                    if value == other:
+                        group_of[key] = group
+
+        groups[group].append(position)
+        for key in keys:
+            group_of[key] = group
+
+    return [sorted(positions) for positions in groups.values()]
+
+
+def _get_group_profile_ids(tracker_payloads: List[TrackerPayload], positions: List[int],
+                           sessions: Dict[str, Session], profiles: Dict[str, Profile]) -> List[str]:
+    # Both requested and merged profile ids are locked. Single payload tracking locks the requested id.
+    profile_ids = set()
+    for position in positions:
+        tracker_payload = tracker_payloads[position]
+        requested_ids = []
+        if tracker_payload.profile is not None and tracker_payload.profile.id is not None:
+            requested_ids.append(tracker_payload.profile.id)
+        session = sessions.get(tracker_payload.session.id)
+        if session is not None and session.profile is not None:
+            requested_ids.append(session.profile.id)
+        for profile_id in requested_ids:
+            profile_ids.add(profile_id)
+            profile_ids.add(_resolve_profile_id(profile_id, profiles))
+    # Locks are always taken in the same order.
+    return sorted(profile_ids)
+
+
+async def track_events_batch(tracker_payloads: List[TrackerPayload], ip: str, profile_less: bool,
+                             allowed_bridges: List[str]) -> List[dict]:
+    """
+    Tracks many payloads in one call. Sources are validated once per source, sessions and profiles are loaded
+    with one multi-get each. Payloads of the same profile or session are processed one after another, other
+    payloads concurrently. With sync_profile_tracks the profiles of a group are locked the same way as
+    in synchronized_event_tracking. Writes of all payloads are merged into shared bulk requests.
+
+    Returns list of results in the order of payloads. Payload that failed gets {"error": message} as its result,
+    other payloads are tracked anyway.
+    """
+
+    source_ids = list({tracker_payload.source.id for tracker_payload in tracker_payloads})
+    try:
+        sources = await asyncio.gather(*[source_cache.validate_source(source_id=source_id,
+                                                                      allowed_bridges=allowed_bridges)
+                                         for source_id in source_ids])
+    except ValueError as e:
+        raise UnauthorizedException(e)
+    sources = dict(zip(source_ids, sources))
+
+    for tracker_payload in tracker_payloads:
+        _apply_source_options(tracker_payload, sources[tracker_payload.source.id])
+        _ensure_session(tracker_payload)
+
+    # Load all sessions at once
+
+    with track_metrics.stage("batch_session_loading"):
+        sessions = await storage.driver.session.load_by_ids(
+            list({tracker_payload.session.id for tracker_payload in tracker_payloads}))
+
+    # Load all profiles at once. Profile id is taken from session or payload.
+
+    profile_ids = set()
+    if profile_less is False:
+        for tracker_payload in tracker_payloads:
+            session = sessions.get(tracker_payload.session.id)
+            if session is not None:
+                if session.profile is not None:
+                    profile_ids.add(session.profile.id)
+            elif tracker_payload.profile is not None and tracker_payload.profile.id is not None:
+                profile_ids.add(tracker_payload.profile.id)
+
+    with track_metrics.stage("batch_profile_loading"):
+        profiles = await storage.driver.profile.load_merged_profiles(list(profile_ids))
+    # Profiles as loaded, before the payloads add new ones. Used for grouping and locking.
+    loaded_profiles = dict(profiles)
+
+    async def _load_merged_profile(id: str) -> Optional[Profile]:
+        if id in profiles or id in profile_ids:
+            return profiles.get(id)
+        return await storage.driver.profile.load_merged_profile(id=id)
+
+    results = [None] * len(tracker_payloads)
+
+    async def _track_payload(position: int, reload: bool):
+        tracker_payload = tracker_payloads[position]
+        if reload:
+            # Objects shared in the group may be left changed by the failed payload.
+            session = await storage.driver.session.load(tracker_payload.session.id)
+            load_merged_profile = storage.driver.profile.load_merged_profile
+        else:
+            session = sessions.get(tracker_payload.session.id)
+            load_merged_profile = _load_merged_profile
+
+        profile, session = await tracker_payload.get_profile_and_session(session, load_merged_profile, profile_less)
+
+        sessions[session.id] = session
+        if isinstance(profile, Profile):
+            profiles[profile.id] = profile
+
+        results[position] = await invoke_track_process(tracker_payload,
+                                                       sources[tracker_payload.source.id],
+                                                       profile_less,
+                                                       profile,
+                                                       session,
+                                                       ip,
+                                                       buffered=True)
+
+    async def _track_group(positions: List[int]):
+        # Payloads in a group share session and profile objects, so they must run in order.
+        reload = False
+        for position in positions:
+            try:
+                await _track_payload(position, reload)
+                reload = False
+            except Exception as e:
+                logger.error(f"Could not track payload {position} of the batch. Details: {repr(e)}")
+                results[position] = {"error": str(e)}
+                reload = True
+
+    async def _track_synchronized_group(positions: List[int]):
+        try:
+            async with AsyncExitStack() as stack:
+                for profile_id in _get_group_profile_ids(tracker_payloads, positions, sessions, loaded_profiles):
+                    await stack.enter_async_context(ProfileTracksSynchronizer(Entity(id=profile_id), wait=1))
+                await _track_group(positions)
+        except redis.exceptions.ConnectionError as e:
+            message = f"Could not connect to Redis server. Connection returned error {str(e)}"
+            for position in positions:
+                if results[position] is None:
+                    results[position] = {"error": message}
+
+    track_group = _track_synchronized_group if tracardi.sync_profile_tracks else _track_group
+    # Groups are made from the loaded profiles, so payloads of profiles merged into one profile run in one group.
+    groups = _group_payloads(tracker_payloads, sessions, loaded_profiles)
+    await asyncio.gather(*[track_group(positions) for positions in groups])
+
+    return results
+
+
 async def synchronized_event_tracking(tracker_payload: TrackerPayload, host: str, profile_less: bool,
                                       allowed_bridges: List[str]):
     if tracardi.sync_profile_tracks:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 from tracardi.domain.value_threshold import ValueThreshold
-from tracardi.service.storage.driver import storage
+from tracardi.service.storage.drivers.elastic import value_threshold as value_threshold_db
 
 
 class ValueThresholdManager:
@@ -34,14 +34,14 @@ class ValueThresholdManager:
         return True
 
     async def load_last_value(self) -> Optional[ValueThreshold]:
-        record = await storage.driver.value_threshold.load(self.id)
+        record = await value_threshold_db.load(self.id)
         if record is not None:
             return ValueThreshold.decode(record)
         return None
 
     async def delete(self):
-        result = await storage.driver.value_threshold.delete(self.id)
-        await storage.driver.value_threshold.refresh()
+        result = await value_threshold_db.delete(self.id)
+        await value_threshold_db.refresh()
         return result
 
     async def save_current_value(self, current_value):
@@ -54,6 +54,6 @@ class ValueThresholdManager:
             last_value=current_value,
         )
         record = value.encode()
-        result = await storage.driver.value_threshold.save(record)
-        await storage.driver.value_threshold.refresh()
+        result = await value_threshold_db.save(record)
+        await value_threshold_db.refresh()
         return result
@@ -0,0 +1,40 @@
+from copy import deepcopy
+from typing import Optional
+from uuid import uuid4
+
+from .execution_plan import ExecutionPlan
+from .flow import Flow
+from .graph_invoker import GraphInvoker
+from ..utils.dag_error import DagGraphError
+from ..utils.dag_processor import DagProcessor
+from ..utils.flow_graph_converter import FlowGraphConverter
+
+
+class CompiledFlow:
+
+    """
+    Flow with its execution plan already built. Nodes of the plan are templates that are never run. Each invocation
+    gets its own copies of nodes, so compiled flow can be shared by concurrently running flows.
+    """
+
+    def __init__(self, flow: Flow, content_hash: str = None):
+        self.flow = flow
+        self.content_hash = content_hash
+        # Version identifies nodes of this flow in the plugin pool.
+        self.version = content_hash if content_hash is not None else uuid4().hex
+        self.plan = None  # type: Optional[ExecutionPlan]
+
+        if flow.flowGraph:
+            converter = FlowGraphConverter(flow.flowGraph.dict())
+            dag = DagProcessor(converter.convert_to_dag_graph())
+
+            try:
+                self.plan = dag.make_execution_plan()
+            except DagGraphError as e:
+                raise DagGraphError("Flow `{}` returned the following error: `{}`".format(flow.id, str(e)))
+
+    def make_execution_dag(self, debug=False) -> GraphInvoker:
+        # Node init is copied because it is mutated when the action is built.
+        nodes = [node.copy(update={"init": deepcopy(node.init)}) for node in self.plan.nodes]
+        return GraphInvoker(graph=nodes, start_nodes=list(self.plan.start_nodes), plan=self.plan, debug=debug,
+                            version=self.version)
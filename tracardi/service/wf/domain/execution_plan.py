@@ -0,0 +1,58 @@
+import json
+from collections import defaultdict
+from typing import List, Tuple, Dict, Any
+
+from .edge import Edge
+from .node import Node
+
+_no_routes = ()
+
+
+class ExecutionPlan:
+
+    """
+    Execution plan of a flow version. Holds nodes in topological order, input routes and output routing
+    tables per node and parsed join reshape templates. Plan is built once and shared by all invocations
+    of the flow, so it must not be changed after it is built.
+    """
+
+    __slots__ = ("nodes", "start_nodes", "in_routes", "out_routes", "upstream_nodes", "_reshape_templates")
+
+    def __init__(self, nodes: List[Node], start_nodes: List[str]):
+        self.nodes = tuple(nodes)
+        self.start_nodes = tuple(start_nodes)
+        self.in_routes = {}  # type: Dict[str, Tuple[Tuple[str, Edge, str], ...]]
+        self.out_routes = {}  # type: Dict[str, Dict[str, Tuple[Edge, ...]]]
+        self.upstream_nodes = {}  # type: Dict[str, Tuple[str, ...]]
+        self._reshape_templates = {}  # type: Dict[Tuple[str, str, str], Any]
+
+        for node in nodes:
+            self.in_routes[node.id] = tuple(node.graph.in_edges)
+            self.upstream_nodes[node.id] = tuple(sorted({edge.source.node_id for _, edge, _ in node.graph.in_edges
+                                                         if edge.enabled is True}))
+
+            routes = defaultdict(list)
+            for start_port, edge, _ in node.graph.out_edges:
+                routes[start_port].append(edge)
+            self.out_routes[node.id] = {port: tuple(edges) for port, edges in routes.items()}
+
+    def get_enabled_in_routes(self, node_id: str) -> List[Tuple[str, Edge, str]]:
+        return [route for route in self.in_routes.get(node_id, _no_routes) if route[1].enabled is True]
+
+    def get_upstream_nodes(self, node_id: str) -> Tuple[str, ...]:
+        """
+        Returns ids of nodes connected to the node with enabled edges. Node can run when all of them finished.
+        """
+        return self.upstream_nodes.get(node_id, _no_routes)
+
+    def get_out_routes(self, node_id: str) -> Dict[str, Tuple[Edge, ...]]:
+        return self.out_routes.get(node_id, {})
+
+    def get_reshape_template(self, node_id: str, port: str, template: str):
+        """
+        Returns parsed reshape template. Template is parsed only once per flow version.
+        """
+        key = (node_id, port, template)
+        if key not in self._reshape_templates:
+            self._reshape_templates[key] = json.loads(template)
+        return self._reshape_templates[key]
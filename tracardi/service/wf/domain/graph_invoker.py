@@ -1,18 +1,20 @@
 import asyncio
+import heapq
 import importlib
 import inspect
-import json
 from collections import defaultdict
 
 from time import time
 from typing import List, Union, Tuple, Optional, Dict, AsyncIterable
 from pydantic import BaseModel
 
+from tracardi.config import tracardi
 from tracardi.domain.event import Event, EventSession
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.profile import Profile
 from tracardi.domain.session import Session
 from tracardi.process_engine.tql.condition import Condition
+from tracardi.service.plugin.plugin_pool import plugin_pool
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.domain.console import Console, Log, ConsoleStatus
 from tracardi.service.plugin.domain.result import Result, VoidResult, MissingResult
@@ -22,6 +24,7 @@ from .debug_call_info import Profiler
 from .debug_info import DebugInfo, DebugNodeInfo
 from .entity import Entity
 from .error_debug_info import ErrorDebugInfo
+from .execution_plan import ExecutionPlan
 from .input_params import InputParams
 from ..service.excetions import get_traceback
 from ..utils.dag_error import DagError, DagExecError
@@ -67,10 +70,34 @@ class InputEdges:
         return len(self.edges)
 
 
+class NodeRun:
+
+    """
+    Items yielded by run_node for one node. They are kept until the node run is processed in topological order.
+    """
+
+    def __init__(self):
+        self.items = []  # type: List[tuple]
+        self.error = None  # type: Optional[Exception]
+        self.skipped = False
+        self.start_time = time()
+        self.end_time = self.start_time
+
+
 class GraphInvoker(BaseModel):
     graph: List[Node]
     start_nodes: list
     debug: bool = False
+    plan: Optional[ExecutionPlan] = None
+    version: Optional[str] = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def get_plan(self) -> ExecutionPlan:
+        if self.plan is None:
+            self.plan = ExecutionPlan(self.graph, self.start_nodes)
+        return self.plan
 
     @staticmethod
     def _add_to_event_loop(tasks, coroutine, port, params, edge: Edge, active) -> list:
@@ -203,7 +230,7 @@ class GraphInvoker(BaseModel):
                     ) if session is not None else None
 
     async def run_node(self, node: Node, payload, ready_upstream_results: ActionsResults) -> AsyncIterable[Tuple[
-        Result, float, Optional[Profile], Optional[Session], ConsoleStatus, InputEdges]]:
+            Result, float, Optional[Profile], Optional[Session], ConsoleStatus, InputEdges]]:
 
         task_start_time = time()
 
@@ -211,6 +238,7 @@ class GraphInvoker(BaseModel):
             raise node.object
 
         tasks = []
+        plan = self.get_plan()
 
         if node.start:
 
@@ -223,11 +251,11 @@ class GraphInvoker(BaseModel):
             params = {"payload": payload}
             tasks = await self._run_in_event_loop(tasks, node, params, _port, _payload, in_edge=None)
 
-        elif node.graph.in_edges:
+        elif plan.in_routes.get(node.id):
 
             # Prepare value
 
-            for start_port, edge, end_port in node.graph.in_edges.get_enabled_edges():  # type: str, Edge, str
+            for start_port, edge, end_port in plan.get_enabled_in_routes(node.id):  # type: str, Edge, str
 
                 if not ready_upstream_results.has_edge_value(edge.id):
                     # This edge is dead. Dead edges are connected to nodes that return None instead of Result object.
@@ -254,12 +282,11 @@ class GraphInvoker(BaseModel):
 
                     else:
 
-                        upstream_result_copy = upstream_result.copy(deep=True)
-
                         # Do not trigger for None values
 
-                        params = {end_port: upstream_result_copy.value}
-                        if upstream_result_copy.value is not None:
+                        if upstream_result.value is not None:
+
+                            params = {end_port: ready_upstream_results.read_value(upstream_result)}
 
                             # Run spec with every downstream message (param)
                             # Runs as many times as downstream edges
@@ -288,6 +315,9 @@ class GraphInvoker(BaseModel):
                                                             active=False
                                                             )
 
+                # Results of the edge are read. Edge has no other downstream node.
+                ready_upstream_results.release(edge.id)
+
         # Yield async tasks results
 
         joined_output_results = defaultdict(dict)
@@ -389,7 +419,8 @@ class GraphInvoker(BaseModel):
                 # todo template per port
 
                 if node.object.join.has_reshape_templates():
-                    output = json.loads(node.object.join.get_reshape_template(out_port).template)
+                    output = plan.get_reshape_template(node.id, out_port,
+                                                       node.object.join.get_reshape_template(out_port).template)
                     if output:
                         dot = DotAccessor(node.object.profile, node.object.session,
                                           out_payload if isinstance(out_payload, dict) else None)
@@ -409,11 +440,15 @@ class GraphInvoker(BaseModel):
                       node.object.console.get_status(), \
                       input_edges
 
-    @staticmethod
-    def _add_results(task_results: ActionsResults, node: Node, result: Result) -> ActionsResults:
-        for _, edge, _ in node.graph.out_edges:
-            result_copy = result.copy(deep=True)
-            task_results.add(edge.id, result_copy)
+    def _add_results(self, task_results: ActionsResults, node: Node, result: Result) -> ActionsResults:
+        for start_port, edges in self.get_plan().get_out_routes(node.id).items():
+            for edge in edges:
+                if start_port == result.port:
+                    # Result is shared by all edges of the port. It is copied when the downstream node reads it.
+                    task_results.add(edge.id, result)
+                else:
+                    # Edge is alive but has no value on its port. Downstream node gets MissingResult.
+                    task_results.add_edge(edge.id)
         return task_results
 
     @staticmethod
@@ -441,6 +476,15 @@ class GraphInvoker(BaseModel):
 
         return task_class(**params)
 
+    def _get_pool_key(self, node: Node) -> Optional[tuple]:
+        # Only reusable plugins of compiled flows are pooled. In debug mode plugins are always built.
+        if self.version is None or self.debug is True:
+            return None
+        task_class = getattr(importlib.import_module(node.module), node.className, None)
+        if getattr(task_class, 'reusable', False) is not True:
+            return None
+        return self.version, node.id
+
     async def init(self, debug_info: DebugInfo, log_list: List[Log], flow, flow_history, event, session, profile,
                    tracker_payload: TrackerPayload,
                    ux: list):
@@ -450,7 +494,12 @@ class GraphInvoker(BaseModel):
         for node_number, node in enumerate(self.graph):
             # Init object
             try:
-                node.object = await self._get_object(self.debug, node, node.init)
+                pool_key = self._get_pool_key(node)
+                if pool_key is not None:
+                    node.object = await plugin_pool.acquire(
+                        pool_key, lambda: self._get_object(self.debug, node, node.init))
+                else:
+                    node.object = await self._get_object(self.debug, node, node.init)
                 node.object.node = node.copy(exclude={"object": ..., "className": ..., "module": ..., "init": ...})
                 node.object.debug = self.debug
                 node.object.event = event
@@ -499,7 +548,11 @@ class GraphInvoker(BaseModel):
         tasks = []
         for node in self.graph:
             if isinstance(node.object, ActionRunner):
-                task = asyncio.create_task(node.object.close())
+                pool_key = self._get_pool_key(node)
+                if pool_key is not None and node.object.reusable is True:
+                    task = asyncio.create_task(plugin_pool.release(pool_key, node.object))
+                else:
+                    task = asyncio.create_task(node.object.close())
                 tasks.append(task)
         await asyncio.gather(*tasks)
 
@@ -515,6 +568,171 @@ class GraphInvoker(BaseModel):
         """
         return event.metadata.debug is True or self.debug is True
 
+    @staticmethod
+    def _get_results(result, input_edges: InputEdges) -> List[Result]:
+        """
+        Returns results with values for downstream nodes. Raises error if node did not return Result
+        or tuple of Results.
+        """
+
+        if result is None:
+            # Result is None
+            return []
+        elif isinstance(result, Result):
+            return [result] if result.value is not None else []
+        elif isinstance(result, tuple):
+            results = []
+            for sub_result in result:  # type: Result
+                if sub_result is None:
+                    # This is None result
+                    pass
+                elif isinstance(sub_result, Result):
+                    if sub_result.value is not None:
+                        # Result is proper object
+                        results.append(sub_result)
+                else:
+                    _edge = input_edges.get_first_edge()
+                    raise DagError(
+                        "Action did not return Result or tuple of Results. Expected Result got {}".format(
+                            type(result)),
+                        port=_edge.port,
+                        input=_edge.params,
+                        edge=_edge.id
+                    )
+            return results
+
+        # result can be DagExecError this means that this node raised exception
+        if isinstance(result, DagExecError):
+            raise result
+
+        _edge = input_edges.get_first_edge()
+
+        raise DagError(
+            "Action did not return Result or tuple of Results. Expected Result got {}".format(
+                type(result)),
+            port=_edge.port,
+            input=_edge.params,
+            edge=_edge.id
+        )
+
+    async def _execute_node(self, node: Node, payload, actions_results: ActionsResults) -> NodeRun:
+        node_run = NodeRun()
+
+        # Skip debug nodes when not debugging
+        # Skip tasks that are marked to be skipped
+        if (not self.debug and node.debug) or node.block_flow is True:
+            node_run.skipped = True
+            return node_run
+
+        try:
+            async for item in self.run_node(node, payload, ready_upstream_results=actions_results):
+                node_run.items.append(item)
+
+                # Results are passed to downstream nodes as soon as they are returned.
+                result, *_, input_edges = item
+                for result in self._get_results(result, input_edges):
+                    self._add_results(actions_results, node, result)
+
+        except Exception as e:
+            node_run.error = e
+
+        finally:
+            node_run.end_time = time()
+
+        return node_run
+
+    async def _execute(self, payload, actions_results: ActionsResults) -> AsyncIterable[
+            Tuple[Node, NodeRun]]:
+        """
+        Runs every node as soon as all of its upstream nodes finished, so independent branches run concurrently.
+        Only nodes of concurrent plugins run at the same time. Other nodes may change profile or session, or
+        replace their references, so they run alone after all nodes before them in topological order, and
+        concurrent nodes start only after all such nodes before them finished. Profile and session are then changed
+        in the same order as if the nodes run one after another. At most tracardi.workflow_max_branches nodes run
+        at once.
+
+        Node runs are yielded in topological order. After a node fails no new nodes are started, nodes that are
+        already running are awaited and yielded, so their logs are kept.
+        """
+
+        plan = self.get_plan()
+        positions = {node.id: position for position, node in enumerate(self.graph)}
+        waiting = []  # type: List[int]
+        downstream = defaultdict(list)  # type: Dict[int, List[int]]
+        ready = []  # type: List[int]
+        barriers = []  # type: List[int]
+
+        for position, node in enumerate(self.graph):
+            upstream = [positions[node_id] for node_id in plan.get_upstream_nodes(node.id) if node_id in positions]
+            for upstream_position in upstream:
+                downstream[upstream_position].append(position)
+            waiting.append(len(upstream))
+            if not upstream:
+                heapq.heappush(ready, position)
+            if getattr(node.object, 'concurrent', False) is not True:
+                barriers.append(position)
+
+        max_branches = max(1, tracardi.workflow_max_branches)
+        running = {}  # type: Dict[asyncio.Task, int]
+        finished = {}  # type: Dict[int, NodeRun]
+        completed = set()
+        first_unfinished = 0  # All nodes before this position finished.
+        next_barrier = 0  # Index of the first barrier that did not finish.
+        failed = False
+        next_position = 0
+
+        def can_start(position: int) -> bool:
+            if next_barrier < len(barriers) and barriers[next_barrier] == position:
+                return first_unfinished == position
+            return next_barrier == len(barriers) or position < barriers[next_barrier]
+
+        try:
+            while True:
+
+                # Ready nodes are started in topological order. If the first one can not start, none of the next can.
+                while not failed and ready and len(running) < max_branches and can_start(ready[0]):
+                    position = heapq.heappop(ready)
+                    task = asyncio.create_task(
+                        self._execute_node(self.graph[position], payload, actions_results))
+                    running[task] = position
+
+                if next_position in finished:
+                    yield self.graph[next_position], finished.pop(next_position)
+                    next_position += 1
+                    continue
+
+                if not running:
+                    # After failure nodes that were not started leave gaps in the order.
+                    for position in sorted(finished):
+                        yield self.graph[position], finished.pop(position)
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    position = running.pop(task)
+                    node_run = task.result()
+                    finished[position] = node_run
+                    completed.add(position)
+
+                    if node_run.error is not None:
+                        failed = True
+                        continue
+
+                    for downstream_position in downstream[position]:
+                        waiting[downstream_position] -= 1
+                        if waiting[downstream_position] == 0:
+                            heapq.heappush(ready, downstream_position)
+
+                while first_unfinished in completed:
+                    first_unfinished += 1
+                while next_barrier < len(barriers) and barriers[next_barrier] in completed:
+                    next_barrier += 1
+
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
     async def run(self, payload, event: Event, profile: Profile, session: Session, debug_info: DebugInfo,
                   log_list: List[Log]) -> Tuple[
         DebugInfo, List[Log], Profile, Session]:
@@ -524,196 +742,167 @@ class GraphInvoker(BaseModel):
 
         sequence_number = 0
         execution_number = 0
-        for node in self.graph:  # type: Node
-            task_start_time = time()
-            sequence_number += 1
-            executed_node = False
-
-            node_debug_info = DebugNodeInfo(
-                id=node.id,
-                name=node.name,
-                sequenceNumber=sequence_number,
-                executionNumber=None,
-                errors=0,
-                warnings=0,
-                profiler=Profiler(
-                    startTime=task_start_time,
-                    endTime=task_start_time,
-                    runTime=task_start_time
-                ),
-            )
 
-            try:
+        # Node runs are processed in topological order, so debug info and logs are in the same order as if the nodes
+        # run one after another. See _execute for which nodes run concurrently.
 
-                # Skip debug nodes when not debugging
-                if not self.debug and node.debug:
-                    continue
+        node_runs = self._execute(payload, actions_results)
+        try:
+            async for node, node_run in node_runs:  # type: Node, NodeRun
+                task_start_time = node_run.start_time
+                sequence_number += 1
+                executed_node = False
 
-                # Skip tasks that are marked to be skipped
-                if node.block_flow is True:
-                    continue
+                node_debug_info = DebugNodeInfo(
+                    id=node.id,
+                    name=node.name,
+                    sequenceNumber=sequence_number,
+                    executionNumber=None,
+                    errors=0,
+                    warnings=0,
+                    profiler=Profiler(
+                        startTime=task_start_time,
+                        endTime=task_start_time,
+                        runTime=task_start_time
+                    ),
+                )
+
+                try:
+
+                    # Skipped debug node or node that is marked to be skipped
+                    if node_run.skipped:
+                        continue
 
-                async for result, \
-                          task_start_time, \
-                          _profile_reference_to_update, _session_reference_to_update, \
-                          node_console_status, input_edges in \
-                        self.run_node(node, payload, ready_upstream_results=actions_results):
-
-                    # If the profile or session changed during node execution change its reference in graph invoker
-
-                    if _profile_reference_to_update:
-                        profile = _profile_reference_to_update
-
-                    if _session_reference_to_update:
-                        session = _session_reference_to_update
-
-                    executed_node = input_edges.has_active_edges() | executed_node
-
-                    # Add information if ony of the input edge is active
-
-                    debug_info.add_debug_edge_info(input_edges)
-
-                    # Process result
-
-                    if result is None:
-                        # Result is None
-                        pass
-                    elif isinstance(result, Result):
-                        if result.value is not None:
-                            actions_results = self._add_results(actions_results, node, result)
-                    elif isinstance(result, tuple):
-                        for sub_result in result:  # type: Result
-                            if sub_result is None:
-                                # This is None result
-                                pass
-                            elif isinstance(sub_result, Result):
-                                if sub_result.value is not None:
-                                    # Result is proper object
-                                    actions_results = self._add_results(actions_results, node, sub_result)
-                            else:
-                                _edge = input_edges.get_first_edge()
-                                raise DagError(
-                                    "Action did not return Result or tuple of Results. Expected Result got {}".format(
-                                        type(result)),
-                                    port=_edge.port,
-                                    input=_edge.params,
-                                    edge=_edge.id
+                    for result, \
+                        task_start_time, \
+                        _profile_reference_to_update, _session_reference_to_update, \
+                        node_console_status, input_edges in node_run.items:
+
+                        # If the profile or session changed during node execution change its reference in graph invoker
+
+                        if _profile_reference_to_update:
+                            profile = _profile_reference_to_update
+
+                        if _session_reference_to_update:
+                            session = _session_reference_to_update
+
+                        executed_node = input_edges.has_active_edges() | executed_node
+
+                        # Add information if ony of the input edge is active
+
+                        debug_info.add_debug_edge_info(input_edges)
+
+                        # Process result. Results were already passed to downstream nodes, this raises errors.
+
+                        self._get_results(result, input_edges)
+
+                        if self.is_in_debug_mode(event):
+                            for input_edge_id, input_edge in input_edges.edges.items():  # type: str, InputEdge
+                                node_debug_info.append_call_info(
+                                    flow_start_time,
+                                    task_start_time,
+                                    node,
+                                    input_edge=Entity(id=input_edge_id) if input_edge_id is not None else None,
+                                    input_params=self._get_input_params(input_edge.port, input_edge.params),
+                                    output_edge=None,
+                                    output_params=[result] if isinstance(result, Result) else result,
+                                    active=input_edge.active,
+                                    errors=node_console_status.errors,
+                                    warnings=node_console_status.warnings
                                 )
-                    else:
-                        # result can be DagExecError this means that this node raised exception
-                        if isinstance(result, DagExecError):
-                            raise result
 
-                        _edge = input_edges.get_first_edge()
+                        if executed_node:
+                            for input_edge_id, _ in input_edges.edges.items():  # type: str, InputEdge
+                                log_list.append(
+                                    Log(
+                                        module=node.object.console.module,
+                                        class_name=node.object.console.class_name,
+                                        type='info',
+                                        message=f"Node `{node_debug_info.name}` edge {input_edge_id} "
+                                                f"executed without errors."
+                                    )
+                                )
+
+                    # Error raised by the node itself
+                    if node_run.error is not None:
+                        raise node_run.error
+
+                except (DagError, DagExecError) as e:
+
+                    error_log = Log(
+                        module=__name__,
+                        class_name='GraphInvoker',
+                        type='error',
+                        message=str(e)
+                    )
 
-                        raise DagError(
-                            "Action did not return Result or tuple of Results. Expected Result got {}".format(
-                                type(result)),
-                            port=_edge.port,
-                            input=_edge.params,
-                            edge=_edge.id
-                        )
+                    if isinstance(e, DagExecError):
+                        error_log.traceback = e.traceback
+                    elif isinstance(e, DagError):
+                        error_log.traceback = get_traceback(e)
+
+                    log_list.append(error_log)
 
                     if self.is_in_debug_mode(event):
-                        for input_edge_id, input_edge in input_edges.edges.items():  # type: str, InputEdge
+                        if e.input is not None and e.port is not None:
+
                             node_debug_info.append_call_info(
                                 flow_start_time,
                                 task_start_time,
                                 node,
-                                input_edge=Entity(id=input_edge_id) if input_edge_id is not None else None,
-                                input_params=self._get_input_params(input_edge.port, input_edge.params),
+                                input_edge=Entity(id=e.edge) if e.edge is not None else None,
+                                input_params=InputParams(port=e.port, value=e.input),
                                 output_edge=None,
-                                output_params=[result] if isinstance(result, Result) else result,
-                                active=input_edge.active,
-                                errors=node_console_status.errors,
-                                warnings=node_console_status.warnings
+                                output_params=None,
+                                active=True,
+                                error=str(e),
+                                errors=1,
+                                warnings=0
                             )
 
-                    if executed_node:
-                        for input_edge_id, _ in input_edges.edges.items():  # type: str, InputEdge
-                            log_list.append(
-                                Log(
-                                    module=node.object.console.module,
-                                    class_name=node.object.console.class_name,
-                                    type='info',
-                                    message=f"Node `{node_debug_info.name}` edge {input_edge_id} executed without errors."
-                                )
+                        else:
+
+                            node_debug_info.append_call_info(
+                                flow_start_time,
+                                task_start_time,
+                                node,
+                                input_edge=Entity(id=e.edge) if e.edge is not None else None,
+                                input_params=None,
+                                output_edge=None,
+                                output_params=None,
+                                active=True,
+                                error=str(e),
+                                errors=1,
+                                warnings=0
                             )
 
-            except (DagError, DagExecError) as e:
+                    # Workflow stops when there is an error. No nodes are started after the failed one. Nodes that
+                    # were already running are still logged.
 
-                error_log = Log(
-                    module=__name__,
-                    class_name='GraphInvoker',
-                    type='error',
-                    message=str(e)
-                )
+                finally:
+                    if self.is_in_debug_mode(event):
+                        node_debug_info.profiler.endTime = node_run.end_time - flow_start_time
+                        node_debug_info.profiler.runTime = node_run.end_time - flow_start_time - task_start_time
 
-                if isinstance(e, DagExecError):
-                    error_log.traceback = e.traceback
-                elif isinstance(e, DagError):
-                    error_log.traceback = get_traceback(e)
-
-                log_list.append(error_log)
-
-                if self.is_in_debug_mode(event):
-                    if e.input is not None and e.port is not None:
-
-                        node_debug_info.append_call_info(
-                            flow_start_time,
-                            task_start_time,
-                            node,
-                            input_edge=Entity(id=e.edge) if e.edge is not None else None,
-                            input_params=InputParams(port=e.port, value=e.input),
-                            output_edge=None,
-                            output_params=None,
-                            active=True,
-                            error=str(e),
-                            errors=1,
-                            warnings=0
-                        )
+                        # If node had call that means it was running
 
-                    else:
+                        if executed_node:
+                            execution_number += 1
+                            node_debug_info.executionNumber = execution_number
+                            # debug_info.nodes[node_debug_info.id] = node_debug_info
+                            debug_info.add_node_info(node_debug_info)
 
-                        node_debug_info.append_call_info(
-                            flow_start_time,
-                            task_start_time,
-                            node,
-                            input_edge=Entity(id=e.edge) if e.edge is not None else None,
-                            input_params=None,
-                            output_edge=None,
-                            output_params=None,
-                            active=True,
-                            error=str(e),
-                            errors=1,
-                            warnings=0
-                        )
-
-                # Stop workflow when there is an error
-                break
-
-            finally:
-                if self.is_in_debug_mode(event):
-                    node_debug_info.profiler.endTime = time() - flow_start_time
-                    node_debug_info.profiler.runTime = time() - flow_start_time - task_start_time
-
-                    # If node had call that means it was running
-
-                    if executed_node:
-                        execution_number += 1
-                        node_debug_info.executionNumber = execution_number
-                        # debug_info.nodes[node_debug_info.id] = node_debug_info
-                        debug_info.add_node_info(node_debug_info)
-
-                # Collect console logs set inside plugins
-                if isinstance(node.object, ActionRunner):
-                    for log in node.object.console.get_logs():  # type: Log
-                        log_list.append(log)
+                    # Collect console logs set inside plugins
+                    if isinstance(node.object, ActionRunner):
+                        for log in node.object.console.get_logs():  # type: Log
+                            log_list.append(log)
+        finally:
+            await node_runs.aclose()
 
         return debug_info, log_list, profile, session
 
     def serialize(self):
-        return self.dict()
+        return self.dict(exclude={'plan'})
 
     def get_node_by_id(self, node_id) -> Node:
         for node in self.graph:
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import List
 
 from tracardi.service.plugin.domain.result import Result, MissingResult
@@ -12,11 +13,16 @@ class ResultStorage(dict):
 
 class ActionsResults:
 
+    """
+    Results buffered on edges until the downstream node reads them. One result is stored per port and shared
+    by all edges of that port. Every read returns a deep copy of the value. Values are not copied on write,
+    nodes may change their input and the input may be owned by objects outside the flow.
+    """
+
     def __init__(self):
         self._results = {}
 
     def add(self, edge_id: str, result: Result):
-
         if edge_id not in self._results:
             self._results[edge_id] = {}
 
@@ -25,6 +31,10 @@ class ActionsResults:
 
         self._results[edge_id][result.port].append(result)
 
+    def add_edge(self, edge_id: str):
+        if edge_id not in self._results:
+            self._results[edge_id] = {}
+
     def get(self, edge_id, port) -> List[Result]:
 
         if not self.has_edge_value(edge_id):
@@ -38,6 +48,20 @@ class ActionsResults:
 
         return self._results[edge_id][port]
 
+    @staticmethod
+    def read_value(result: Result):
+        """
+        Returns copy of the result value. Value is always copied, it may be referenced by objects outside
+        the flow, e.g. profile traits returned by a node.
+        """
+        return deepcopy(result.value)
+
+    def release(self, edge_id: str):
+        """
+        Removes results of the edge. Edge has only one downstream node, so it is released when that node read it.
+        """
+        self._results.pop(edge_id, None)
+
     def copy(self):
         ts = ActionsResults()
         ts._results = self._results
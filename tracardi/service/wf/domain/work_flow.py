@@ -1,17 +1,16 @@
 from time import time
-from typing import Tuple, List
+from typing import Tuple, List, Union
 
 from tracardi.domain.entity import Entity
 from tracardi.domain.event import Event
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.profile import Profile
 from tracardi.domain.session import Session
+from .compiled_flow import CompiledFlow
 from .debug_info import DebugInfo, FlowDebugInfo
 from .flow import Flow
 from .flow_history import FlowHistory
 from ..utils.dag_error import DagGraphError
-from ..utils.dag_processor import DagProcessor
-from ..utils.flow_graph_converter import FlowGraphConverter
 from tracardi.service.plugin.domain.console import Log
 
 
@@ -21,13 +20,19 @@ class WorkFlow:
         self.tracker_payload = tracker_payload
         self.flow_history = flow_history
 
-    async def invoke(self, flow: Flow, event: Event, profile, session, ux: list, debug=False) -> Tuple[
+    async def invoke(self, flow: Union[Flow, CompiledFlow], event: Event, profile, session, ux: list, debug=False) -> Tuple[
         DebugInfo, List[Log], 'Event', 'Profile', 'Session']:
 
         """
-        Invokes workflow and returns DebugInfo and list of saved Logs.
+        Invokes workflow and returns DebugInfo and list of saved Logs. Flow can be already compiled.
         """
 
+        if isinstance(flow, CompiledFlow):
+            compiled_flow = flow
+            flow = compiled_flow.flow
+        else:
+            compiled_flow = None
+
         if event is None:
             raise DagGraphError(
                 "Flow `{}` has no context event defined.".format(
@@ -39,14 +44,10 @@ class WorkFlow:
         if self.flow_history.is_acyclic(flow.id):
 
             # Convert Editor graph to exec graph
-            converter = FlowGraphConverter(flow.flowGraph.dict())
-            dag_graph = converter.convert_to_dag_graph()
-            dag = DagProcessor(dag_graph)
-
-            try:
-                exec_dag = dag.make_execution_dag(debug=debug)
-            except DagGraphError as e:
-                raise DagGraphError("Flow `{}` returned the following error: `{}`".format(flow.id, str(e)))
+            if compiled_flow is None:
+                compiled_flow = CompiledFlow(flow)
+
+            exec_dag = compiled_flow.make_execution_dag(debug=debug)
 
             flow_start_time = time()
             debug_info = DebugInfo(
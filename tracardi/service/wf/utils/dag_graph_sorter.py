@@ -11,20 +11,27 @@ class DagGraphSorter:
         self.graph[u].append(v)
 
     def _topological_sort(self, v, visited, stack):
-        visited[v] = True
-
-        for i in self.graph[v]:
-            if not visited[i]:
-                self._topological_sort(i, visited, stack)
-
-        stack.insert(0, v)
+        # Iterative depth first search. Node is appended when all its descendants are appended.
+        visited.add(v)
+        path = [(v, iter(self.graph[v]))]
+        while path:
+            node, children = path[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    path.append((child, iter(self.graph[child])))
+                    break
+            else:
+                path.pop()
+                stack.append(node)
 
     def topological_sort(self):
-        visited = {node: False for node in self.V}
+        visited = set()
         stack = []
 
         for i in self.V:
-            if not visited[i]:
+            if i not in visited:
                 self._topological_sort(i, visited, stack)
 
+        stack.reverse()
         return stack
@@ -1,8 +1,10 @@
-from typing import List, Union, Tuple
+from collections import defaultdict
+from typing import List, Union, Tuple, Dict
 
 from .dag_error import DagError, DagGraphError
 from ..domain.edge import Edge
 from ..domain.edges import Edges
+from ..domain.execution_plan import ExecutionPlan
 from ..domain.graph_invoker import GraphInvoker
 from ..domain.dag_graph import DagGraph
 from ..domain.node import Node
@@ -19,17 +21,23 @@ class DagProcessor:
             self._edges[edge.__hash__()] = edge
 
         self._edges.validate(self._nodes)
+
+        # Adjacency lists
+        self._out_edges = defaultdict(list)  # type: Dict[str, List[Edge]]
+        self._in_edges = defaultdict(list)  # type: Dict[str, List[Edge]]
+        for _, edge in self._edges.items():  # type: str, Edge
+            self._out_edges[edge.source.node_id].append(edge)
+            self._in_edges[edge.target.node_id].append(edge)
+
         self._last_nodes = set()
 
     def _find_out_edges(self, node: Node) -> List[Tuple[str, Edge]]:
-        for _, edge in self._edges.items():  # type: str, Edge
-            if node.id == edge.source.node_id:
-                yield edge.source.param, edge
+        for edge in self._out_edges.get(node.id, []):  # type: Edge
+            yield edge.source.param, edge
 
     def _find_in_edges(self, node) -> List[Tuple[str, Edge]]:
-        for _, edge in self._edges.items():  # type: str, Edge
-            if node.id == edge.target.node_id:
-                yield edge.target.param, edge
+        for edge in self._in_edges.get(node.id, []):  # type: Edge
+            yield edge.target.param, edge
 
     def _find_node(self, node_id) -> Node:
         return self._nodes[node_id] if node_id in self._nodes else None
@@ -40,8 +48,16 @@ class DagProcessor:
                 yield node
 
     def _forward_pass(self, start_node_ids):
-        for start_node_id in start_node_ids:
-            node = self._find_node(start_node_id)  # type: Node
+        # Every node is visited once.
+        visited = set()
+        to_visit = list(start_node_ids)
+        while to_visit:
+            node_id = to_visit.pop()
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+
+            node = self._find_node(node_id)  # type: Node
             if node:
 
                 # Get edges
@@ -53,25 +69,32 @@ class DagProcessor:
 
                             node.graph.out_edges.add(edge)
 
-                            self._forward_pass([edge.target.node_id])
+                            to_visit.append(edge.target.node_id)
                 else:
                     self._last_nodes.add(node.id)
             else:
-                self._last_nodes.add(start_node_id)
+                self._last_nodes.add(node_id)
 
         return self._last_nodes
 
     def _back_pass(self, last_node_ids):
-        for last_node_id in last_node_ids:
-            node = self._find_node(last_node_id)
+        visited = set()
+        to_visit = list(last_node_ids)
+        while to_visit:
+            node_id = to_visit.pop()
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+
+            node = self._find_node(node_id)
             if node:
                 for edge_end_port, edge in self._find_in_edges(node):  # type: str, Edge
 
                     node.graph.in_edges.add(edge)
 
-                    self._back_pass([edge.source.node_id])
+                    to_visit.append(edge.source.node_id)
 
-    def make_execution_dag(self, debug=False) -> GraphInvoker:
+    def make_execution_plan(self) -> ExecutionPlan:
         self._last_nodes = set()
         # Find first nodes
         start_nodes = self._find_start_nodes()
@@ -86,12 +109,15 @@ class DagProcessor:
         self._back_pass(self._last_nodes)
 
         # Sort graph
-        nodes = set(self._nodes.keys())
-        graph = DagGraphSorter(nodes)
+        graph = DagGraphSorter(self._nodes.keys())
         for _, edge in self._edges.items():  # type: Edge
             graph.add_edge(edge.source.node_id, edge.target.node_id)
 
         sorted = graph.topological_sort()
         sorted_nodes = [self._nodes[s] for s in sorted if s in self._nodes]
 
-        return GraphInvoker(graph=sorted_nodes, start_nodes=start_node_ids, debug=debug)
+        return ExecutionPlan(nodes=sorted_nodes, start_nodes=start_node_ids)
+
+    def make_execution_dag(self, debug=False) -> GraphInvoker:
+        plan = self.make_execution_plan()
+        return GraphInvoker(graph=list(plan.nodes), start_nodes=list(plan.start_nodes), plan=plan, debug=debug)
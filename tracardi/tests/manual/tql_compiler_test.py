@@ -0,0 +1,118 @@
+from timeit import timeit
+
+from tracardi.service.notation.dot_accessor import DotAccessor
+from tracardi.process_engine.tql.compiler import ExprCompiler
+from tracardi.process_engine.tql.parser import Parser
+from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransformer
+
+
+def _run(function):
+    try:
+        return "value", function()
+    except Exception as e:
+        # Transformer wraps errors in VisitError, compiled expression raises them as they are.
+        e = getattr(e, 'orig_exc', e)
+        return "error", type(e)
+
+
+def _same(value1, value2):
+    return value1 == value2 or repr(value1) == repr(value2)
+
+
+if __name__ == "__main__":
+
+    conditions = [
+        'payload@a.b == 1',
+        'payload@a.b != 1',
+        'payload@a.b > 0 and payload@a.b < 2',
+        'payload@a.b >= 1 or payload@a.x <= 1',
+        'payload@a.b => 1 and payload@a.b =< 1',
+        'payload@a.e == "test"',
+        'payload@a.c == [1,2,3]',
+        'payload@a.c == 2',
+        'payload@a.g == true',
+        'payload@a.h == null',
+        'payload@a.h is null',
+        'payload@a.e is not null',
+        'payload@a.missing == 1',
+        'payload@a.missing != 1',
+        'payload@a.missing > 1',
+        'payload@a.b exists',
+        'payload@a.missing exists',
+        'payload@a.missing not exists',
+        'payload@a.e empty',
+        'payload@a.empty empty',
+        'payload@a.missing not empty',
+        'lowercase(payload@a.e) not empty',
+        'payload@a.b between 0 and 2',
+        'payload@a.b == payload@a.f',
+        'payload@a.b != payload@a.n',
+        'datetime(payload@a.i) between datetime("2020-01-01") and datetime("2022-01-01")',
+        'datetime(payload@a.i) > datetime("2021-01-01")',
+        'datetime(payload@a.i) < now()',
+        'datetime(payload@a.i) > now.offset("-1d")',
+        'uppercase(payload@a.e) == "TEST"',
+        'lowercase(payload@a.u) == "test"',
+        'payload@a.b == 1 and (payload@a.e == "test" or payload@a.g == false)',
+        '(payload@a.b == 1 or payload@a.b == 2) and (payload@a.e == "x" or payload@a.e == "test")',
+        'payload@a.b == 1 and payload@a.b == 1 and payload@a.b == 1',
+        'payload@a.e == datetime("bad date")',
+        'payload@a.e == function("test", 1)',
+        'profile@id == "1" or event@type == "page"',
+        'payload@a.d.aa == 1',
+        'payload@a.e.x == 1',
+    ]
+
+    samples = [
+        {
+            "n": 1,
+            "a": {
+                "b": 1,
+                "c": [1, 2, 3],
+                "d": {"aa": 1},
+                "e": "test",
+                'f': 1,
+                'g': True,
+                'h': None,
+                'i': "2021-01-10",
+                'u': "TEST",
+                'empty': ""
+            }
+        },
+        {
+            "a": {
+                "b": 2,
+                "c": [],
+                "e": "",
+                'g': False,
+                'i': "2023-05-01",
+            }
+        },
+        {}
+    ]
+
+    parser = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+    compiler = ExprCompiler()
+
+    errors = 0
+    for condition in conditions:
+        tree = parser.parse(condition)
+        expr = compiler.compile(tree)
+        for sample in samples:
+            dot = DotAccessor(payload=sample, profile={"id": "1"}, event={"type": "page"})
+            expected = _run(lambda: ExprTransformer(dot=dot).transform(tree))
+            result = _run(lambda: expr(dot))
+            if not _same(expected, result):
+                errors += 1
+                print("DIFFERENT", condition, sample, expected, result)
+
+    print(f"{len(conditions) * len(samples)} evaluations, {errors} differences")
+
+    condition = 'payload@a.b == 1 and (payload@a.e == "test" or datetime(payload@a.i) > datetime("2020-01-01"))'
+    tree = parser.parse(condition)
+    expr = compiler.compile(tree)
+    dot = DotAccessor(payload=samples[0])
+    transformer_time = timeit(lambda: ExprTransformer(dot=dot).transform(tree), number=1000)
+    compiled_time = timeit(lambda: expr(dot), number=1000)
+    print(f"Transformer: {transformer_time:.4f}s, compiled: {compiled_time:.4f}s, "
+          f"speedup: {transformer_time / compiled_time:.1f}x")